@@ -0,0 +1,28 @@
+"""JSON (de)serialization with an optional orjson backend.
+
+orjson is several times faster than the stdlib on large JSONL session logs.
+It is used when installed (``pip install agent-sessions[fast]``); otherwise
+everything falls back to :mod:`json`. Decode errors are always instances of
+``json.JSONDecodeError`` so callers can keep catching that.
+"""
+
+import importlib.util
+import json
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+if HAS_ORJSON:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+else:
+    loads = json.loads
+
+    def dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2 if indent else None).encode()
@@ -1,10 +1,14 @@
 """Agent Sessions Browser TUI Application."""
 
+import bisect
 import logging
 import os
 import subprocess
-from datetime import datetime
-from queue import Queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -22,54 +26,25 @@ from .models import Session
 from .providers import get_available_providers, get_provider
 from .search import search_sessions
 from .ui import (
-    APP_CSS,
+    PagedListView,
     ParentSessionItem,
     SessionDetailPanel,
     SubagentSessionItem,
 )
 
 
-# Additional CSS for filter bar
-FILTER_CSS = """
-#filter-bar {
-    height: 1;
-    padding: 0 1;
-    background: $surface;
-}
+# Concurrent summary API requests in the background summary worker
+SUMMARY_WORKERS = 8
 
-#filter-bar.hidden {
-    display: none;
-}
-
-#loading-container {
-    width: 100%;
-    height: 100%;
-    align: center middle;
-    display: none;
-}
-
-#loading-container.visible {
-    display: block;
-}
-
-#loading-status {
-    text-align: center;
-    width: 100%;
-    padding: 1;
-    color: $text-muted;
-}
-
-#loading-indicator {
-    width: 100%;
-    height: 3;
-}
-"""
+# Seconds between parent highlights below which the detail update is deferred
+HIGHLIGHT_DEBOUNCE = 0.05
 
 
 class AgentSessionsBrowser(App):
     """TUI for browsing AI coding sessions with split parent/sub-agent panes."""
 
-    CSS = APP_CSS + FILTER_CSS
+    # Read and parsed by Textual at startup instead of being assembled at import
+    CSS_PATH = "ui/styles.tcss"
 
     BINDINGS = [
         Binding("q", "quit", "Quit"),
@@ -118,6 +93,7 @@ class AgentSessionsBrowser(App):
         self.all_sessions: list[Session] = []
         self.parent_sessions: list[Session] = []
         self.child_sessions: list[Session] = []
+        self._parent_by_id: dict[str, Session] = {}
         self.current_children: list[Session] = []
         self.selected_session: Optional[Session] = None
         self.focus_pane = "parent"
@@ -125,6 +101,7 @@ class AgentSessionsBrowser(App):
         self._children_cache: dict[str, list[Session]] = {}
         self._children_by_parent_id: dict[str, list[Session]] = {}
         self._children_by_key: dict[tuple[str, str], list[Session]] = {}
+        self._children_by_key_time: dict[tuple[str, str], tuple[list[float], list[Session]]] = {}
         self._child_parent_by_id: dict[str, str] = {}
 
         # Search state
@@ -136,12 +113,23 @@ class AgentSessionsBrowser(App):
         self._filtered_parents: list[Session] = []
         self._search_matching_children: list[Session] = []
         self._search_sort_order: str = "relevance"  # "relevance" | "newest" | "oldest"
+        self._pre_search_session: Optional[Session] = None  # cursor to restore on clear
+
+        self._pbcopy_proc: Optional[subprocess.Popen] = None  # last clipboard copy
+
+        # Pending detail update while highlights are arriving quickly
+        self._highlight_timer = None
+        self._last_highlight = 0.0
+        self._subagents_shown_for: Optional[tuple[str, bool]] = None
 
         # Annotation input mode
         self._annotation_mode: str | None = None
 
         # Summary generation state
-        self._summary_queue: Queue = Queue()
+        # Pending ids are ordered so the sessions in view can jump the queue
+        self._summary_pending: deque[str] = deque()
+        self._summary_inflight: set[str] = set()
+        self._summary_lock = threading.Lock()
         self._summary_generating = False
 
         # Database and indexing
@@ -156,10 +144,10 @@ class AgentSessionsBrowser(App):
                 yield Input(placeholder="Search sessions... (Enter to search, Escape to cancel)", id="search-input")
                 with Vertical(id="parent-container"):
                     yield Static("[bold]Sessions[/] [dim](newest first)[/]", id="parent-header", classes="list-header")
-                    yield ListView(id="parent-list")
+                    yield PagedListView(id="parent-list")
                 with Vertical(id="subagent-container"):
                     yield Static("[bold]Sub-agents[/] [dim](for selected session)[/]", id="subagent-header", classes="list-header")
-                    yield ListView(id="subagent-list")
+                    yield PagedListView(id="subagent-list")
             with Vertical(id="detail-container"):
                 with Vertical(id="loading-container"):
                     yield LoadingIndicator(id="loading-indicator")
@@ -190,30 +178,53 @@ class AgentSessionsBrowser(App):
 
     @work(thread=True)
     def _load_sessions_background(self):
-        """Auto-index new/changed sessions, then load from DB."""
+        """Load what the DB already has, then auto-index new/changed sessions."""
+        # Show the indexed sessions first so startup doesn't wait on the scan
+        self.call_from_thread(self._set_loading_status, "Loading sessions...")
+        sessions = self._read_sessions()
+        shown = bool(sessions)
+        if shown:
+            self.call_from_thread(self._on_sessions_loaded, sessions)
+
+        indexed = 0
         try:
-            self.call_from_thread(self._set_loading_status, "Checking for new sessions...")
+            if not shown:
+                self.call_from_thread(self._set_loading_status, "Checking for new sessions...")
             stats = self.indexer.incremental_update(max_age_hours=48)
-            if stats["sessions_indexed"] > 0:
+            indexed = stats["sessions_indexed"]
+            if indexed > 0 and not shown:
                 self.call_from_thread(
                     self._set_loading_status,
-                    f"Indexed {stats['sessions_indexed']} new sessions, loading..."
+                    f"Indexed {indexed} new sessions, loading..."
                 )
-            else:
-                self.call_from_thread(self._set_loading_status, "Loading sessions...")
-        except Exception:
-            self.call_from_thread(self._set_loading_status, "Loading sessions...")
-        self._load_sessions()
+        except Exception as e:
+            self.log.error(f"Indexing failed: {e}")
+            self.call_from_thread(self.notify, f"Indexing failed: {e}", severity="error")
+
+        if indexed > 0 or not shown:
+            self.call_from_thread(self._on_sessions_loaded, self._read_sessions())
         MetadataCache().save()
-        self.call_from_thread(self._on_sessions_loaded)
 
-    def _on_sessions_loaded(self):
-        """Called when background session loading completes."""
+    def _on_sessions_loaded(self, sessions: list[Session]):
+        """Show freshly read sessions (called on the main thread)."""
+        self.all_sessions = sessions
+        self._apply_harness_filter()
+
         # Hide loading, show detail panel
         self.query_one("#loading-container").remove_class("visible")
-        self.query_one("#detail-panel").display = True
+        detail_panel = self.query_one("#detail-panel", SessionDetailPanel)
+        detail_panel.display = True
+        # A reindex may have synced annotations edited outside the app
+        detail_panel.forget_annotations()
 
         self._update_filter_bar()
+
+        if self._search_mode:
+            # Keep showing results, now scored against the reloaded sessions
+            self._run_search_in_background(self._search_query)
+            self._start_summary_generation()
+            return
+
         self._populate_parent_list()
 
         parent_list = self.query_one("#parent-list", ListView)
@@ -227,7 +238,8 @@ class AgentSessionsBrowser(App):
                 text.append(f"  {provider.icon} {provider.display_name}: {provider.get_sessions_dir()}\n")
             detail.update(text)
         else:
-            parent_list.index = 0
+            # Keep the cursor on the selected session when a reload still shows it
+            self._restore_parent_cursor(self.selected_session)
             parent_list.focus()
             self._start_summary_generation()
 
@@ -263,25 +275,27 @@ class AgentSessionsBrowser(App):
 
         filter_bar.update(text)
 
-    def _load_sessions(self):
-        """Load sessions from database."""
+    def _read_sessions(self) -> list[Session]:
+        """Read sessions from the database, filtered and sorted.
+
+        Runs on worker threads, so it only builds the list; _on_sessions_loaded
+        installs it on the main thread.
+        """
         # Load from database (includes summaries from DB summaries table via JOIN)
-        self.all_sessions = self.db.get_all_sessions()
+        sessions = self.db.get_all_sessions()
 
         # Migrate summaries from old JSON cache into DB for sessions missing them
-        self._migrate_json_summaries()
+        self._migrate_json_summaries(sessions)
 
         # Apply project filter
         if self.project_filter:
-            self.all_sessions = [s for s in self.all_sessions if self.project_filter.lower() in s.project_name.lower()]
+            sessions = [s for s in sessions if self.project_filter.lower() in s.project_name.lower()]
 
         # Sort by modified time
-        self.all_sessions.sort(key=lambda s: s.modified_time or s.created_time, reverse=True)
+        sessions.sort(key=lambda s: s.modified_time or s.created_time, reverse=True)
+        return sessions
 
-        # Apply harness filter and separate parents/children
-        self._apply_harness_filter()
-
-    def _migrate_json_summaries(self):
+    def _migrate_json_summaries(self, sessions: list[Session]):
         """Migrate summaries from old JSON cache files into the DB summaries table.
 
         Checks both old (~/.factory/session-summaries.json) and new
@@ -291,8 +305,8 @@ class AgentSessionsBrowser(App):
         import time as _time
         from pathlib import Path
 
-        session_ids = {s.id for s in self.all_sessions}
-        sessions_by_id = {s.id: s for s in self.all_sessions}
+        session_ids = {s.id for s in sessions}
+        sessions_by_id = {s.id: s for s in sessions}
         migrated = 0
 
         cache_paths = [
@@ -341,8 +355,10 @@ class AgentSessionsBrowser(App):
 
         self.parent_sessions = [s for s in filtered if not s.is_child]
         self.child_sessions = [s for s in filtered if s.is_child]
+        self._parent_by_id = {s.id: s for s in self.parent_sessions}
 
         # Rebuild child indexes and clear per-parent caches when filter changes.
+        self._subagents_shown_for = None
         self._children_cache = {}
         self._children_by_parent_id = {}
         self._children_by_key = {}
@@ -362,25 +378,37 @@ class AgentSessionsBrowser(App):
         for children in self._children_by_key.values():
             children.sort(key=lambda s: s.created_time or s.modified_time or datetime.min)
 
+        # Same groups ordered by the time used for proximity matching
+        self._children_by_key_time = {}
+        for key, children in self._children_by_key.items():
+            timed = sorted(
+                ((child_time.timestamp(), child) for child in children
+                 if (child_time := child.modified_time or child.created_time)),
+                key=lambda entry: entry[0],
+            )
+            self._children_by_key_time[key] = ([t for t, _ in timed], [c for _, c in timed])
+
     def _populate_parent_list(self):
         """Populate the parent list with sessions."""
-        parent_list = self.query_one("#parent-list", ListView)
+        parent_list = self.query_one("#parent-list", PagedListView)
 
         # Limit displayed items for performance (can scroll to load more)
         MAX_DISPLAY = 500
         sessions_to_show = self.parent_sessions[:MAX_DISPLAY]
 
-        # Pre-compute child counts for display
-        # Use fast heuristic matching (same as _get_related_children)
-        child_counts = self._compute_child_counts(sessions_to_show)
+        # Items (and their child counts) are built a page at a time as the list scrolls
+        with self.batch_update():
+            parent_list.set_items(self._parent_items(sessions_to_show))
 
-        # Batch mount all items at once for performance
-        parent_list.clear()
-        items = [
-            ParentSessionItem(session, child_count=child_counts.get(session.id, 0))
-            for session in sessions_to_show
-        ]
-        parent_list.mount(*items)
+    def _parent_items(self, sessions: list[Session]):
+        """Yield ParentSessionItems, computing child counts one page at a time."""
+        page_size = PagedListView.PAGE_SIZE
+        for start in range(0, len(sessions), page_size):
+            page = sessions[start:start + page_size]
+            # Use fast heuristic matching (same as _get_related_children)
+            child_counts = self._compute_child_counts(page)
+            for session in page:
+                yield ParentSessionItem(session, child_count=child_counts.get(session.id, 0))
 
     def _compute_child_counts(self, parents: list[Session]) -> dict[str, int]:
         """Pre-compute child counts for a list of parent sessions.
@@ -389,52 +417,12 @@ class AgentSessionsBrowser(App):
         matching by project_path and time proximity.
         Returns dict mapping parent session ID to child count.
         """
-        from datetime import datetime, timedelta
-
         counts: dict[str, int] = {}
-
         for parent in parents:
             if parent.is_child or not parent.modified_time:
                 counts[parent.id] = 0
-                continue
-
-            # Check cache first
-            if parent.id in self._children_cache:
-                counts[parent.id] = len(self._children_cache[parent.id])
-                continue
-
-            explicit_children = self._children_by_parent_id.get(parent.id)
-            if explicit_children:
-                self._children_cache[parent.id] = explicit_children
-                counts[parent.id] = len(explicit_children)
-                continue
-
-            # Look up children by same harness and project
-            key = (parent.harness, str(parent.project_path))
-            potential_children = self._children_by_key.get(key, [])
-
-            if not potential_children:
-                counts[parent.id] = 0
-                continue
-
-            # Time window varies by harness
-            if parent.harness == "opencode":
-                time_window = timedelta(hours=24)
             else:
-                time_window = timedelta(hours=2)
-
-            # Count children within time window
-            related = []
-            for child in potential_children:
-                child_time = child.modified_time or child.created_time
-                if child_time and abs((child_time - parent.modified_time).total_seconds()) < time_window.total_seconds():
-                    related.append(child)
-
-            # Cache the result
-            related.sort(key=lambda s: s.created_time or s.modified_time)
-            self._children_cache[parent.id] = related
-            counts[parent.id] = len(related)
-
+                counts[parent.id] = len(self._get_related_children(parent))
         return counts
 
     def _get_related_children(self, parent: Session) -> list[Session]:
@@ -444,8 +432,6 @@ class AgentSessionsBrowser(App):
         Time window varies by harness (OpenCode uses 24h, others use 2h).
         """
         if parent.id not in self._children_cache:
-            from datetime import datetime, timedelta
-
             explicit_children = self._children_by_parent_id.get(parent.id)
             if explicit_children:
                 self._children_cache[parent.id] = explicit_children
@@ -455,16 +441,16 @@ class AgentSessionsBrowser(App):
             if parent.modified_time:
                 # OpenCode sub-agents run throughout a workday, need longer window
                 if parent.harness == "opencode":
-                    time_window = timedelta(hours=24)
+                    time_window = timedelta(hours=24).total_seconds()
                 else:
-                    time_window = timedelta(hours=2)
+                    time_window = timedelta(hours=2).total_seconds()
 
-                key = (parent.harness, str(parent.project_path))
-                for child in self._children_by_key.get(key, []):
-                    # Check time proximity
-                    child_time = child.modified_time or child.created_time
-                    if child_time and abs((child_time - parent.modified_time).total_seconds()) < time_window.total_seconds():
-                        related.append(child)
+                # Children of this harness/project sorted by time: bisect the window
+                times, children = self._children_by_key_time.get((parent.harness, str(parent.project_path)), ((), ()))
+                parent_ts = parent.modified_time.timestamp()
+                lo = bisect.bisect_right(times, parent_ts - time_window)
+                hi = bisect.bisect_left(times, parent_ts + time_window)
+                related = list(children[lo:hi])
 
             # Sort by time
             related.sort(key=lambda s: s.created_time or s.modified_time)
@@ -523,25 +509,53 @@ class AgentSessionsBrowser(App):
         if not HAS_OPENAI:
             return
 
-        sessions_needing_summary = [
-            s for s in self.parent_sessions
-            if not s.is_child and s.first_prompt and not s.summary
-        ]
+        with self._summary_lock:
+            queued = self._summary_inflight.union(self._summary_pending)
+            self._summary_pending.extend(
+                s.id for s in self.parent_sessions
+                if not s.is_child and s.first_prompt and not s.summary and s.id not in queued
+            )
+            # A running worker picks the new ids up itself
+            if not self._summary_pending or self._summary_generating:
+                return
+            self._summary_generating = True
 
-        if not sessions_needing_summary:
-            return
+        self._prioritize_visible_summaries()
+        self._generate_summaries_background()
 
-        for session in sessions_needing_summary:
-            self._summary_queue.put(session.id)
+    def _prioritize_visible_summaries(self):
+        """Move sessions currently on screen to the front of the summary queue."""
+        if not self._summary_pending:
+            return
+        parent_list = self.query_one("#parent-list", ListView)
+        top = int(parent_list.scroll_y)
+        visible = [
+            item.session.id
+            for item in parent_list.children[top:top + max(parent_list.size.height, 1)]
+            if isinstance(item, ParentSessionItem) and not item.session.summary
+        ]
+        with self._summary_lock:
+            for session_id in reversed(visible):
+                try:
+                    self._summary_pending.remove(session_id)
+                except ValueError:
+                    continue
+                self._summary_pending.appendleft(session_id)
 
-        self._generate_summaries_background()
+    def _next_summary_id(self) -> Optional[str]:
+        """Pop the next queued session id and mark it in flight."""
+        with self._summary_lock:
+            if not self._summary_pending:
+                return None
+            session_id = self._summary_pending.popleft()
+            self._summary_inflight.add(session_id)
+            return session_id
 
     @work(thread=True)
     def _generate_summaries_background(self):
         """Background worker to generate summaries using providers for message data."""
         import os
         import time
-        self._summary_generating = True
         generated_count = 0
         first_error_shown = False
 
@@ -549,40 +563,15 @@ class AgentSessionsBrowser(App):
             self.call_from_thread(
                 self.notify, "OPENAI_API_KEY not set - summaries disabled", severity="warning", timeout=3
             )
-            self._summary_generating = False
+            with self._summary_lock:
+                self._summary_pending.clear()
+                self._summary_generating = False
             return
 
-        while not self._summary_queue.empty():
-            try:
-                session_id = self._summary_queue.get_nowait()
-            except Exception:
-                break
-
-            session = next((s for s in self.parent_sessions if s.id == session_id), None)
-            if not session or session.summary:
-                continue
-
-            # Get full transcript from provider
-            provider = get_provider(session.harness)
-            messages = []
-            if provider:
-                try:
-                    messages = provider.get_session_messages(session)
-                except Exception:
-                    pass
-            # Fallback: build minimal transcript from DB data
-            if not messages:
-                db_msgs = self.db.get_session_messages(session_id)
-                messages = [{"role": m.role, "content": m.content} for m in db_msgs if m.content]
-            # Last resort: use first_prompt + last_response fields
-            if not messages and session.first_prompt:
-                messages = [{"role": "user", "content": session.first_prompt}]
-                if session.last_response:
-                    messages.append({"role": "assistant", "content": session.last_response})
-            if not any(m.get("role") == "assistant" and m.get("content") for m in messages):
-                continue
-
-            summary = generate_summary_sync(messages)
+        def finish(future, session: Session):
+            nonlocal generated_count, first_error_shown
+            self._summary_inflight.discard(session.id)
+            summary = future.result()
             if summary:
                 session.summary = summary
                 self.db.upsert_summary(
@@ -593,7 +582,7 @@ class AgentSessionsBrowser(App):
                     created_at=int(time.time()),
                 )
                 generated_count += 1
-                self.call_from_thread(self._refresh_session_item, session_id)
+                self.call_from_thread(self._refresh_session_item, session.id)
             elif not first_error_shown:
                 first_error_shown = True
                 err = getattr(generate_summary_sync, '_last_error', 'unknown')
@@ -601,7 +590,57 @@ class AgentSessionsBrowser(App):
                     self.notify, f"Summary failed: {err[:120]}", severity="error", timeout=3
                 )
 
-        self._summary_generating = False
+        # Transcripts are gathered here (the DB connection stays on this thread);
+        # the API requests run SUMMARY_WORKERS at a time. Ids are taken one at a
+        # time so a highlight re-prioritizing the queue takes effect right away.
+        pending: dict = {}
+        with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as pool:
+            while True:
+                session_id = self._next_summary_id()
+                if session_id is None:
+                    if not pending:
+                        with self._summary_lock:
+                            if not self._summary_pending:
+                                self._summary_generating = False
+                                break
+                        continue
+                    # Nothing queued: wait on in-flight requests, then look again
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(future, pending.pop(future))
+                    continue
+
+                session = self._parent_by_id.get(session_id)
+                if not session or session.summary:
+                    self._summary_inflight.discard(session_id)
+                    continue
+
+                # Get full transcript from provider
+                provider = get_provider(session.harness)
+                messages = []
+                if provider:
+                    try:
+                        messages = provider.get_session_messages(session)
+                    except Exception:
+                        pass
+                # Fallback: build minimal transcript from DB data
+                if not messages:
+                    db_msgs = self.db.get_session_messages(session_id)
+                    messages = [{"role": m.role, "content": m.content} for m in db_msgs if m.content]
+                # Last resort: use first_prompt + last_response fields
+                if not messages and session.first_prompt:
+                    messages = [{"role": "user", "content": session.first_prompt}]
+                    if session.last_response:
+                        messages.append({"role": "assistant", "content": session.last_response})
+                if not any(m.get("role") == "assistant" and m.get("content") for m in messages):
+                    self._summary_inflight.discard(session_id)
+                    continue
+
+                pending[pool.submit(generate_summary_sync, messages)] = session
+                if len(pending) >= SUMMARY_WORKERS:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(future, pending.pop(future))
 
     def action_show_all_messages(self):
         """Load and display full session transcript."""
@@ -666,11 +705,26 @@ class AgentSessionsBrowser(App):
             self.notify("No transcript to copy", severity="warning")
             return
         try:
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
+            self._copy_to_clipboard(text)
             self.notify("Transcript copied to clipboard")
         except Exception:
             self.notify("Failed to copy to clipboard", severity="error")
 
+    def _copy_to_clipboard(self, text: str) -> None:
+        """Hand text to pbcopy without blocking the UI on the child exiting.
+
+        Raises OSError when pbcopy can't be started. The previous child is
+        reaped here, so at most one finished copy is left unwaited.
+        """
+        if self._pbcopy_proc is not None:
+            self._pbcopy_proc.wait()
+        proc = subprocess.Popen(["pbcopy"], stdin=subprocess.PIPE)
+        try:
+            proc.stdin.write(text.encode())
+        finally:
+            proc.stdin.close()
+        self._pbcopy_proc = proc
+
     def action_select_all_transcript(self):
         """Select all transcript text and copy to clipboard (Ctrl+A)."""
         detail = self.query_one("#detail-panel", SessionDetailPanel)
@@ -679,7 +733,7 @@ class AgentSessionsBrowser(App):
             self.notify("No transcript to select", severity="warning")
             return
         try:
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
+            self._copy_to_clipboard(text)
             lines = text.count("\n") + 1
             self.notify(f"Transcript selected & copied ({lines} lines)")
         except Exception:
@@ -706,7 +760,7 @@ class AgentSessionsBrowser(App):
             idx = 0
         msg_text = detail._transcript_messages[idx].plain
         try:
-            subprocess.run(["pbcopy"], input=msg_text.encode(), check=True)
+            self._copy_to_clipboard(msg_text)
             self.notify(f"Message {idx + 1}/{num_msgs} copied")
         except Exception:
             self.notify("Failed to copy to clipboard", severity="error")
@@ -753,67 +807,95 @@ class AgentSessionsBrowser(App):
         """Background worker for incremental indexing."""
         try:
             self.call_from_thread(self.notify, "Indexing sessions...")
+            for provider in self.available_providers:
+                provider.clear_caches()
             stats = self.indexer.incremental_update()
             if stats['sessions_indexed'] > 0:
                 msg = f"Indexed {stats['sessions_indexed']} sessions"
                 self.call_from_thread(self.notify, msg)
             else:
                 self.call_from_thread(self.notify, "Already up to date")
-            self._load_sessions()
-            self.call_from_thread(self._on_sessions_loaded)
+            self.call_from_thread(self._on_sessions_loaded, self._read_sessions())
         except Exception as e:
             self.log.error(f"Indexing failed: {e}")
             self.call_from_thread(self.notify, f"Indexing failed: {e}", severity="error")
 
     def _refresh_session_item(self, session_id: str):
         """Refresh a specific session item in the list."""
-        parent_list = self.query_one("#parent-list", ListView)
-        for child in parent_list.children:
-            if isinstance(child, ParentSessionItem) and child.session.id == session_id:
-                child.refresh_text()
-                break
+        self.query_one("#detail-panel", SessionDetailPanel).forget_session(session_id)
+        item = self.query_one("#parent-list", PagedListView).item_for(session_id)
+        if item is not None:
+            item.refresh_text()
 
     def _update_children_list(self, parent: Session):
         """Update the children list for the selected parent."""
-        children_list = self.query_one("#subagent-list", ListView)
-        children_list.clear()
-
+        children_list = self.query_one("#subagent-list", PagedListView)
         self.current_children = self._get_related_children(parent)
 
         container = self.query_one("#subagent-container")
-        if self.current_children:
-            container.remove_class("dimmed")
-            for child in self.current_children:
-                children_list.append(SubagentSessionItem(child, is_highlighted=True))
-        else:
-            container.add_class("dimmed")
+        # One mount and one repaint for the whole list
+        with self.batch_update():
+            # Parents with hundreds of sub-agents only mount the first page
+            children_list.set_items(
+                SubagentSessionItem(child, is_highlighted=True) for child in self.current_children
+            )
+            if self.current_children:
+                container.remove_class("dimmed")
+            else:
+                container.add_class("dimmed")
 
     @on(ListView.Highlighted, "#parent-list")
     def on_parent_highlighted(self, event: ListView.Highlighted):
         """Handle parent session highlight."""
         if event.item and isinstance(event.item, ParentSessionItem):
-            self.selected_session = event.item.session
-            detail = self.query_one("#detail-panel", SessionDetailPanel)
-
-            if self._search_mode:
-                self._update_search_results_list(event.item.session)
-                match = self._search_display_matches.get(event.item.session.id)
-                detail.show_session(
-                    event.item.session,
-                    0,
-                    match_snippet=match.match_snippet if match else None,
-                    match_source=match.match_source if match else None,
-                )
+            session = event.item.session
+            self.selected_session = session
+
+            # A lone move updates at once; while highlights arrive faster than
+            # HIGHLIGHT_DEBOUNCE (held j/k) only the row the cursor settles on is shown
+            if self._highlight_timer is not None:
+                self._highlight_timer.stop()
+                self._highlight_timer = None
+            now = time.monotonic()
+            if now - self._last_highlight >= HIGHLIGHT_DEBOUNCE:
+                self._apply_highlight(session)
             else:
-                # Use precomputed children from cache
-                self._update_children_list(event.item.session)
-                child_count = len(self.current_children)
-                detail.show_session(event.item.session, child_count)
+                self._highlight_timer = self.set_timer(
+                    HIGHLIGHT_DEBOUNCE, lambda: self._apply_highlight(session)
+                )
+            self._last_highlight = now
+
+    def _apply_highlight(self, session: Session):
+        """Show a highlighted parent's details and sub-agents."""
+        self._highlight_timer = None
+        detail = self.query_one("#detail-panel", SessionDetailPanel)
+
+        # Focus changes re-send Highlighted for the same row; the detail panel is
+        # cheap to re-show but the sub-agent list only needs rebuilding on a change
+        rebuild = self._subagents_shown_for != (session.id, self._search_mode)
+        self._subagents_shown_for = (session.id, self._search_mode)
+
+        if self._search_mode:
+            if rebuild:
+                self._update_search_results_list(session)
+            match = self._search_display_matches.get(session.id)
+            detail.show_session(
+                session,
+                0,
+                match_snippet=match.match_snippet if match else None,
+                match_source=match.match_source if match else None,
+            )
+        else:
+            # Use precomputed children from cache
+            if rebuild:
+                self._update_children_list(session)
+            child_count = len(self.current_children)
+            detail.show_session(session, child_count)
+        self._prioritize_visible_summaries()
 
     def _update_search_results_list(self, parent: Session):
         """Update bottom pane with matching children for this session."""
-        results_list = self.query_one("#subagent-list", ListView)
-        results_list.clear()
+        results_list = self.query_one("#subagent-list", PagedListView)
 
         # Find children that also matched the search
         related_children = self._get_related_children(parent)
@@ -825,12 +907,14 @@ class AgentSessionsBrowser(App):
         )
 
         container = self.query_one("#subagent-container")
-        if matching_children:
-            container.remove_class("dimmed")
-            for child in matching_children:
-                results_list.append(SubagentSessionItem(child, is_highlighted=True))
-        else:
-            container.add_class("dimmed")
+        with self.batch_update():
+            results_list.set_items(
+                SubagentSessionItem(child, is_highlighted=True) for child in matching_children
+            )
+            if matching_children:
+                container.remove_class("dimmed")
+            else:
+                container.add_class("dimmed")
 
     @on(ListView.Highlighted, "#subagent-list")
     def on_child_highlighted(self, event: ListView.Highlighted):
@@ -984,19 +1068,28 @@ class AgentSessionsBrowser(App):
 
         self._populate_parent_list()
 
-        parent_list = self.query_one("#parent-list", ListView)
-        if self.parent_sessions:
-            parent_list.index = 0
+        # Return to the row the user was on before searching
+        self._restore_parent_cursor(self._pre_search_session)
+        self._pre_search_session = None
 
-        parent_list.focus()
+        self.query_one("#parent-list", ListView).focus()
         self.focus_pane = "parent"
 
+    def _restore_parent_cursor(self, session: Optional[Session]):
+        """Put the parent cursor on a session if it is mounted, else on the first row."""
+        if not self.parent_sessions:
+            return
+        parent_list = self.query_one("#parent-list", PagedListView)
+        parent_list.select_session(session.id if session is not None else None)
+
     def _execute_search(self, query: str):
         """Execute search and update display."""
         if not query.strip():
             self._cancel_search()
             return
 
+        if not self._search_mode:
+            self._pre_search_session = self.selected_session
         self._search_mode = True
         self._search_query = query.strip()
 
@@ -1017,6 +1110,7 @@ class AgentSessionsBrowser(App):
 
     def _apply_search_results(self, results):
         """Apply search results to the UI (called on main thread)."""
+        self._subagents_shown_for = None  # matching sub-agents depend on the scores
         self._search_scores = {}
         self._search_matches = {}
         for result in results:
@@ -1026,7 +1120,7 @@ class AgentSessionsBrowser(App):
         # Build parent scores: direct matches + child-to-parent propagation
         parent_scores: dict[str, float] = {}
         display_matches: dict[str, SearchResult] = {}
-        parent_ids = {p.id for p in self.parent_sessions}
+        parent_ids = self._parent_by_id
 
         for session_id, score in self._search_scores.items():
             if session_id in parent_ids:
@@ -1041,8 +1135,7 @@ class AgentSessionsBrowser(App):
                         parent_scores[parent_id] = score
                         display_matches[parent_id] = self._search_matches[session_id]
 
-        parents_by_id = {p.id: p for p in self.parent_sessions}
-        self._filtered_parents = [parents_by_id[pid] for pid in parent_scores]
+        self._filtered_parents = [self._parent_by_id[pid] for pid in parent_scores]
 
         # Store parent-level scores for display
         self._search_scores.update(parent_scores)
@@ -1083,16 +1176,12 @@ class AgentSessionsBrowser(App):
             f"[dim]({len(self._filtered_parents)} sessions, {total_matches} matches · {sort_label})[/]"
         )
 
-        parent_list = self.query_one("#parent-list", ListView)
-        parent_list.clear()
-        items = [
-            ParentSessionItem(session)
-            for session in self._filtered_parents[:500]
-        ]
-        parent_list.mount(*items)
+        parent_list = self.query_one("#parent-list", PagedListView)
+        with self.batch_update():
+            parent_list.set_items(ParentSessionItem(session) for session in self._filtered_parents[:500])
 
         if self._filtered_parents:
-            parent_list.index = 0
+            parent_list.select_session(None)
 
     def action_cycle_search_sort(self):
         """Cycle search result sort order: relevance → newest → oldest."""
@@ -1145,6 +1234,8 @@ class AgentSessionsBrowser(App):
 
             save_annotation(session.id, mode, value, source="manual")
             self.db.upsert_annotations(session.id, load_annotations(session.id))
+            detail = self.query_one("#detail-panel", SessionDetailPanel)
+            detail.forget_annotations(session.id)
 
             self.notify(f"{'Tag' if mode == 'tag' else 'Note'} saved: {value[:50]}")
             search_input.placeholder = "Search sessions... (Enter to search, Escape to cancel)"
@@ -1153,7 +1244,6 @@ class AgentSessionsBrowser(App):
             self._focus_active_list()
 
             # Refresh detail panel to show new annotation
-            detail = self.query_one("#detail-panel", SessionDetailPanel)
             if detail.session and detail.session.id == session.id:
                 children = self._get_related_children(session)
                 detail.show_session(session, child_count=len(children))
@@ -1168,7 +1258,7 @@ class AgentSessionsBrowser(App):
             if provider:
                 cmd = provider.get_resume_command(self.selected_session)
                 try:
-                    subprocess.run(["pbcopy"], input=cmd.encode(), check=True)
+                    self._copy_to_clipboard(cmd)
                     self.notify(f"Copied: {cmd}", title="Command Copied")
                 except Exception:
                     self.notify(f"Command: {cmd}", title="Copy Failed")
@@ -1236,6 +1326,8 @@ class AgentSessionsBrowser(App):
             self.query_one("#detail-panel", SessionDetailPanel).scroll_end()
         else:
             lv = self._get_focused_list()
+            if isinstance(lv, PagedListView):
+                lv.load_all()
             if lv and len(lv.children) > 0:
                 lv.index = len(lv.children) - 1
 
@@ -1,15 +1,20 @@
 """Caching for session summaries and metadata."""
 
+import atexit
 import hashlib
 import json
 import logging
 import os
 import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import importlib.util
 
+from . import _json
+
 HAS_OPENAI = importlib.util.find_spec("openai") is not None
 
 # Default cache locations
@@ -18,29 +23,46 @@ METADATA_CACHE_PATH = Path.home() / ".cache" / "agent-sessions" / "metadata.json
 SUMMARY_MODEL = "gpt-5.2"
 
 
+def _atomic_write(path: Path, data: bytes):
+    """Write data via a temp file and rename, so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
 class MetadataCache:
     """Cache for parsed session metadata to speed up startup.
 
-    Stores session metadata keyed by file path, with mtime for invalidation.
+    Stores session metadata keyed by file path, with the integer
+    ``st_mtime_ns`` and the file size for invalidation (exact comparison,
+    no float rounding; size catches appends within the same mtime tick).
     """
 
     _instance = None
     _lock = threading.Lock()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._data = {}
-            cls._instance._dirty = False
-            cls._instance._load()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                # Re-check: sessions are parsed on several threads at startup
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._data = {}
+                    instance._dirty = False
+                    instance._load()
+                    cls._instance = instance
+                instance = cls._instance
+        return instance
 
     def _load(self):
         """Load cache from disk."""
         if METADATA_CACHE_PATH.exists():
             try:
-                with open(METADATA_CACHE_PATH) as f:
-                    self._data = json.load(f)
+                with open(METADATA_CACHE_PATH, "rb") as f:
+                    self._data = _json.loads(f.read())
             except (json.JSONDecodeError, IOError):
                 self._data = {}
 
@@ -50,74 +72,93 @@ class MetadataCache:
             if not self._dirty:
                 return
             try:
-                METADATA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-                with open(METADATA_CACHE_PATH, "w") as f:
-                    json.dump(self._data, f)
+                _atomic_write(METADATA_CACHE_PATH, _json.dumps(self._data))
                 self._dirty = False
             except IOError:
                 pass
 
-    def get(self, file_path: Path, mtime: float) -> Optional[dict]:
-        """Get cached metadata if mtime matches."""
-        key = str(file_path)
-        with self._lock:
-            entry = self._data.get(key)
-            if entry and entry.get("mtime") == mtime:
-                return entry.get("metadata")
-            return None
+    def get(self, file_path: Path, mtime_ns: int, size: int) -> Optional[dict]:
+        """Get cached metadata if mtime and size match."""
+        # Lock-free: entries are replaced whole, and dict.get is atomic
+        entry = self._data.get(str(file_path))
+        if entry and entry.get("mtime") == mtime_ns and entry.get("size") == size:
+            return entry.get("metadata")
+        return None
 
-    def set(self, file_path: Path, mtime: float, metadata: dict):
+    def set(self, file_path: Path, mtime_ns: int, size: int, metadata: dict):
         """Cache session metadata."""
         key = str(file_path)
         with self._lock:
-            self._data[key] = {"mtime": mtime, "metadata": metadata}
+            self._data[key] = {"mtime": mtime_ns, "size": size, "metadata": metadata}
             self._dirty = True
 
 
 class SummaryCache:
     """Thread-safe cache for AI-generated session summaries."""
 
+    SAVE_INTERVAL = 2.0  # seconds between disk writes during summary bursts
+
     _instance = None
     _lock = threading.Lock()
 
     def __new__(cls, cache_path: Optional[Path] = None):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._cache_path = cache_path or DEFAULT_CACHE_PATH
-            cls._instance._data = {}
-            cls._instance._dirty = False
-            cls._instance._load()
-        return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._cache_path = cache_path or DEFAULT_CACHE_PATH
+                    instance._data = {}
+                    instance._dirty = False
+                    instance._last_save = float("-inf")
+                    instance._flush_timer = None
+                    instance._load()
+                    atexit.register(instance.save, force=True)
+                    cls._instance = instance
+                instance = cls._instance
+        return instance
 
     def _load(self):
         """Load cache from disk."""
         if self._cache_path.exists():
             try:
-                with open(self._cache_path) as f:
-                    self._data = json.load(f)
+                with open(self._cache_path, "rb") as f:
+                    self._data = _json.loads(f.read())
             except (json.JSONDecodeError, IOError):
                 self._data = {}
 
-    def save(self):
-        """Save cache to disk if dirty."""
+    def save(self, force: bool = False):
+        """Save cache to disk if dirty.
+
+        Saves within SAVE_INTERVAL of the previous write are coalesced into
+        one deferred write (flushed at exit at the latest) unless forced.
+        """
         with self._lock:
             if not self._dirty:
                 return
+            wait = self._last_save + self.SAVE_INTERVAL - time.monotonic()
+            if wait > 0 and not force:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(wait, self.save, kwargs={"force": True})
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
             try:
-                self._cache_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self._cache_path, "w") as f:
-                    json.dump(self._data, f, indent=2)
+                _atomic_write(self._cache_path, _json.dumps(self._data, indent=True))
                 self._dirty = False
+                self._last_save = time.monotonic()
             except IOError:
                 pass
 
     def get(self, session_id: str, content_hash: str) -> Optional[str]:
         """Get cached summary if hash matches."""
-        with self._lock:
-            entry = self._data.get(session_id)
-            if entry and entry.get("hash") == content_hash:
-                return entry.get("summary")
-            return None
+        entry = self._data.get(session_id)
+        if entry and entry.get("hash") == content_hash:
+            return entry.get("summary")
+        return None
 
     def set(self, session_id: str, content_hash: str, summary: str):
         """Cache a summary."""
@@ -127,9 +168,20 @@ class SummaryCache:
 
 
 def compute_content_hash(first_prompt: str, last_response: str) -> str:
-    """Compute hash of session content for cache invalidation."""
+    """Compute hash of session content for cache invalidation.
+
+    The digest is persisted as the key of every cached summary, so the
+    algorithm must stay MD5; it is only a fingerprint, not a security check.
+    """
     content = f"{first_prompt[:500]}|{last_response[:500]}"
-    return hashlib.md5(content.encode()).hexdigest()[:12]
+    return hashlib.md5(content.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+@lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Shared OpenAI client per key; it is thread-safe and pools connections."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
 
 
 def generate_summary_sync(messages: list[dict]) -> Optional[str]:
@@ -142,8 +194,7 @@ def generate_summary_sync(messages: list[dict]) -> Optional[str]:
         return None
 
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
 
         # Filter to user/assistant only, skip tool calls, system, thinking
         filtered = [
@@ -10,7 +10,7 @@ from typing import Callable, Optional
 
 from ..annotations import get_all_annotation_files, load_annotations
 from ..models import Session
-from ..providers.base import SessionProvider
+from ..providers.base import SessionProvider, scan_files
 from .chunker import SessionChunker
 from .database import ChunkRow, MessageRow, SessionDatabase
 from .embeddings import EmbeddingGenerator
@@ -458,9 +458,9 @@ class SessionIndexer:
             if provider.name == "opencode":
                 message_dir = OPENCODE_MESSAGE_DIR / session_id
                 if message_dir.exists():
-                    message_files = list(message_dir.glob("*.json"))
-                    if message_files:
-                        return int(max(f.stat().st_mtime for f in message_files))
+                    mtimes = [entry.stat().st_mtime for entry in scan_files(message_dir, ".json")]
+                    if mtimes:
+                        return int(max(mtimes))
             else:
                 if path.exists():
                     return int(path.stat().st_mtime)
@@ -483,14 +483,16 @@ class SessionIndexer:
             if not message_dir.exists():
                 return False
 
-            for msg_file in message_dir.glob("*.json"):
-                if msg_file.stat().st_mtime > indexed_at:
+            for entry in scan_files(message_dir, ".json"):
+                if entry.stat().st_mtime > indexed_at:
                     return True
 
             part_base = OPENCODE_PART_DIR
             for part_dir in part_base.glob(f"{session_id}*"):
-                for part_file in part_dir.glob("*.json"):
-                    if part_file.stat().st_mtime > indexed_at:
+                if not part_dir.is_dir():
+                    continue
+                for entry in scan_files(part_dir, ".json"):
+                    if entry.stat().st_mtime > indexed_at:
                         return True
 
         except OSError:
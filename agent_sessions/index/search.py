@@ -1,6 +1,7 @@
 import re
 import time
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
 import numpy as np
@@ -144,15 +145,16 @@ def parse_hybrid_query(query: str) -> ParsedHybridQuery:
 
     remaining = _MODIFIER_RE.sub(remove_modifier, remaining)
 
+    now = datetime.now()
     after_ts = None
     if filters.get("after"):
-        after_dt = parse_date_value(filters["after"])
+        after_dt = parse_date_value(filters["after"], now)
         if after_dt is not None:
             after_ts = int(after_dt.timestamp())
 
     before_ts = None
     if filters.get("before"):
-        before_dt = parse_date_value(filters["before"])
+        before_dt = parse_date_value(filters["before"], now)
         if before_dt is not None:
             before_ts = int(before_dt.timestamp())
 
@@ -176,6 +178,8 @@ def _clean_snippet(text: Optional[str], max_chars: int = 240) -> Optional[str]:
 
 
 class HybridSearch:
+    QUERY_CACHE_SIZE = 64  # query texts whose unit embedding vectors are kept
+
     def __init__(
         self,
         db: Optional[SessionDatabase] = None,
@@ -192,6 +196,8 @@ class HybridSearch:
         self._embedding_norms: Optional[np.ndarray] = None
         self._chunk_session_ids: Optional[list[str]] = None
         self._chunk_ids: Optional[list[int]] = None
+        # Re-running a query (sort/filter changes, resubmits) skips the embedding API call
+        self._query_vectors: dict[str, np.ndarray] = {}
 
     def _load_embedding_cache(self):
         """Load embeddings from DB into a pre-normalized numpy matrix."""
@@ -223,6 +229,26 @@ class HybridSearch:
         self._chunk_session_ids = session_ids
         self._chunk_ids = chunk_ids
 
+    def _query_vector(self, query: str) -> Optional[np.ndarray]:
+        """Unit-length embedding for a query, computed once per query text."""
+        query_vec = self._query_vectors.get(query)
+        if query_vec is not None:
+            return query_vec
+
+        query_embedding = self._embedder.embed_query(query)
+        if query_embedding is None:
+            return None
+        query_vec = np.array(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm == 0:
+            return None
+        query_vec /= query_norm
+
+        if len(self._query_vectors) >= self.QUERY_CACHE_SIZE:
+            self._query_vectors.clear()
+        self._query_vectors[query] = query_vec
+        return query_vec
+
     def search(
         self,
         query: str,
@@ -364,8 +390,8 @@ class HybridSearch:
         limit: int,
         candidate_session_ids: Optional[set[str]] = None,
     ) -> dict[str, _ScoredMatch]:
-        query_embedding = self._embedder.embed_query(query)
-        if query_embedding is None:
+        query_vec = self._query_vector(query)
+        if query_vec is None:
             return {}
 
         if self._embedding_matrix is None:
@@ -387,14 +413,9 @@ class HybridSearch:
 
         MIN_COSINE = 0.35
 
-        # Vectorized cosine similarity: dot(query, matrix^T) / (||query|| * ||rows||)
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = np.linalg.norm(query_vec)
-        if query_norm == 0:
-            return {}
-
+        # Vectorized cosine similarity: query_vec is already unit length
         dots = matrix @ query_vec
-        similarities = dots / (norms * query_norm)
+        similarities = dots / norms
 
         # Aggregate: best similarity per session
         session_best: dict[str, float] = {}
@@ -7,6 +7,7 @@ Entry point for the CLI application.
 import argparse
 import json
 import os
+import shlex
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -28,33 +29,40 @@ def cmd_browse(args):
             os.chdir(project_path)
             print(f"\n[cd {project_path}]")
         print(f"[Resuming session...]\n{cmd}\n")
-        if cmd:
+        # Commands starting with "#" are instructions (e.g. Cursor has no CLI resume)
+        if cmd and not cmd.startswith("#"):
             # Use non-interactive shell — claude-1m etc. are scripts on PATH,
             # not aliases. Avoid -i to prevent .zshrc from overriding cwd.
-            parts = cmd.split()
+            # shlex keeps quoted arguments from a .resume-cmd prefix intact.
+            try:
+                parts = shlex.split(cmd)
+            except ValueError as e:
+                print(f"Could not parse resume command ({e}); run it manually.", file=sys.stderr)
+                sys.exit(1)
             os.execvp(parts[0], parts)
 
 
 def cmd_providers(args):
     """List available providers."""
-    from .providers import get_all_providers
+    from .providers import get_all_providers, load_sessions_by_provider
 
     providers = get_all_providers()
 
     if args.status:
+        loaded = load_sessions_by_provider([p for p in providers if p.is_available()])
         print("Provider Status:")
         print("-" * 60)
         for p in providers:
-            available = "✓" if p.is_available() else "✗"
-            status = "available" if p.is_available() else "not found"
+            available = "✓" if p.name in loaded else "✗"
+            status = "available" if p.name in loaded else "not found"
             sessions_dir = p.get_sessions_dir()
 
             print(f"{available} {p.icon} {p.display_name:<15} ({p.name})")
             print(f"    Path: {sessions_dir}")
             print(f"    Status: {status}")
 
-            if p.is_available():
-                sessions = p.load_sessions()
+            if p.name in loaded:
+                sessions = loaded[p.name]
                 parents = sum(1 for s in sessions if not s.is_child)
                 children = sum(1 for s in sessions if s.is_child)
                 print(f"    Sessions: {parents} parent, {children} child")
@@ -150,6 +158,7 @@ def cmd_cache(args):
 
 def cmd_reindex(args):
     """Perform full reindex of all sessions."""
+    from .cache import MetadataCache
     from .index import SessionIndexer, SessionDatabase
     from .providers import get_available_providers
     
@@ -168,6 +177,7 @@ def cmd_reindex(args):
         print(f"\r[{bar}] {pct:3.0f}% ({current}/{total}) {message}", end="", flush=True)
     
     stats = indexer.full_reindex(progress_callback=progress_callback)
+    MetadataCache().save()
     
     print()
     print()
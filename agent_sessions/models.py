@@ -1,12 +1,13 @@
 """Unified session model for all providers."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Unified session model for all AI coding harnesses."""
 
@@ -46,8 +47,49 @@ class Session:
     # Provider-specific data
     extra: dict = field(default_factory=dict)
 
+    # Display strings, built on first use (slots leave no __dict__ for cached_property)
+    _modified_short: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _project_short: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _prompt_line: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _modified_long: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        # Few distinct values across thousands of sessions; interning shares
+        # one string each and lets filter equality short-circuit on identity
+        self.harness = sys.intern(self.harness)
+        if self.project_name:
+            self.project_name = sys.intern(self.project_name)
+
+    @property
+    def modified_short(self) -> str:
+        """Modified time as shown in session lists."""
+        if self._modified_short is None:
+            self._modified_short = self.modified_time.strftime("%m-%d %H:%M") if self.modified_time else "??-?? ??:??"
+        return self._modified_short
+
+    @property
+    def project_short(self) -> str:
+        """Project name fitted to the 12-column list field."""
+        if self._project_short is None:
+            self._project_short = self.project_name[:12].ljust(12)
+        return self._project_short
+
+    @property
+    def prompt_line(self) -> str:
+        """First prompt (or title) flattened to one line for list rows."""
+        if self._prompt_line is None:
+            self._prompt_line = (self.first_prompt or self.title or "(no prompt)").replace("\n", " ").strip()
+        return self._prompt_line
+
+    @property
+    def modified_long(self) -> str:
+        """Modified time as shown in the detail panel."""
+        if self._modified_long is None:
+            self._modified_long = self.modified_time.strftime("%Y-%m-%d %H:%M:%S") if self.modified_time else "Unknown"
+        return self._modified_long
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A single search result with context."""
 
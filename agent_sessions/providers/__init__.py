@@ -1,5 +1,7 @@
 """Provider registry and discovery."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Type
 from .base import SessionProvider
 
@@ -10,11 +12,13 @@ _PROVIDERS: dict[str, Type[SessionProvider]] = {}
 def register_provider(provider_class: Type[SessionProvider]) -> Type[SessionProvider]:
     """Decorator to register a provider class."""
     _PROVIDERS[provider_class.name] = provider_class
+    get_provider.cache_clear()
     return provider_class
 
 
+@lru_cache(maxsize=32)
 def get_provider(name: str) -> SessionProvider | None:
-    """Get an instance of a provider by name."""
+    """Get the shared instance of a provider by name."""
     provider_class = _PROVIDERS.get(name)
     if provider_class:
         return provider_class()
@@ -31,13 +35,25 @@ def get_available_providers() -> list[SessionProvider]:
     return [p for p in get_all_providers() if p.is_available()]
 
 
+def load_sessions_by_provider(providers: list[SessionProvider]) -> dict[str, list]:
+    """Load each provider's sessions concurrently, keyed by provider name.
+
+    Providers read disjoint stores, so one slow provider (e.g. a large
+    Cursor DB) no longer holds up the rest.
+    """
+    if len(providers) < 2:
+        return {p.name: p.load_sessions() for p in providers}
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        results = pool.map(lambda p: p.load_sessions(), providers)
+        return {p.name: sessions for p, sessions in zip(providers, results)}
+
+
 def discover_all_sessions():
     """Discover sessions from all available providers."""
     from ..models import Session
 
     all_sessions: list[Session] = []
-    for provider in get_available_providers():
-        sessions = provider.load_sessions()
+    for sessions in load_sessions_by_provider(get_available_providers()).values():
         all_sessions.extend(sessions)
 
     # Sort by modified time, newest first
@@ -1,11 +1,23 @@
 """Base class for session providers."""
 
+import os
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 from ..models import Session
 
 
+# Worker threads for load_sessions(); parsing is mostly file I/O
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Buffer size for streaming JSONL logs line by line; multi-MB sessions are
+# read in far fewer syscalls than with the default 8 KB buffer
+READ_BUFFER_SIZE = 1 << 20
+
 # Patterns that indicate system/meta content rather than real user/assistant messages
 _SKIP_PREFIXES = (
     "[Request interrupted",
@@ -20,48 +32,208 @@ _SKIP_PREFIXES = (
 )
 
 
-def find_first_real_prompt(user_messages: list[tuple[str, str]]) -> str:
+def _is_real_prompt(content: str) -> bool:
+    stripped = content.strip()
+    return len(stripped) >= 20 and not stripped.startswith(_SKIP_PREFIXES)
+
+
+def _is_real_response(content: str) -> bool:
+    stripped = content.strip()
+    return bool(stripped) and not stripped.startswith(_SKIP_PREFIXES)
+
+
+if sys.version_info >= (3, 11):
+    def parse_timestamp(value) -> Optional[datetime]:
+        """Parse an ISO-8601 timestamp (trailing Z allowed) or return None."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+else:
+    def parse_timestamp(value) -> Optional[datetime]:
+        """Parse an ISO-8601 timestamp (trailing Z allowed) or return None."""
+        if not value:
+            return None
+        try:
+            # fromisoformat only accepts a trailing Z from Python 3.11
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+
+def find_first_real_prompt(user_messages: Iterable[tuple[str, str]]) -> str:
     """Find the first real user prompt, skipping system/meta messages.
 
     Args:
-        user_messages: List of (role, content) tuples for user messages.
+        user_messages: (role, content) tuples for user messages, oldest first.
+            May be a lazy iterator; it is consumed only up to the first match.
 
     Returns:
         The content of the first real prompt, or the first message as fallback.
     """
-    if not user_messages:
-        return ""
+    fallback = None
     for _, content in user_messages:
-        stripped = content.strip()
-        if any(stripped.startswith(p) for p in _SKIP_PREFIXES):
-            continue
-        if len(stripped) < 20:
-            continue
-        return content
+        if fallback is None:
+            fallback = content
+        if _is_real_prompt(content):
+            return content
     # Fallback to first message if nothing passes
-    return user_messages[0][1]
+    return fallback if fallback is not None else ""
 
 
-def find_last_real_response(assistant_messages: list[tuple[str, str]]) -> str:
+def find_last_real_response(
+    assistant_messages: Iterable[tuple[str, str]],
+    *,
+    newest_first: bool = False,
+) -> str:
     """Find the last real assistant response, skipping system/meta messages.
 
     Args:
         assistant_messages: List of (role, content) tuples for assistant messages.
+        newest_first: The messages are already ordered newest first (e.g. a
+            lazy iterator), so they are consumed as given instead of reversed.
 
     Returns:
         The content of the last real response, or the last message as fallback.
     """
-    if not assistant_messages:
-        return ""
-    for _, content in reversed(assistant_messages):
-        stripped = content.strip()
-        if not stripped:
-            continue
-        if any(stripped.startswith(p) for p in _SKIP_PREFIXES):
-            continue
-        return content
+    ordered = assistant_messages if newest_first else reversed(assistant_messages)
+    fallback = None
+    for _, content in ordered:
+        if fallback is None:
+            fallback = content
+        if _is_real_response(content):
+            return content
     # Fallback to last message if nothing passes
-    return assistant_messages[-1][1]
+    return fallback if fallback is not None else ""
+
+
+class MessageTracker:
+    """Track first/last prompts and the last response while streaming messages.
+
+    Gives the same results as find_first_real_prompt / find_last_real_response
+    over the full message lists, without materializing them.
+    """
+
+    __slots__ = ("count", "_first_prompt", "_first_user", "last_prompt", "_last_response", "_last_assistant")
+
+    def __init__(self):
+        self.count = 0
+        self._first_prompt = None
+        self._first_user = None
+        self.last_prompt = ""
+        self._last_response = None
+        self._last_assistant = None
+
+    def add(self, role: str, content: str) -> None:
+        self.count += 1
+        if role == "user":
+            if self._first_user is None:
+                self._first_user = content
+            if self._first_prompt is None and _is_real_prompt(content):
+                self._first_prompt = content
+            self.last_prompt = content
+        elif role == "assistant":
+            self._last_assistant = content
+            if _is_real_response(content):
+                self._last_response = content
+
+    @property
+    def found_first_prompt(self) -> bool:
+        """A real first prompt has been seen (later user messages cannot change it)."""
+        return self._first_prompt is not None
+
+    @property
+    def first_prompt(self) -> str:
+        if self._first_prompt is not None:
+            return self._first_prompt
+        return self._first_user if self._first_user is not None else ""
+
+    @property
+    def last_response(self) -> str:
+        if self._last_response is not None:
+            return self._last_response
+        return self._last_assistant if self._last_assistant is not None else ""
+
+
+def has_marker(line: bytes, markers: tuple[bytes, ...]) -> bool:
+    """True if any raw-byte marker occurs in line (checked before json.loads)."""
+    for marker in markers:
+        if marker in line:
+            return True
+    return False
+
+
+def find_project_jsonl_files(sessions_dir: Path) -> list[Path]:
+    """List ``*.jsonl`` files one level below each project directory.
+
+    Uses os.scandir so directory and file checks come from the cached
+    DirEntry type instead of a stat per entry.
+    """
+    files = []
+    try:
+        with os.scandir(sessions_dir) as projects:
+            project_paths = [e.path for e in projects if e.is_dir()]
+    except OSError:
+        return files
+    for project_path in project_paths:
+        try:
+            with os.scandir(project_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".jsonl") and entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+    return files
+
+
+def scan_files(directory: Path, suffix: str) -> Iterator[os.DirEntry]:
+    """Yield the files in directory whose names end with suffix.
+
+    Callers take mtimes from ``entry.stat()``, which DirEntry caches (and on
+    Windows fills from the directory read itself) rather than building a
+    Path per file to stat it. Raises OSError if directory is unreadable.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                yield entry
+
+
+def _by_first_char(prefixes: list[tuple[str, str]]) -> dict[str, list[tuple[str, str]]]:
+    """Group (prefix, kind) pairs by first character, keeping their order."""
+    table: dict[str, list[tuple[str, str]]] = {}
+    for prefix, kind in prefixes:
+        table.setdefault(prefix[0], []).append((prefix, kind))
+    return table
+
+
+# Prompt prefixes marking automated sessions, bucketed by first character so a
+# human prompt is rejected with one dict lookup instead of a startswith chain
+_AUTOMATED_PREFIXES = _by_first_char([
+    ("<system-notification>", "system-notification"),
+    ("<command-message>", "command-message"),
+    ("<command-instruction>", "command-instruction"),
+    ("<local-command-caveat>", "command-caveat"),
+    ("<ultrawork-mode>", "ultrawork-mode"),
+    ("[search-mode]", "search-mode"),
+    ("[analyze-mode]", "analyze-mode"),
+    ("[SYSTEM DIRECTIVE", "system-directive"),
+    ("[COMPACTION CONTEXT", "compaction-context"),
+    ("[GAS TOWN]", "ci-dispatch"),
+    ("[gas town]", "ci-dispatch"),
+])
+
+# Matched against the lowercased prompt
+_AUTOMATED_LOWER_PREFIXES = _by_first_char([
+    ("gt boot", "ci-dispatch"),
+    ("gt prime", "ci-dispatch"),
+    ("gt hook", "ci-dispatch"),
+    ("run `gt hook`", "ci-dispatch"),
+    ("run `gt boot`", "ci-dispatch"),
+    ("summarize the task tool output above", "subagent-continuation"),
+])
 
 
 def detect_automated_session(first_prompt: str) -> tuple[bool, str]:
@@ -78,41 +250,19 @@ def detect_automated_session(first_prompt: str) -> tuple[bool, str]:
     prompt_start = first_prompt[:500].strip()
     prompt_lower = prompt_start.lower()
 
-    # XML-tagged system content
-    if prompt_start.startswith("<system-notification>"):
-        return True, "system-notification"
-    if prompt_start.startswith("<command-message>"):
-        return True, "command-message"
-    if prompt_start.startswith("<command-instruction>"):
-        return True, "command-instruction"
-    if prompt_start.startswith("<local-command-caveat>"):
-        return True, "command-caveat"
-    if prompt_start.startswith("<ultrawork-mode>"):
-        return True, "ultrawork-mode"
-
-    # Bracketed system directives
-    if prompt_start.startswith("[search-mode]"):
-        return True, "search-mode"
-    if prompt_start.startswith("[analyze-mode]"):
-        return True, "analyze-mode"
-    if prompt_start.startswith("[SYSTEM DIRECTIVE"):
-        return True, "system-directive"
-    if prompt_start.startswith("[COMPACTION CONTEXT"):
-        return True, "compaction-context"
-    if prompt_start.startswith("[GAS TOWN]") or prompt_start.startswith("[gas town]"):
-        return True, "ci-dispatch"
+    # XML-tagged system content and bracketed system directives
+    for prefix, kind in _AUTOMATED_PREFIXES.get(prompt_start[:1], ()):
+        if prompt_start.startswith(prefix):
+            return True, kind
 
     # Bot/CI dispatches
     if "polecat dispatched" in prompt_lower:
         return True, "ci-dispatch"
-    if prompt_lower.startswith("gt boot") or prompt_lower.startswith("gt prime") or prompt_lower.startswith("gt hook"):
-        return True, "ci-dispatch"
-    if prompt_lower.startswith("run `gt hook`") or prompt_lower.startswith("run `gt boot`"):
-        return True, "ci-dispatch"
 
-    # Sub-agent continuation prompts
-    if prompt_lower.startswith("summarize the task tool output above"):
-        return True, "subagent-continuation"
+    # CI commands and sub-agent continuation prompts
+    for prefix, kind in _AUTOMATED_LOWER_PREFIXES.get(prompt_lower[:1], ()):
+        if prompt_lower.startswith(prefix):
+            return True, kind
 
     return False, ""
 
@@ -134,6 +284,10 @@ class SessionProvider(ABC):
     # Providers with virtual paths or DB queries should set this to False.
     fast_discovery: bool = True
 
+    # Whether parse_session() may run concurrently for different paths.
+    # Providers that share a single connection or temp file should set this to False.
+    parallel_parse: bool = True
+
     @abstractmethod
     def get_sessions_dir(self) -> Path:
         """Return the directory where sessions are stored."""
@@ -155,15 +309,26 @@ class SessionProvider(ABC):
 
     def load_sessions(self) -> list[Session]:
         """Load all sessions from this provider."""
-        sessions = []
-        for path in self.discover_session_files():
-            try:
-                session = self.parse_session(path)
-                if session:
-                    sessions.append(session)
-            except Exception:
-                continue
-        return sessions
+        paths = self.discover_session_files()
+        if self.parallel_parse and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(paths))) as pool:
+                results = list(pool.map(self._try_parse_session, paths))
+        else:
+            results = [self._try_parse_session(path) for path in paths]
+        return [session for session in results if session]
+
+    def _try_parse_session(self, path: Path) -> Session | None:
+        try:
+            return self.parse_session(path)
+        except Exception:
+            return None
+
+    def clear_caches(self) -> None:
+        """Drop any in-process lookups memoized by this provider.
+
+        Called before reindexing so on-disk changes are picked up.
+        Default implementation does nothing.
+        """
 
     @abstractmethod
     def get_resume_command(self, session: Session) -> str:
@@ -6,13 +6,30 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from .. import _json
 from ..cache import MetadataCache, SummaryCache, compute_content_hash
 from ..models import Session
 from . import register_provider
-from .base import SessionProvider, detect_automated_session, find_first_real_prompt, find_last_real_response
+from .base import (
+    READ_BUFFER_SIZE,
+    MessageTracker,
+    SessionProvider,
+    detect_automated_session,
+    find_project_jsonl_files,
+    has_marker,
+    parse_timestamp,
+)
 
 
-SESSIONS_DIR = Path.home() / ".claude" / "projects"
+_HOME = Path.home()
+SESSIONS_DIR = _HOME / ".claude" / "projects"
+
+# Raw-byte markers of user/assistant records; snapshot and progress records
+# (often most of a log) are skipped without decoding them
+_MESSAGE_MARKERS = (
+    b'"type":"user"', b'"type":"assistant"',
+    b'"type": "user"', b'"type": "assistant"',
+)
 
 
 def _all_claude_sessions_dirs() -> list[Path]:
@@ -23,8 +40,7 @@ def _all_claude_sessions_dirs() -> list[Path]:
     uses CLAUDE_CONFIG_DIR=~/.claude-1m).
     """
     dirs = [SESSIONS_DIR]
-    home = Path.home()
-    for d in home.glob(".claude-*/projects"):
+    for d in _HOME.glob(".claude-*/projects"):
         if d.is_dir() and d not in dirs:
             dirs.append(d)
     return dirs
@@ -150,18 +166,11 @@ class ClaudeCodeProvider(SessionProvider):
         """
         files = []
         for sessions_dir in _all_claude_sessions_dirs():
-            if not sessions_dir.exists():
-                continue
-            for project_dir in sessions_dir.iterdir():
-                if not project_dir.is_dir():
-                    continue
-                for jsonl_file in project_dir.glob("*.jsonl"):
-                    files.append(jsonl_file)
-
+            files.extend(find_project_jsonl_files(sessions_dir))
         return files
 
-    def _session_from_cache(self, path: Path, cached: dict) -> Session:
-        """Construct Session from cached metadata."""
+    def _session_from_cache(self, path: Path, cached: dict, mtime: float | None = None) -> Session:
+        """Construct Session from cached metadata (mtime avoids a second stat)."""
         created_time = None
         if cached.get("created_time"):
             try:
@@ -169,7 +178,9 @@ class ClaudeCodeProvider(SessionProvider):
             except (ValueError, TypeError):
                 pass
 
-        modified_time = datetime.fromtimestamp(path.stat().st_mtime)
+        if mtime is None:
+            mtime = path.stat().st_mtime
+        modified_time = datetime.fromtimestamp(mtime)
 
         # Get summary from summary cache
         content_hash = cached.get("content_hash", "")
@@ -207,14 +218,14 @@ class ClaudeCodeProvider(SessionProvider):
 
         # Check metadata cache first
         try:
-            mtime = path.stat().st_mtime
+            stat = path.stat()
         except OSError:
             return None
 
         cache = MetadataCache()
-        cached = cache.get(path, mtime)
+        cached = cache.get(path, stat.st_mtime_ns, stat.st_size)
         if cached:
-            return self._session_from_cache(path, cached)
+            return self._session_from_cache(path, cached, stat.st_mtime)
 
         # Defaults
         model = "unknown"
@@ -233,13 +244,13 @@ class ClaudeCodeProvider(SessionProvider):
 
         # Parse JSONL
         try:
-            messages = []
-            with open(path) as f:
+            messages = MessageTracker()
+            with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
-                    if not line.strip():
+                    if not has_marker(line, _MESSAGE_MARKERS):
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _json.loads(line)
                         msg_type = data.get("type")
 
                         # Skip non-message types
@@ -273,37 +284,27 @@ class ClaudeCodeProvider(SessionProvider):
 
                             # Capture timestamp for first message
                             if created_time is None:
-                                ts = data.get("timestamp")
-                                if ts:
-                                    try:
-                                        created_time = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                                    except (ValueError, TypeError):
-                                        pass
+                                created_time = parse_timestamp(data.get("timestamp"))
 
                             text_only = (role == "user")
                             content = extract_text_content(msg.get("content", ""), text_only=text_only)
                             if role in ("user", "assistant") and content:
                                 if "<system-reminder>" in content[:100]:
                                     continue
-                                messages.append((role, content))
+                                messages.add(role, content)
 
                     except json.JSONDecodeError:
                         continue
 
-            user_messages = [(r, c) for r, c in messages if r == "user"]
-            assistant_messages = [(r, c) for r, c in messages if r == "assistant"]
-
-            if user_messages:
-                first_user_prompt = find_first_real_prompt(user_messages)
-                last_user_prompt = user_messages[-1][1]
-            if assistant_messages:
-                last_assistant_response = find_last_real_response(assistant_messages)
+            first_user_prompt = messages.first_prompt
+            last_user_prompt = messages.last_prompt
+            last_assistant_response = messages.last_response
 
         except (IOError, Exception):
             return None
 
         # Skip empty sessions (no messages at all)
-        if not messages:
+        if not messages.count:
             return None
 
         # isSidechain from Claude Code is authoritative for sub-agent detection
@@ -322,7 +323,7 @@ class ClaudeCodeProvider(SessionProvider):
             title = first_line[:80] if first_line else "Claude Code Session"
 
         # Get modified time from file
-        modified_time = datetime.fromtimestamp(path.stat().st_mtime)
+        modified_time = datetime.fromtimestamp(stat.st_mtime)
 
         # Compute content hash and get cached summary
         content_hash = compute_content_hash(first_user_prompt, last_assistant_response)
@@ -352,7 +353,7 @@ class ClaudeCodeProvider(SessionProvider):
             "version": version,
             "git_branch": git_branch,
         }
-        cache.set(path, mtime, metadata)
+        cache.set(path, stat.st_mtime_ns, stat.st_size, metadata)
 
         return Session(
             id=session_id,
@@ -385,7 +386,7 @@ class ClaudeCodeProvider(SessionProvider):
         raw = session.raw_path
         for part in raw.parts:
             if part.startswith(".claude-") and part != ".claude":
-                config_dir = Path.home() / part
+                config_dir = _HOME / part
                 suffix = part[len(".claude-"):]  # e.g. "1m"
 
                 # Priority 1: explicit resume command file in config dir
@@ -407,12 +408,12 @@ class ClaudeCodeProvider(SessionProvider):
 
         invocations = []
         try:
-            with open(session.raw_path) as f:
+            with open(session.raw_path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
-                    if '"name":"Task"' not in line and '"name": "Task"' not in line:
+                    if b'"name":"Task"' not in line and b'"name": "Task"' not in line:
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _json.loads(line)
                         if data.get("type") != "assistant":
                             continue
                         msg = data.get("message", {})
@@ -421,13 +422,7 @@ class ClaudeCodeProvider(SessionProvider):
                         if not isinstance(content, list):
                             continue
 
-                        timestamp = data.get("timestamp")
-                        ts = None
-                        if timestamp:
-                            try:
-                                ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                            except (ValueError, TypeError):
-                                pass
+                        ts = parse_timestamp(data.get("timestamp"))
 
                         for item in content:
                             if isinstance(item, dict) and item.get("name") == "Task":
@@ -486,12 +481,12 @@ class ClaudeCodeProvider(SessionProvider):
     def get_session_messages(self, session: Session) -> list[dict]:
         messages = []
         try:
-            with open(session.raw_path) as f:
+            with open(session.raw_path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
                     if not line.strip():
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _json.loads(line)
                         msg_type = data.get("type")
                         
                         if msg_type not in ("user", "assistant"):
@@ -6,29 +6,27 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
+from .. import _json
 from ..cache import MetadataCache, SummaryCache, compute_content_hash
 from ..models import Session
 from . import register_provider
-from .base import SessionProvider, find_first_real_prompt, find_last_real_response
+from .base import (
+    READ_BUFFER_SIZE,
+    SessionProvider,
+    find_first_real_prompt,
+    find_last_real_response,
+    parse_timestamp,
+)
 
 
-SESSIONS_DIR = Path.home() / ".codex" / "sessions"
-SESSION_INDEX_PATH = Path.home() / ".codex" / "session_index.jsonl"
-
-
-def _parse_datetime(value: str | None) -> Optional[datetime]:
-    """Parse an ISO 8601 timestamp into a datetime."""
-    if not value:
-        return None
-    try:
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
-        return None
+_HOME = Path.home()
+SESSIONS_DIR = _HOME / ".codex" / "sessions"
+SESSION_INDEX_PATH = _HOME / ".codex" / "session_index.jsonl"
 
 
 def _parse_epoch_seconds(value: str | None) -> Optional[int]:
     """Parse an ISO 8601 timestamp into epoch seconds."""
-    dt = _parse_datetime(value)
+    dt = parse_timestamp(value)
     if not dt:
         return None
     return int(dt.timestamp())
@@ -133,17 +131,17 @@ def _parse_codex_file(path: Path) -> dict[str, Any]:
     model = "unknown"
 
     try:
-        with open(path) as f:
+        with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
             for line in f:
                 if not line.strip():
                     continue
 
                 try:
-                    row = json.loads(line)
+                    row = _json.loads(line)
                 except json.JSONDecodeError:
                     continue
 
-                row_timestamp = _parse_datetime(row.get("timestamp"))
+                row_timestamp = parse_timestamp(row.get("timestamp"))
                 if row_timestamp and (modified_time is None or row_timestamp > modified_time):
                     modified_time = row_timestamp
 
@@ -156,12 +154,12 @@ def _parse_codex_file(path: Path) -> dict[str, Any]:
                         if payload_id == path.stem:
                             session_meta = payload
                             session_meta_locked = True
-                            session_timestamp = _parse_datetime(payload.get("timestamp"))
+                            session_timestamp = parse_timestamp(payload.get("timestamp"))
                             if session_timestamp:
                                 created_time = session_timestamp
                         elif not session_meta and not session_meta_locked:
                             session_meta = payload
-                            session_timestamp = _parse_datetime(payload.get("timestamp"))
+                            session_timestamp = parse_timestamp(payload.get("timestamp"))
                             if session_timestamp:
                                 created_time = session_timestamp
 
@@ -276,8 +274,8 @@ class CodexProvider(SessionProvider):
 
     def _session_from_cache(self, path: Path, cached: dict[str, Any]) -> Session:
         """Construct a Session from cached metadata."""
-        created_time = _parse_datetime(cached.get("created_time"))
-        modified_time = _parse_datetime(cached.get("modified_time"))
+        created_time = parse_timestamp(cached.get("created_time"))
+        modified_time = parse_timestamp(cached.get("modified_time"))
         if not modified_time:
             try:
                 modified_time = datetime.fromtimestamp(path.stat().st_mtime)
@@ -314,12 +312,12 @@ class CodexProvider(SessionProvider):
     def parse_session(self, path: Path) -> Session | None:
         """Parse a Codex session JSONL file."""
         try:
-            mtime = path.stat().st_mtime
+            stat = path.stat()
         except OSError:
             return None
 
         cache = MetadataCache()
-        cached = cache.get(path, mtime)
+        cached = cache.get(path, stat.st_mtime_ns, stat.st_size)
         if cached:
             return self._session_from_cache(path, cached)
 
@@ -331,7 +329,7 @@ class CodexProvider(SessionProvider):
         session_meta = parsed["session_meta"]
         session_id = session_meta.get("id", path.stem)
         cwd = session_meta.get("cwd", "")
-        project_path = Path(cwd) if cwd else Path.home()
+        project_path = Path(cwd) if cwd else _HOME
         project_name = project_path.name or "Codex"
 
         user_messages = [(m["role"], m["content"]) for m in messages if m.get("role") == "user"]
@@ -359,7 +357,7 @@ class CodexProvider(SessionProvider):
         created_time = parsed["created_time"]
         modified_time = parsed["modified_time"]
         if modified_time is None:
-            modified_time = datetime.fromtimestamp(mtime)
+            modified_time = datetime.fromtimestamp(stat.st_mtime)
 
         extra = {
             "originator": session_meta.get("originator", ""),
@@ -387,7 +385,7 @@ class CodexProvider(SessionProvider):
             "content_hash": content_hash,
             "extra": extra,
         }
-        cache.set(path, mtime, metadata)
+        cache.set(path, stat.st_mtime_ns, stat.st_size, metadata)
 
         return Session(
             id=session_id,
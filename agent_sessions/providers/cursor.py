@@ -16,7 +16,8 @@ from .base import SessionProvider, detect_automated_session
 
 
 # Cursor stores data in VS Code-style SQLite databases
-CURSOR_DATA_DIR = Path.home() / "Library" / "Application Support" / "Cursor"
+_HOME = Path.home()
+CURSOR_DATA_DIR = _HOME / "Library" / "Application Support" / "Cursor"
 GLOBAL_STORAGE_DB = CURSOR_DATA_DIR / "User" / "globalStorage" / "state.vscdb"
 WORKSPACE_STORAGE_DIR = CURSOR_DATA_DIR / "User" / "workspaceStorage"
 
@@ -104,6 +105,7 @@ class CursorProvider(SessionProvider):
     icon = "⌘"
     color = "blue"
     fast_discovery = False
+    parallel_parse = False  # sessions share one (possibly copied) SQLite DB
 
     def get_sessions_dir(self) -> Path:
         return CURSOR_DATA_DIR
@@ -192,12 +194,12 @@ class CursorProvider(SessionProvider):
         cache = MetadataCache()
         # Use DB mtime as cache key since we can't stat virtual files
         try:
-            db_mtime = GLOBAL_STORAGE_DB.stat().st_mtime
+            db_stat = GLOBAL_STORAGE_DB.stat()
         except OSError:
             return None
 
         cache_key = CURSOR_DATA_DIR / "sessions" / f"{session_id}.cursor"
-        cached = cache.get(cache_key, db_mtime)
+        cached = cache.get(cache_key, db_stat.st_mtime_ns, db_stat.st_size)
         if cached:
             return self._session_from_cache(path, cached)
 
@@ -208,7 +210,7 @@ class CursorProvider(SessionProvider):
 
         first_prompt = ""
         last_response = ""
-        project_path = Path.home()
+        project_path = _HOME
         project_name = "Cursor"
         title = ""
         model = "unknown"
@@ -287,7 +289,7 @@ class CursorProvider(SessionProvider):
         title = first_line[:80] if first_line else "Cursor Session"
 
         # Use DB modification time
-        modified_time = datetime.fromtimestamp(db_mtime)
+        modified_time = datetime.fromtimestamp(db_stat.st_mtime)
 
         # Compute content hash
         content_hash = compute_content_hash(first_prompt, last_response)
@@ -314,7 +316,7 @@ class CursorProvider(SessionProvider):
             "model": model,
             "content_hash": content_hash,
         }
-        cache.set(cache_key, db_mtime, metadata)
+        cache.set(cache_key, db_stat.st_mtime_ns, db_stat.st_size, metadata)
 
         return Session(
             id=session_id,
@@ -1,19 +1,46 @@
 """Factory Droid session provider."""
 
+import bisect
 import json
+import os
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from .. import _json
 from ..cache import MetadataCache, SummaryCache, compute_content_hash
 from ..models import Session
 from . import register_provider
-from .base import SessionProvider, detect_automated_session, find_first_real_prompt, find_last_real_response
+from .base import (
+    READ_BUFFER_SIZE,
+    MessageTracker,
+    SessionProvider,
+    detect_automated_session,
+    find_last_real_response,
+    find_project_jsonl_files,
+    has_marker,
+    parse_timestamp,
+)
+
+
+_HOME = Path.home()
+SESSIONS_DIR = _HOME / ".factory" / "sessions"
+SUBAGENT_TITLE_PREFIX = "# Task Tool Invocation"
 
+# Raw-byte markers checked before json.loads so other records (tool output,
+# todo state, ...) are skipped without decoding or parsing them
+_MESSAGE_MARKERS = (b'"type":"message"', b'"type": "message"')
+_START_MARKERS = (b'"type":"session_start"', b'"type": "session_start"')
+_PARSE_MARKERS = _MESSAGE_MARKERS + _START_MARKERS
+_TASK_MARKER = b'"name":"Task"'
+# Once the first prompt is known, only these records still matter going forward
+_AFTER_HEAD_MARKERS = _START_MARKERS + (_TASK_MARKER,)
 
-SESSIONS_DIR = Path.home() / ".factory" / "sessions"
-SUBAGENT_TITLE_PREFIX = "# Task Tool Invocation"
+# Bytes read per step when scanning a session backwards for its last messages
+TAIL_BLOCK_SIZE = 256 * 1024
+_SUBAGENT_TYPE_RE = re.compile(r'Subagent type: ([a-zA-Z0-9_-]+)')
 
 
 def decode_path(encoded: str) -> str:
@@ -48,6 +75,79 @@ def extract_text_content(content, text_only: bool = False) -> str:
     return str(content)
 
 
+def _iter_lines_reversed(f):
+    """Yield the lines of a binary file from last to first, reading backwards in blocks."""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    remainder = b""
+    while pos > 0:
+        size = min(TAIL_BLOCK_SIZE, pos)
+        pos -= size
+        f.seek(pos)
+        lines = (f.read(size) + remainder).split(b"\n")
+        remainder = lines.pop(0)
+        yield from reversed(lines)
+    yield remainder
+
+
+def _message_from_line(line: bytes) -> Optional[tuple[str, str]]:
+    """Extract (role, text) from a user/assistant message line, or None."""
+    if not has_marker(line, _MESSAGE_MARKERS):
+        return None
+    try:
+        data = _json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if data.get("type") != "message":
+        return None
+    msg = data.get("message", {})
+    role = msg.get("role")
+    if role not in ("user", "assistant"):
+        return None
+    content = extract_text_content(msg.get("content", ""), text_only=(role == "user"))
+    if not content or "<system-reminder>" in content[:100]:
+        return None
+    return role, content
+
+
+def _last_messages(f) -> tuple[str, str]:
+    """Return (last prompt, last real response), reading from the end of the file.
+
+    The last messages usually sit near EOF, so only the tail is read and parsed.
+    """
+    newest_first = (m for m in map(_message_from_line, _iter_lines_reversed(f)) if m)
+    last_prompt = None
+
+    def assistant_messages():
+        nonlocal last_prompt
+        for role, content in newest_first:
+            if role == "assistant":
+                yield role, content
+            elif last_prompt is None:
+                last_prompt = content
+
+    last_response = find_last_real_response(assistant_messages(), newest_first=True)
+    if last_prompt is None:
+        last_prompt = next((content for role, content in newest_first if role == "user"), "")
+    return last_prompt, last_response
+
+
+def _task_invocations_in(content, ts: Optional[datetime]) -> list[dict]:
+    """Extract Task tool invocations from an assistant message's content list."""
+    invocations = []
+    for item in content:
+        if isinstance(item, dict) and item.get("name") == "Task":
+            inp = item.get("input", {})
+            subagent_type = inp.get("subagent_type", "")
+            if subagent_type:
+                invocations.append({
+                    "subagent_type": subagent_type,
+                    "timestamp": ts,
+                    "description": inp.get("description", "")
+                })
+    return invocations
+
+
 @register_provider
 class DroidProvider(SessionProvider):
     """Provider for Factory Droid sessions."""
@@ -57,26 +157,18 @@ class DroidProvider(SessionProvider):
     icon = "🤖"
     color = "green"
 
+    # (session list it was built from, snapshot of that list, sub-agent index)
+    _subagent_index_cache: Optional[tuple[list[Session], dict[str, tuple]]] = None
+
     def get_sessions_dir(self) -> Path:
         return SESSIONS_DIR
 
     def discover_session_files(self) -> list[Path]:
         """Discover all JSONL session files."""
-        files = []
-        sessions_dir = self.get_sessions_dir()
-        if not sessions_dir.exists():
-            return files
+        return find_project_jsonl_files(self.get_sessions_dir())
 
-        for project_dir in sessions_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-            for jsonl_file in project_dir.glob("*.jsonl"):
-                files.append(jsonl_file)
-
-        return files
-
-    def _session_from_cache(self, path: Path, cached: dict) -> Session:
-        """Construct Session from cached metadata."""
+    def _session_from_cache(self, path: Path, cached: dict, mtime: float | None = None) -> Session:
+        """Construct Session from cached metadata (mtime avoids a second stat)."""
         created_time = None
         if cached.get("created_time"):
             try:
@@ -84,17 +176,25 @@ class DroidProvider(SessionProvider):
             except (ValueError, TypeError):
                 pass
 
-        modified_time = datetime.fromtimestamp(path.stat().st_mtime)
+        if mtime is None:
+            mtime = os.stat(path).st_mtime
+        modified_time = datetime.fromtimestamp(mtime)
 
         # Get summary from summary cache
+        session_id = path.stem
         content_hash = cached.get("content_hash", "")
         summary = None
         if cached.get("first_prompt"):
             summary_cache = SummaryCache()
-            summary = summary_cache.get(path.stem, content_hash)
+            summary = summary_cache.get(session_id, content_hash)
+
+        extra = {"settings_path": cached.get("settings_path", "")}
+        if "task_invocations" in cached:
+            # Kept serialized; get_task_invocations() decodes them on first use
+            extra["cached_task_invocations"] = cached["task_invocations"]
 
         return Session(
-            id=path.stem,
+            id=session_id,
             harness=self.name,
             raw_path=path,
             project_path=Path(cached.get("project_path", "")),
@@ -110,24 +210,28 @@ class DroidProvider(SessionProvider):
             model=cached.get("model", "unknown"),
             summary=summary,
             content_hash=content_hash,
-            extra={"settings_path": cached.get("settings_path", "")},
+            extra=extra,
         )
 
     def parse_session(self, path: Path) -> Session | None:
         """Parse a Droid JSONL session file."""
-        settings_path = path.with_suffix(".settings.json")
-        project_dir = path.parent.name
+        # Plain string ops instead of pathlib: this runs once per session file
+        path_str = os.fspath(path)
+        head, name = os.path.split(path_str)
+        session_id = os.path.splitext(name)[0]
+        settings_path = os.path.join(head, session_id + ".settings.json")
+        project_dir = os.path.basename(head)
 
         # Check metadata cache first
         try:
-            mtime = path.stat().st_mtime
+            stat = os.stat(path_str)
         except OSError:
             return None
 
         cache = MetadataCache()
-        cached = cache.get(path, mtime)
+        cached = cache.get(path, stat.st_mtime_ns, stat.st_size)
         if cached:
-            return self._session_from_cache(path, cached)
+            return self._session_from_cache(path, cached, stat.st_mtime)
 
         # Defaults
         model = "unknown"
@@ -140,71 +244,75 @@ class DroidProvider(SessionProvider):
         is_subagent = False
         subagent_type = ""
 
-        # Load settings
-        if settings_path.exists():
-            try:
-                with open(settings_path) as f:
-                    settings = json.load(f)
-                    model = settings.get("model", "unknown")
-            except (json.JSONDecodeError, IOError):
-                pass
+        # Load settings (a missing file is just an OSError; no separate exists() stat)
+        try:
+            with open(settings_path) as f:
+                settings = json.load(f)
+                model = settings.get("model", "unknown")
+        except (json.JSONDecodeError, IOError):
+            pass
 
-        # Parse JSONL
+        # Parse JSONL (Task invocations are collected in the same pass)
         try:
-            messages = []
-            with open(path) as f:
+            messages = MessageTracker()
+            task_invocations: list[dict] = []
+            markers = _PARSE_MARKERS
+            with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
-                    if not line.strip():
+                    if not has_marker(line, markers):
                         continue
                     try:
-                        data = json.loads(line)
-                        if data.get("type") == "session_start":
+                        data = _json.loads(line)
+                        msg_type = data.get("type")
+                        if msg_type == "session_start":
                             title = data.get("title", data.get("sessionTitle", "Untitled"))[:80]
                             cwd = data.get("cwd", decode_path(project_dir))
 
                             # Detect sub-agent sessions
                             if title.startswith(SUBAGENT_TITLE_PREFIX):
                                 is_subagent = True
-                                match = re.search(r'Subagent type: ([a-zA-Z0-9_-]+)', title)
+                                match = _SUBAGENT_TYPE_RE.search(title)
                                 if match:
                                     subagent_type = match.group(1)
 
-                        elif data.get("type") == "message":
+                        elif msg_type == "message":
                             msg = data.get("message", {})
                             role = msg.get("role")
 
                             # Capture timestamp for first message
                             if created_time is None:
-                                ts = data.get("timestamp")
-                                if ts:
-                                    try:
-                                        created_time = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                                    except (ValueError, TypeError):
-                                        pass
-
-                            text_only = (role == "user")
-                            content = extract_text_content(msg.get("content", ""), text_only=text_only)
-                            if role in ("user", "assistant") and content:
-                                if "<system-reminder>" in content[:100]:
-                                    continue
-                                messages.append((role, content))
+                                created_time = parse_timestamp(data.get("timestamp"))
+
+                            raw_content = msg.get("content", "")
+                            if role == "assistant" and isinstance(raw_content, list) and _TASK_MARKER in line:
+                                task_invocations.extend(
+                                    _task_invocations_in(raw_content, parse_timestamp(data.get("timestamp")))
+                                )
+
+                            if markers is _AFTER_HEAD_MARKERS or role not in ("user", "assistant"):
+                                continue
+                            content = extract_text_content(raw_content, text_only=(role == "user"))
+                            if content and "<system-reminder>" not in content[:100]:
+                                messages.add(role, content)
+                                if messages.found_first_prompt:
+                                    # Remaining messages are only needed for the last
+                                    # prompt/response, which are read from the tail
+                                    markers = _AFTER_HEAD_MARKERS
                     except json.JSONDecodeError:
                         continue
 
-            user_messages = [(r, c) for r, c in messages if r == "user"]
-            assistant_messages = [(r, c) for r, c in messages if r == "assistant"]
-
-            if user_messages:
-                first_user_prompt = find_first_real_prompt(user_messages)
-                last_user_prompt = user_messages[-1][1]
-            if assistant_messages:
-                last_assistant_response = find_last_real_response(assistant_messages)
+                first_user_prompt = messages.first_prompt
+                if markers is _AFTER_HEAD_MARKERS:
+                    last_user_prompt, last_assistant_response = _last_messages(f)
+                else:
+                    last_user_prompt = messages.last_prompt
+                    last_assistant_response = messages.last_response
 
         except (IOError, Exception):
             return None
 
         # Skip empty sessions (no messages at all)
-        if not messages:
+        if not messages.count:
             return None
 
         # Detect automated/system sessions if not already a sub-agent
@@ -215,14 +323,14 @@ class DroidProvider(SessionProvider):
                 subagent_type = auto_type
 
         # Get modified time from file
-        modified_time = datetime.fromtimestamp(path.stat().st_mtime)
+        modified_time = datetime.fromtimestamp(stat.st_mtime)
 
         # Compute content hash and get cached summary
         content_hash = compute_content_hash(first_user_prompt, last_assistant_response)
         summary = None
         if first_user_prompt:
             summary_cache = SummaryCache()
-            summary = summary_cache.get(path.stem, content_hash)
+            summary = summary_cache.get(session_id, content_hash)
 
         # Build project path and name
         project_path = Path(cwd) if cwd else Path(decode_path(project_dir))
@@ -241,12 +349,16 @@ class DroidProvider(SessionProvider):
             "child_type": subagent_type,
             "model": model,
             "content_hash": content_hash,
-            "settings_path": str(settings_path),
+            "settings_path": settings_path,
+            "task_invocations": [
+                {**task, "timestamp": task["timestamp"].isoformat() if task["timestamp"] else None}
+                for task in task_invocations
+            ],
         }
-        cache.set(path, mtime, metadata)
+        cache.set(path, stat.st_mtime_ns, stat.st_size, metadata)
 
         return Session(
-            id=path.stem,
+            id=session_id,
             harness=self.name,
             raw_path=path,
             project_path=project_path,
@@ -262,9 +374,12 @@ class DroidProvider(SessionProvider):
             model=model,
             summary=summary,
             content_hash=content_hash,
-            extra={"settings_path": str(settings_path)},
+            extra={"settings_path": settings_path, "task_invocations": task_invocations},
         )
 
+    def clear_caches(self) -> None:
+        self._subagent_index_cache = None
+
     def get_resume_command(self, session: Session) -> str:
         return f"droid --resume {session.id}"
 
@@ -273,14 +388,25 @@ class DroidProvider(SessionProvider):
         if session.is_child:
             return []
 
+        # Collected while parsing the session; only re-read the file if missing
+        if "task_invocations" in session.extra:
+            return session.extra["task_invocations"]
+        if "cached_task_invocations" in session.extra:
+            invocations = [
+                {**task, "timestamp": parse_timestamp(task.get("timestamp"))}
+                for task in session.extra.pop("cached_task_invocations")
+            ]
+            session.extra["task_invocations"] = invocations
+            return invocations
+
         invocations = []
         try:
-            with open(session.raw_path) as f:
+            with open(session.raw_path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
-                    if '"name":"Task"' not in line:
+                    if _TASK_MARKER not in line:
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _json.loads(line)
                         if data.get("type") != "message":
                             continue
                         msg = data.get("message", {})
@@ -291,24 +417,8 @@ class DroidProvider(SessionProvider):
                         if not isinstance(content, list):
                             continue
 
-                        timestamp = data.get("timestamp")
-                        ts = None
-                        if timestamp:
-                            try:
-                                ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                            except (ValueError, TypeError):
-                                pass
-
-                        for item in content:
-                            if isinstance(item, dict) and item.get("name") == "Task":
-                                inp = item.get("input", {})
-                                subagent_type = inp.get("subagent_type", "")
-                                if subagent_type:
-                                    invocations.append({
-                                        "subagent_type": subagent_type,
-                                        "timestamp": ts,
-                                        "description": inp.get("description", "")
-                                    })
+                        ts = parse_timestamp(data.get("timestamp"))
+                        invocations.extend(_task_invocations_in(content, ts))
                     except json.JSONDecodeError:
                         continue
         except (IOError, Exception):
@@ -325,44 +435,85 @@ class DroidProvider(SessionProvider):
         if not task_invocations:
             return []
 
-        # Filter to only Droid sessions that are children
-        subagents = [s for s in all_sessions if s.harness == self.name and s.is_child]
+        index = self._get_subagent_index(all_sessions)
+        related: dict[int, Session] = {}  # keyed by position in all_sessions
 
-        related = []
-        for subagent in subagents:
-            if not subagent.child_type:
-                continue
+        def matches_fallback(subagent: Session) -> bool:
+            # Subagent was created during the parent session timeframe, in the same cwd
+            return bool(
+                subagent.modified_time and parent.modified_time
+                and subagent.modified_time >= parent.modified_time - timedelta(hours=2)
+                and subagent.project_path == parent.project_path
+            )
 
-            for task in task_invocations:
-                if task["subagent_type"] != subagent.child_type:
-                    continue
-
-                # Check timestamp proximity (within 60 seconds)
-                if task["timestamp"] and subagent.created_time:
-                    time_diff = abs((subagent.created_time - task["timestamp"]).total_seconds())
-                    if time_diff < 60:
-                        related.append(subagent)
-                        break
-                # Fallback: check if subagent was created during parent session timeframe
-                elif subagent.modified_time and parent.modified_time:
-                    if subagent.modified_time >= parent.modified_time - timedelta(hours=2):
-                        # Also check same cwd
-                        if subagent.project_path == parent.project_path:
-                            related.append(subagent)
-                            break
-
-        related.sort(key=lambda s: s.created_time or s.modified_time or datetime.min)
-        return related
+        for task in task_invocations:
+            entry = index.get(task["subagent_type"])
+            if entry is None:
+                continue
+            times, timed, untimed = entry
+
+            if task["timestamp"]:
+                # Timestamp proximity (within 60 seconds) via binary search
+                ts = task["timestamp"].timestamp()
+                lo = bisect.bisect_right(times, ts - 60)
+                hi = bisect.bisect_left(times, ts + 60)
+                for pos, subagent in timed[lo:hi]:
+                    related[pos] = subagent
+                fallback = untimed
+            else:
+                fallback = timed + untimed
+
+            for pos, subagent in fallback:
+                if pos not in related and matches_fallback(subagent):
+                    related[pos] = subagent
+
+        ordered = [related[pos] for pos in sorted(related)]
+        ordered.sort(key=lambda s: s.created_time or s.modified_time or datetime.min)
+        return ordered
+
+    def _get_subagent_index(self, all_sessions: list[Session]) -> dict[str, tuple]:
+        """Group Droid sub-agents by type, rebuilt only when the session list changes.
+
+        Each entry is (sorted created timestamps, matching (pos, session) pairs,
+        (pos, session) pairs without a created time).
+        """
+        # Reloads hand over a new list; holding it rules out id reuse.
+        # Edits to the same list must go through clear_caches().
+        cached = self._subagent_index_cache
+        if cached is not None and cached[0] is all_sessions:
+            return cached[1]
+
+        timed: dict[str, list[tuple[float, int, Session]]] = defaultdict(list)
+        untimed: dict[str, list[tuple[int, Session]]] = defaultdict(list)
+        for pos, s in enumerate(all_sessions):
+            if s.harness != self.name or not s.is_child or not s.child_type:
+                continue
+            if s.created_time:
+                timed[s.child_type].append((s.created_time.timestamp(), pos, s))
+            else:
+                untimed[s.child_type].append((pos, s))
+
+        index = {}
+        for child_type in timed.keys() | untimed.keys():
+            entries = sorted(timed.get(child_type, []), key=lambda e: e[:2])
+            index[child_type] = (
+                [e[0] for e in entries],
+                [(pos, s) for _, pos, s in entries],
+                untimed.get(child_type, []),
+            )
+
+        self._subagent_index_cache = (all_sessions, index)
+        return index
 
     def get_session_messages(self, session: Session) -> list[dict]:
         messages = []
         try:
-            with open(session.raw_path) as f:
+            with open(session.raw_path, "rb", buffering=READ_BUFFER_SIZE) as f:
                 for line in f:
-                    if not line.strip():
+                    if not has_marker(line, _MESSAGE_MARKERS):
                         continue
                     try:
-                        data = json.loads(line)
+                        data = _json.loads(line)
                         if data.get("type") != "message":
                             continue
                             
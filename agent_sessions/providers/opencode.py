@@ -1,6 +1,10 @@
 """OpenCode session provider."""
 
+import io
 import json
+import re
+import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -8,53 +12,123 @@ from typing import Optional
 from ..cache import MetadataCache, SummaryCache, compute_content_hash
 from ..models import Session
 from . import register_provider
-from .base import SessionProvider, detect_automated_session, find_first_real_prompt, find_last_real_response
+from .base import (
+    SessionProvider,
+    detect_automated_session,
+    find_first_real_prompt,
+    find_last_real_response,
+    scan_files,
+)
 
 
 # OpenCode stores data in XDG-style directories
-OPENCODE_STATE_DIR = Path.home() / ".local" / "state" / "opencode"
-OPENCODE_DATA_DIR = Path.home() / ".local" / "share" / "opencode"
+_HOME = Path.home()
+OPENCODE_STATE_DIR = _HOME / ".local" / "state" / "opencode"
+OPENCODE_DATA_DIR = _HOME / ".local" / "share" / "opencode"
 STORAGE_DIR = OPENCODE_DATA_DIR / "storage"
 MESSAGE_DIR = STORAGE_DIR / "message"
 PART_DIR = STORAGE_DIR / "part"
 SESSION_META_DIR = STORAGE_DIR / "session"
 
 
-def _get_session_metadata(session_id: str) -> dict | None:
-    """Load session metadata from the session directory.
-    
-    OpenCode stores session metadata in storage/session/{project_hash}/{session_id}.json
-    This includes parentID, title, permissions, and timestamps.
-    """
+# Many sessions share a project; reuse one interned Path per directory string
+_PROJECT_PATH_CACHE: dict[str, Path] = {}
+
+
+def _project_path(value: str) -> Path:
+    """Return a shared Path for a project directory string."""
+    path = _PROJECT_PATH_CACHE.get(value)
+    if path is None:
+        path = _PROJECT_PATH_CACHE.setdefault(sys.intern(value), Path(value))
+    return path
+
+
+# session_id -> its metadata file, once found (misses are retried next time)
+_SESSION_META_PATHS: dict[str, Path] = {}
+# metadata file -> (its st_mtime_ns, parsed metadata)
+_SESSION_META_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+def _find_session_metadata_file(session_id: str) -> Optional[Path]:
+    """Locate storage/session/{project_hash}/{session_id}.json."""
+    path = _SESSION_META_PATHS.get(session_id)
+    if path is not None:
+        return path
+    if not SESSION_META_DIR.exists():
+        return None
     for project_dir in SESSION_META_DIR.iterdir():
         if not project_dir.is_dir():
             continue
         session_file = project_dir / f"{session_id}.json"
         if session_file.exists():
-            try:
-                with open(session_file) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+            _SESSION_META_PATHS[session_id] = session_file
+            return session_file
     return None
 
 
+def _get_session_metadata(session_id: str) -> dict | None:
+    """Load session metadata from the session directory.
+    
+    OpenCode stores session metadata in storage/session/{project_hash}/{session_id}.json
+    This includes parentID, title, permissions, and timestamps.
+
+    Results are memoized on the metadata file's own mtime, so an edited title
+    or parentID is picked up; a missing file is looked for again each time.
+    """
+    session_file = _find_session_metadata_file(session_id)
+    if session_file is None:
+        return None
+    try:
+        mtime_ns = session_file.stat().st_mtime_ns
+    except OSError:
+        _SESSION_META_PATHS.pop(session_id, None)
+        return None
+
+    cached = _SESSION_META_CACHE.get(session_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    try:
+        with open(session_file) as f:
+            metadata = json.load(f)
+    except (json.JSONDecodeError, IOError):
+        return None
+    _SESSION_META_CACHE[session_file] = (mtime_ns, metadata)
+    return metadata
+
+
+def clear_metadata_cache() -> None:
+    """Drop memoized session metadata (e.g. before a reindex)."""
+    _SESSION_META_PATHS.clear()
+    _SESSION_META_CACHE.clear()
+
+
+# Child-type markers in priority order (first listed wins when several appear)
+_CHILD_TYPE_MARKERS = (
+    ("PROMETHEUS", "prometheus"),
+    ("SINGLE TASK ONLY", "single-task"),
+    ("OH-MY-OPENCODE", "oh-my-opencode"),
+    ("FILE-ANALYSIS", "file-analysis"),
+)
+_CHILD_TYPE_RE = re.compile(
+    "|".join(re.escape(marker) for marker, _ in _CHILD_TYPE_MARKERS), re.IGNORECASE
+)
+
+
 def _detect_child_type(first_prompt: str) -> str:
     """Detect child type from prompt content for display purposes."""
     if not first_prompt:
         return "worker"
-    
-    prompt_start = first_prompt[:500].upper()
-    
-    if "PROMETHEUS" in prompt_start:
-        return "prometheus"
-    elif "SINGLE TASK ONLY" in prompt_start:
-        return "single-task"
-    elif "OH-MY-OPENCODE" in prompt_start:
-        return "oh-my-opencode"
-    elif "FILE-ANALYSIS" in prompt_start or "Analyze this file" in first_prompt[:100]:
+
+    # Single scan collects every marker present; priority is applied afterwards
+    found = {m.upper() for m in _CHILD_TYPE_RE.findall(first_prompt[:500])}
+    if found:
+        for marker, child_type in _CHILD_TYPE_MARKERS:
+            if marker in found:
+                return child_type
+
+    if "Analyze this file" in first_prompt[:100]:
         return "file-analysis"
-    
+
     return "worker"
 
 
@@ -68,6 +142,9 @@ class OpenCodeProvider(SessionProvider):
     color = "magenta"
     fast_discovery = False
 
+    # (session list it was built from, snapshot of that list, children by parentID)
+    _children_index_cache: Optional[tuple[list[Session], dict[str, list[Session]]]] = None
+
     def get_sessions_dir(self) -> Path:
         return OPENCODE_DATA_DIR
 
@@ -114,7 +191,7 @@ class OpenCodeProvider(SessionProvider):
             id=cached.get("session_id", path.stem),
             harness=self.name,
             raw_path=path,
-            project_path=Path(cached.get("project_path", "")),
+            project_path=_project_path(cached.get("project_path", "")),
             project_name=cached.get("project_name", ""),
             title=cached.get("title", ""),
             first_prompt=cached.get("first_prompt", ""),
@@ -142,22 +219,23 @@ class OpenCodeProvider(SessionProvider):
 
         try:
             # Use the newest message file's mtime
-            message_files = list(message_session_dir.glob("*.json"))
+            message_files = list(scan_files(message_session_dir, ".json"))
             if not message_files:
                 return None
-            mtime = max(f.stat().st_mtime for f in message_files)
+            mtime_ns = max(entry.stat().st_mtime_ns for entry in message_files)
         except OSError:
             return None
 
-        # Check cache
+        # Check cache (message count stands in for file size)
         cache = MetadataCache()
-        cached = cache.get(path, mtime)
+        cached = cache.get(path, mtime_ns, len(message_files))
         if cached:
             return self._session_from_cache(path, cached)
 
-        # Parse messages to build session data
-        messages = []
-        project_path = Path.home()
+        # Pass 1: read message headers only (role, id, timing, project, model)
+        user_ids: list[str] = []
+        assistant_ids: list[str] = []
+        project_path = _HOME
         project_name = "OpenCode"
         model = "unknown"
         agent = ""
@@ -187,10 +265,10 @@ class OpenCodeProvider(SessionProvider):
                 # Get project path from first message
                 path_data = msg.get("path", {})
                 if path_data.get("root"):
-                    project_path = Path(path_data["root"])
+                    project_path = _project_path(path_data["root"])
                     project_name = project_path.name
                 elif path_data.get("cwd"):
-                    project_path = Path(path_data["cwd"])
+                    project_path = _project_path(path_data["cwd"])
                     project_name = project_path.name
 
                 # Get model/agent from assistant messages
@@ -200,25 +278,36 @@ class OpenCodeProvider(SessionProvider):
                     if msg.get("agent"):
                         agent = msg["agent"]
 
-                # Get message content from parts
                 msg_id = msg.get("id", "")
-                content = self._get_message_content(msg_id)
-                if content:
-                    messages.append((role, content))
+                if not msg_id:
+                    continue
+                if role == "user":
+                    user_ids.append(msg_id)
+                elif role == "assistant":
+                    assistant_ids.append(msg_id)
 
             except (json.JSONDecodeError, IOError, KeyError):
                 continue
 
-        if not messages:
-            return None
+        # Pass 2: read part files only for the messages that are actually used
+        contents: dict[str, str] = {}
+
+        def iter_contents(role: str, msg_ids):
+            for msg_id in msg_ids:
+                if msg_id not in contents:
+                    contents[msg_id] = self._get_message_content(msg_id)
+                if contents[msg_id]:
+                    yield role, contents[msg_id]
 
-        # Extract first user prompt and last response
-        user_messages = [(r, c) for r, c in messages if r == "user"]
-        assistant_messages = [(r, c) for r, c in messages if r == "assistant"]
+        # Truncate once here so the Session and the cache share one bounded string
+        first_prompt = find_first_real_prompt(iter_contents("user", user_ids))[:2000]
+        last_prompt = next(iter_contents("user", reversed(user_ids)), ("", ""))[1][:2000]
+        last_response = find_last_real_response(
+            iter_contents("assistant", reversed(assistant_ids)), newest_first=True
+        )[:2000]
 
-        first_prompt = find_first_real_prompt(user_messages) if user_messages else ""
-        last_prompt = user_messages[-1][1] if user_messages else ""
-        last_response = find_last_real_response(assistant_messages) if assistant_messages else ""
+        if not first_prompt and not last_response:
+            return None
 
         # Load session metadata for parent-child relationship and title
         session_meta = _get_session_metadata(session_id)
@@ -229,8 +318,8 @@ class OpenCodeProvider(SessionProvider):
             parent_id = session_meta.get("parentID")
             session_title = session_meta.get("title", "")
             # Use directory from metadata if not found in messages
-            if project_path == Path.home() and session_meta.get("directory"):
-                project_path = Path(session_meta["directory"])
+            if project_path == _HOME and session_meta.get("directory"):
+                project_path = _project_path(session_meta["directory"])
                 project_name = project_path.name
         
         # Determine if this is a child session based on parentID from metadata
@@ -277,9 +366,9 @@ class OpenCodeProvider(SessionProvider):
             "project_path": str(project_path),
             "project_name": project_name,
             "title": title,
-            "first_prompt": first_prompt[:2000],
-            "last_prompt": last_prompt[:2000],
-            "last_response": last_response[:2000],
+            "first_prompt": first_prompt,
+            "last_prompt": last_prompt,
+            "last_response": last_response,
             "created_time": created_time.isoformat() if created_time else None,
             "modified_time": modified_time.isoformat() if modified_time else None,
             "is_child": is_child,
@@ -289,7 +378,7 @@ class OpenCodeProvider(SessionProvider):
             "content_hash": content_hash,
             "extra": {"agent": agent},
         }
-        cache.set(path, mtime, metadata)
+        cache.set(path, mtime_ns, len(message_files), metadata)
 
         return Session(
             id=session_id,
@@ -322,17 +411,24 @@ class OpenCodeProvider(SessionProvider):
         if not part_msg_dir.exists():
             return ""
 
-        texts = []
+        buf = io.StringIO()
+        sep = ""
         for part_file in sorted(part_msg_dir.glob("*.json")):
             try:
                 with open(part_file) as f:
                     part = json.load(f)
                 if part.get("type") == "text" and part.get("text"):
-                    texts.append(part["text"])
+                    buf.write(sep)
+                    buf.write(part["text"])
+                    sep = "\n"
             except (json.JSONDecodeError, IOError):
                 continue
 
-        return "\n".join(texts)
+        return buf.getvalue()
+
+    def clear_caches(self) -> None:
+        clear_metadata_cache()
+        self._children_index_cache = None
 
     def get_resume_command(self, session: Session) -> str:
         return f"opencode --session {session.id}"
@@ -341,16 +437,29 @@ class OpenCodeProvider(SessionProvider):
         """Find child sessions that have this session as their parent."""
         if parent.is_child:
             return []
-        
+
+        return list(self._get_children_index(all_sessions).get(parent.id, []))
+
+    def _get_children_index(self, all_sessions: list[Session]) -> dict[str, list[Session]]:
+        """Group OpenCode sessions by parentID, rebuilt only when the session list changes."""
+        # Reloads hand over a new list; holding it rules out id reuse.
+        # Edits to the same list must go through clear_caches().
+        cached = self._children_index_cache
+        if cached is not None and cached[0] is all_sessions:
+            return cached[1]
+
         # OpenCode uses explicit parentID in session metadata
-        children = [
-            s for s in all_sessions
-            if s.harness == self.name and s.parent_id == parent.id
-        ]
-        
+        index: dict[str, list[Session]] = defaultdict(list)
+        for s in all_sessions:
+            if s.harness == self.name and s.parent_id:
+                index[s.parent_id].append(s)
+
         # Sort by created time
-        children.sort(key=lambda s: s.created_time or s.modified_time or datetime.min)
-        return children
+        for children in index.values():
+            children.sort(key=lambda s: s.created_time or s.modified_time or datetime.min)
+
+        self._children_index_cache = (all_sessions, dict(index))
+        return self._children_index_cache[1]
 
     def discover_sessions_fast(self) -> dict[str, int]:
         if not MESSAGE_DIR.exists():
@@ -361,9 +470,8 @@ class OpenCodeProvider(SessionProvider):
             if not session_dir.is_dir() or not session_dir.name.startswith("ses_"):
                 continue
             try:
-                message_files = list(session_dir.glob("*.json"))
-                if message_files:
-                    max_mtime = max(int(f.stat().st_mtime) for f in message_files)
+                max_mtime = max((int(entry.stat().st_mtime) for entry in scan_files(session_dir, ".json")), default=None)
+                if max_mtime is not None:
                     result[session_dir.name] = max_mtime
             except OSError:
                 continue
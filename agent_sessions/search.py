@@ -1,11 +1,18 @@
 """Search functionality for sessions."""
 
 import json
+import mmap
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+import numpy as np
 
 from .models import SearchResult, Session
+from .providers.base import READ_BUFFER_SIZE
 
 if TYPE_CHECKING:
     pass
@@ -47,46 +54,61 @@ def parse_search_query(query: str) -> tuple[str, dict]:
         (clean_query, filters_dict)
     """
     filters = {}
+    remaining = []
+    # One clock read per query so before:/after: share the same "now"
+    now = datetime.now()
+
+    # One pass over whitespace-separated tokens; only known keys are modifiers,
+    # so text like "http://host" or "note:" stays part of the query
+    for token in query.split():
+        key, sep, value = token.partition(":")
+        key = key.lower()
+        convert = _MODIFIERS.get(key) if sep and value else None
+        if convert is None:
+            remaining.append(token)
+        else:
+            filters[key] = convert(value, now)
 
-    # Extract modifiers
-    modifier_pattern = r'(\w+):(\S+)'
-    modifiers = re.findall(modifier_pattern, query)
+    return " ".join(remaining), filters
 
-    for key, value in modifiers:
-        key = key.lower()
-        if key == 'harness':
-            filters['harness'] = value.lower()
-        elif key == 'project':
-            filters['project'] = value
-        elif key == 'before':
-            filters['before'] = parse_date_value(value)
-        elif key == 'after':
-            filters['after'] = parse_date_value(value)
-
-    # Remove modifiers from query
-    clean_query = re.sub(modifier_pattern, '', query).strip()
-
-    return clean_query, filters
-
-
-def parse_date_value(value: str) -> datetime | None:
-    """Parse a date value (ISO date or relative like '7d', '1h')."""
-    # Relative time patterns
-    relative_match = re.match(r'^(\d+)([dhwm])$', value.lower())
-    if relative_match:
-        amount = int(relative_match.group(1))
-        unit = relative_match.group(2)
+
+def parse_date_value(value: str, now: datetime | None = None) -> datetime | None:
+    """Parse a date value (ISO date or relative like '7d', '1h').
+
+    Relative values count back from now, read from the clock if not given.
+    """
+    # Only "now" varies between calls; the parsing itself is memoized
+    if now is None:
         now = datetime.now()
+    delta = _relative_delta(value)
+    if delta is not None:
+        return now - delta
+    return _absolute_date(value, now.year)
+
+
+_RELATIVE_DATE_RE = re.compile(r'^(\d+)([dhwm])$')
 
-        if unit == 'h':
-            return now - timedelta(hours=amount)
-        elif unit == 'd':
-            return now - timedelta(days=amount)
-        elif unit == 'w':
-            return now - timedelta(weeks=amount)
-        elif unit == 'm':
-            return now - timedelta(days=amount * 30)
+# Relative-date unit -> span of one unit ('m' is a 30-day month)
+_UNIT_DELTAS = {
+    'h': timedelta(hours=1),
+    'd': timedelta(days=1),
+    'w': timedelta(weeks=1),
+    'm': timedelta(days=30),
+}
 
+
+@lru_cache(maxsize=256)
+def _relative_delta(value: str) -> timedelta | None:
+    """How far back a relative value ('7d', '24h', '2w', '3m') reaches, or None."""
+    relative_match = _RELATIVE_DATE_RE.match(value.lower())
+    if not relative_match:
+        return None
+    return int(relative_match.group(1)) * _UNIT_DELTAS[relative_match.group(2)]
+
+
+@lru_cache(maxsize=256)
+def _absolute_date(value: str, year: int) -> datetime | None:
+    """Parse an absolute date; year fills in formats that omit it."""
     # ISO date format
     try:
         return datetime.fromisoformat(value)
@@ -99,7 +121,7 @@ def parse_date_value(value: str) -> datetime | None:
             dt = datetime.strptime(value, fmt)
             # If no year, use current year
             if dt.year == 1900:
-                dt = dt.replace(year=datetime.now().year)
+                dt = dt.replace(year=year)
             return dt
         except ValueError:
             continue
@@ -107,8 +129,165 @@ def parse_date_value(value: str) -> datetime | None:
     return None
 
 
-def search_session_file(session: Session, query: str, max_results: int = 50) -> list[SearchResult]:
-    """Search a session's file for query matches, returning results with context."""
+# Modifier key -> converter for (value, now); one dict lookup per token
+_MODIFIERS = {
+    "harness": lambda value, now: value.lower(),
+    "project": lambda value, now: value,
+    "before": parse_date_value,
+    "after": parse_date_value,
+}
+
+
+# ASCII-only lowercase table for scanning raw JSONL bytes in C
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+@lru_cache(maxsize=32)
+def _byte_needle(query_lower: str) -> bytes | None:
+    """Compile a lowercased query into the raw-byte needle for _candidate_lines.
+
+    Computed once per query rather than once per searched file. Returns None
+    when the query cannot be matched reliably against raw bytes (non-ASCII,
+    or characters JSON would escape).
+    """
+    if not query_lower.isascii() or any(c in query_lower for c in '"\\') or not query_lower.isprintable():
+        return None
+    return query_lower.encode("ascii")
+
+
+def _candidate_lines(
+    path: Path, query_lower: str, on_read: Callable[[bytes], None] | None = None
+) -> list[bytes] | None:
+    """Return the raw JSONL lines whose bytes contain the query (ASCII case-insensitive).
+
+    Returns None when the query has no byte needle; callers then parse every line.
+    on_read, if given, receives the file's ASCII-lowercased bytes.
+    """
+    needle = _byte_needle(query_lower)
+    if needle is None:
+        return None
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            if on_read is not None:
+                on_read(b"")
+            return []
+    with mm:
+        if on_read is None and query_lower == query_lower.upper():
+            # No letters: case is irrelevant, so scan the mapping in place
+            # and reject non-matching files without copying them
+            if mm.find(needle) < 0:
+                return []
+            raw = lowered = mm[:]
+        else:
+            raw = mm[:]
+            lowered = raw.translate(_ASCII_LOWER)
+    if on_read is not None:
+        on_read(lowered)
+
+    lines = []
+    pos = lowered.find(needle)
+    while pos >= 0:
+        start = lowered.rfind(b"\n", 0, pos) + 1
+        end = lowered.find(b"\n", pos)
+        if end < 0:
+            end = len(lowered)
+        lines.append(raw[start:end])
+        pos = lowered.find(needle, end)
+    return lines
+
+
+def _message_from_line(line: str | bytes) -> tuple[str, str] | None:
+    """Extract (role, content) from a Droid or Claude Code JSONL line."""
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    # Handle both Droid format (type=message) and Claude Code format (type=user/assistant)
+    msg_type = data.get("type")
+    if msg_type == "message":
+        msg = data.get("message", {})
+        role = msg.get("role", "")
+    elif msg_type in ("user", "assistant"):
+        msg = data.get("message", {})
+        role = msg.get("role", msg_type)
+    else:
+        return None
+    if role not in ("user", "assistant"):
+        return None
+    content = extract_text_content(msg.get("content", ""), text_only=(role == "user"))
+    if content and "<system-reminder>" not in content[:100]:
+        return role, content
+    return None
+
+
+def _matching_lines(content: str, query_lower: str):
+    """Yield (line_num, line, 2 lines before, 2 lines after) for lines containing the query.
+
+    Matches are located with str.find on the lowercased text and only the
+    matched lines and their context are sliced out, so long messages are
+    not split into a full line list.
+    """
+    # For ASCII text, lowercasing only maps A-Z, so a message holding neither
+    # case of the query's first character can be skipped without lowering it
+    first = query_lower[:1]
+    if first and content.isascii() and first not in content and first.upper() not in content:
+        return
+    content_lower = content.lower()
+    pos = content_lower.find(query_lower)
+    if pos < 0:
+        return
+    if len(content_lower) != len(content) or "\n" in query_lower:
+        # Lowercasing changed some lengths, so offsets don't line up: split instead
+        lines = content.split("\n")
+        for line_num, line_lower in enumerate(content_lower.split("\n")):
+            if query_lower in line_lower:
+                yield line_num, lines[line_num], lines[max(0, line_num-2):line_num], lines[line_num+1:line_num+3]
+        return
+
+    line_num = 0
+    counted_to = 0
+    while pos >= 0:
+        start = content.rfind("\n", 0, pos) + 1
+        end = content.find("\n", pos)
+        if end < 0:
+            end = len(content)
+        line_num += content.count("\n", counted_to, start)
+        counted_to = start
+
+        before = []
+        b_start = start
+        while b_start > 0 and len(before) < 2:
+            b_end = b_start - 1
+            b_start = content.rfind("\n", 0, b_end) + 1
+            before.append(content[b_start:b_end])
+        before.reverse()
+
+        after = []
+        a_end = end
+        while a_end < len(content) and len(after) < 2:
+            a_start = a_end + 1
+            a_end = content.find("\n", a_start)
+            if a_end < 0:
+                a_end = len(content)
+            after.append(content[a_start:a_end])
+
+        yield line_num, content[start:end], before, after
+        pos = content_lower.find(query_lower, end)
+
+
+def search_session_file(
+    session: Session,
+    query: str,
+    max_results: int = 50,
+    on_read: Callable[[bytes], None] | None = None,
+) -> list[SearchResult]:
+    """Search a session's file for query matches, returning results with context.
+
+    on_read is passed through to _candidate_lines to observe the bytes scanned.
+    """
     results = []
     query_lower = query.lower()
 
@@ -117,59 +296,72 @@ def search_session_file(session: Session, query: str, max_results: int = 50) ->
         return results
 
     try:
-        with open(session.raw_path) as f:
-            all_messages = []
-            for line in f:
-                if not line.strip():
-                    continue
-                try:
-                    data = json.loads(line)
-                    # Handle both Droid format (type=message) and Claude Code format (type=user/assistant)
-                    msg_type = data.get("type")
-                    if msg_type == "message":
-                        msg = data.get("message", {})
-                        role = msg.get("role", "")
-                        if role in ("user", "assistant"):
-                            content = extract_text_content(msg.get("content", ""), text_only=(role == "user"))
-                            if content and "<system-reminder>" not in content[:100]:
-                                all_messages.append((role, content))
-                    elif msg_type in ("user", "assistant"):
-                        msg = data.get("message", {})
-                        role = msg.get("role", msg_type)
-                        if role in ("user", "assistant"):
-                            content = extract_text_content(msg.get("content", ""), text_only=(role == "user"))
-                            if content and "<system-reminder>" not in content[:100]:
-                                all_messages.append((role, content))
-                except json.JSONDecodeError:
-                    continue
-
-            # Search through messages
-            for idx, (role, content) in enumerate(all_messages):
-                if query_lower in content.lower():
-                    lines = content.split("\n")
-                    for line_num, line in enumerate(lines):
-                        if query_lower in line.lower():
-                            context_before = lines[max(0, line_num-2):line_num]
-                            context_after = lines[line_num+1:line_num+3]
-
-                            results.append(SearchResult(
-                                session=session,
-                                role=role,
-                                match_text=line,
-                                context_before=context_before,
-                                context_after=context_after,
-                                line_num=line_num
-                            ))
-
-                            if len(results) >= max_results:
-                                return results
+        # Only lines whose raw bytes contain the query can yield a match
+        raw_lines = _candidate_lines(session.raw_path, query_lower, on_read)
+        if raw_lines is None:
+            with open(session.raw_path, buffering=READ_BUFFER_SIZE) as f:
+                raw_lines = f.readlines()
+
+        all_messages = []
+        for line in raw_lines:
+            if not line.strip():
+                continue
+            message = _message_from_line(line)
+            if message:
+                all_messages.append(message)
+
+        # Search through messages
+        for idx, (role, content) in enumerate(all_messages):
+            for line_num, line, context_before, context_after in _matching_lines(content, query_lower):
+                results.append(SearchResult(
+                    session=session,
+                    role=role,
+                    match_text=line,
+                    context_before=context_before,
+                    context_after=context_after,
+                    line_num=line_num
+                ))
+
+                if len(results) >= max_results:
+                    return results
     except (IOError, Exception):
         pass
 
     return results
 
 
-def search_sessions(sessions: list[Session], query: str) -> dict[str, list[SearchResult]]:
+# Per-session trigram filter size in bits (8 KB packed)
+TRIGRAM_FILTER_BITS = 1 << 16
+_TRIGRAM_CHUNK = 1 << 22  # bytes hashed per numpy pass, bounding temporary memory
+
+
+def _trigram_hashes(data: bytes) -> np.ndarray:
+    """Filter bit index of every 3-byte window in data."""
+    arr = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+    codes = (arr[:-2] << 16) | (arr[1:-1] << 8) | arr[2:]
+    # Multiplicative hash; uint32 arithmetic wraps, the top 16 bits pick the slot
+    return (codes * np.uint32(2654435761)) >> np.uint32(16)
+
+
+def _trigram_filter(lowered: bytes) -> np.ndarray:
+    """Packed bit set of the trigrams in ASCII-lowercased file bytes."""
+    bits = np.zeros(TRIGRAM_FILTER_BITS, dtype=bool)
+    view = memoryview(lowered)
+    # Zero-copy slices overlapping by two bytes, so no window is missed at a seam
+    for start in range(0, len(view) - 2, _TRIGRAM_CHUNK):
+        bits[_trigram_hashes(view[start:start + _TRIGRAM_CHUNK + 2])] = True
+    return np.packbits(bits, bitorder="little")
+
+
+def _may_contain(packed: np.ndarray, needle: bytes) -> bool:
+    """False only if some trigram of needle is certainly absent from the filter."""
+    if len(needle) < 3:
+        return True
+    slots = _trigram_hashes(needle)
+    return bool(np.all(packed[slots >> 3] & (1 << (slots & 7)).astype(np.uint8)))
+
+
+def search_sessions(sessions: Iterable[Session], query: str) -> dict[str, list[SearchResult]]:
     """Search all sessions and return results grouped by session ID."""
     results_by_session = {}
 
@@ -188,6 +380,98 @@ class SearchEngine:
         self.sessions = sessions
         self._index_built = False
 
+        # Filter indexes, built in one pass; lists keep the sessions' order
+        self._by_harness: dict[str, list[Session]] = defaultdict(list)
+        # Project name -> lowercased, once per distinct project
+        self._project_lower: dict[str, str] = {}
+        # id(session) -> position in sessions, for the index-aligned columns
+        self._positions: dict[int, int] = {}
+        for pos, session in enumerate(sessions):
+            self._by_harness[session.harness].append(session)
+            if session.project_name not in self._project_lower:
+                self._project_lower[session.project_name] = session.project_name.lower()
+            self._positions[id(session)] = pos
+        # Modified times as epoch seconds, index-aligned with sessions (NaN when
+        # unknown); epoch seconds also compare naive and UTC-aware times alike
+        self._mtimes = np.array(
+            [s.modified_time.timestamp() if s.modified_time else np.nan for s in sessions],
+            dtype=np.float64,
+        )
+        # session id -> ((mtime_ns, size), packed trigram filter)
+        self._trigram_filters: dict[str, tuple[tuple[int, int], np.ndarray]] = {}
+
+    def _scan_targets(
+        self, sessions: Iterable[Session], query: str
+    ) -> Iterator[tuple[Session, Callable[[bytes], None] | None]]:
+        """Yield the sessions worth scanning, each with an on_read hook or None.
+
+        A session with an up-to-date trigram filter is skipped when the filter
+        rules the query out. Otherwise it is scanned, and the hook builds its
+        filter from the bytes that scan reads, so no file is read twice.
+        False positives fall through to the scan.
+        """
+        needle = _byte_needle(query.lower())
+        if needle is None or len(needle) < 3:
+            for session in sessions:
+                yield session, None
+            return
+
+        for session in sessions:
+            if session.raw_path.suffix != ".jsonl":
+                continue  # search_session_file only reads JSONL
+            try:
+                st = session.raw_path.stat()
+            except OSError:
+                continue
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._trigram_filters.get(session.id)
+            if cached is not None and cached[0] == key:
+                if _may_contain(cached[1], needle):
+                    yield session, None
+                continue
+            yield session, self._filter_recorder(session.id, key)
+
+    def _filter_recorder(self, session_id: str, key: tuple[int, int]) -> Callable[[bytes], None]:
+        """Hook that stores a session's trigram filter from its scanned bytes."""
+        def record(lowered: bytes) -> None:
+            self._trigram_filters[session_id] = (key, _trigram_filter(lowered))
+        return record
+
+    def filter_by_harness(self, harness: str) -> list[Session]:
+        """Sessions from one harness."""
+        return self._by_harness.get(harness, [])
+
+    def filter_by_project(self, project: str, sessions: Iterable[Session] | None = None) -> Iterator[Session]:
+        """Lazily yield sessions whose project name contains project (case-insensitive).
+
+        Filters sessions (default: all of them), so filters can be chained.
+        """
+        project = project.lower()
+        names = {name for name, lower in self._project_lower.items() if project in lower}
+        return (s for s in (self.sessions if sessions is None else sessions) if s.project_name in names)
+
+    def filter_by_date(
+        self,
+        before: datetime | None = None,
+        after: datetime | None = None,
+        sessions: Iterable[Session] | None = None,
+    ) -> Iterator[Session]:
+        """Lazily yield sessions modified strictly between after and before.
+
+        Unknown times never match. Filters sessions (default: all of them),
+        which must come from this engine.
+        """
+        in_range = ~np.isnan(self._mtimes)
+        if after:
+            in_range &= self._mtimes > after.timestamp()
+        if before:
+            in_range &= self._mtimes < before.timestamp()
+        if sessions is None:
+            return (self.sessions[i] for i in np.flatnonzero(in_range))
+        keep = in_range.tolist()
+        positions = self._positions
+        return (s for s in sessions if keep[positions[id(s)]])
+
     def search(
         self,
         query: str,
@@ -214,26 +498,23 @@ class SearchEngine:
         before = parsed_filters.get('before', before)
         after = parsed_filters.get('after', after)
 
-        # Apply filters
-        filtered = self.sessions
-
-        if harness:
-            filtered = [s for s in filtered if s.harness == harness]
-
-        if project:
-            filtered = [s for s in filtered if project.lower() in s.project_name.lower()]
-
-        if before:
-            filtered = [s for s in filtered if s.modified_time and s.modified_time < before]
-
-        if after:
-            filtered = [s for s in filtered if s.modified_time and s.modified_time > after]
-
         # If no search text, return empty (filters alone don't search)
         if not clean_query:
             return {}
 
-        return search_sessions(filtered, clean_query)
+        # Chain the prebuilt-index filters lazily; _scan_targets consumes them in one pass
+        candidates: Iterable[Session] = self.filter_by_harness(harness) if harness else self.sessions
+        if project:
+            candidates = self.filter_by_project(project, candidates)
+        if before or after:
+            candidates = self.filter_by_date(before, after, candidates)
+
+        results_by_session = {}
+        for session, on_read in self._scan_targets(candidates, clean_query):
+            results = search_session_file(session, clean_query, on_read=on_read)
+            if results:
+                results_by_session[session.id] = results
+        return results_by_session
 
     def get_matching_sessions(self, results: dict[str, list[SearchResult]]) -> list[Session]:
         """Get unique sessions from search results, ordered by match count."""
@@ -1,15 +1,32 @@
 """UI components for Agent Sessions."""
 
-from .widgets import (
-    ParentSessionItem,
-    SubagentSessionItem,
-    SessionDetailPanel,
-)
-from .styles import APP_CSS
+from importlib import import_module
+
+# Public name -> submodule that defines it. Resolved on first access so that
+# importing agent_sessions.ui does not pull in Textual/Rich until needed.
+_LAZY = {
+    "PagedListView": "widgets",
+    "ParentSessionItem": "widgets",
+    "SubagentSessionItem": "widgets",
+    "SessionDetailPanel": "widgets",
+    "APP_CSS": "styles",
+}
 
 __all__ = [
+    "PagedListView",
     "ParentSessionItem",
     "SubagentSessionItem",
     "SessionDetailPanel",
     "APP_CSS",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
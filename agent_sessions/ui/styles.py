@@ -1,109 +1,17 @@
 """CSS styles for Agent Sessions TUI."""
 
-APP_CSS = """
-Screen {
-    layout: horizontal;
-}
+from functools import lru_cache
+from importlib.resources import files
 
-#left-container {
-    width: 55%;
-    height: 100%;
-}
 
-#parent-container {
-    height: 60%;
-    border: solid $primary;
-}
+@lru_cache(maxsize=1)
+def load_app_css() -> str:
+    """Read the bundled stylesheet once per process."""
+    return files(__package__).joinpath("styles.tcss").read_text(encoding="utf-8")
 
-#subagent-container {
-    height: 40%;
-    border: solid $warning;
-}
 
-#detail-container {
-    width: 45%;
-    height: 100%;
-    border: solid $secondary;
-    padding: 1;
-}
-
-#parent-list, #subagent-list {
-    height: 1fr;
-}
-
-.list-header {
-    height: auto;
-    background: $surface;
-    padding: 0 1;
-    text-style: bold;
-}
-
-#parent-header {
-    color: $primary;
-}
-
-#subagent-header {
-    color: $warning;
-}
-
-#search-input {
-    display: none;
-    height: 3;
-    border: solid $warning;
-    padding: 0 1;
-}
-
-#search-input.visible {
-    display: block;
-}
-
-#detail-panel {
-    height: 100%;
-    overflow-y: auto;
-    scrollbar-gutter: stable;
-}
-
-#detail-panel:focus {
-    border: solid $success;
-}
-
-#transcript-text {
-    height: 1fr;
-    border: none;
-    padding: 0;
-    background: transparent;
-}
-
-#transcript-find-bar {
-    dock: bottom;
-    height: 3;
-    border: solid $accent;
-    background: $surface;
-    padding: 0 1;
-}
-
-ParentSessionItem, SubagentSessionItem {
-    height: 1;
-    padding: 0 1;
-}
-
-ParentSessionItem:hover, SubagentSessionItem:hover {
-    background: $surface-lighten-1;
-}
-
-ListView:focus > ListItem.-active {
-    background: $primary-darken-1;
-}
-
-ListView.-has-focus > ListItem.-active {
-    background: $primary;
-}
-
-#subagent-container.dimmed {
-    opacity: 0.5;
-}
-
-Footer {
-    background: $surface;
-}
-"""
+def __getattr__(name: str) -> str:
+    # APP_CSS is resolved on first access so importing this module stays cheap
+    if name == "APP_CSS":
+        return load_app_css()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,17 @@
 """UI widgets for Agent Sessions TUI."""
 
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, Optional
 
-from rich.text import Text
+from rich.control import strip_control_codes
+from rich.style import Style
+from rich.text import Span, Text
 from textual.app import ComposeResult
+from textual.await_remove import AwaitRemove
 from textual.containers import ScrollableContainer
 from textual.binding import Binding
-from textual.widgets import Input, ListItem, Static, TextArea
+from textual.widgets import Input, ListItem, ListView, Static, TextArea
 from textual.widgets.text_area import Selection
 
 from ..models import Session
@@ -49,11 +54,79 @@ def find_all_matches(haystack: str, needle: str) -> list[int]:
     return out
 
 
+# Parsed once here instead of resolving a style string per span at render time
+_BOLD = Style.parse("bold")
+_DIM = Style.parse("dim")
+_CYAN = Style.parse("cyan")
+_GREEN = Style.parse("green")
+_MAGENTA = Style.parse("magenta")
+_YELLOW = Style.parse("yellow")
+_WHITE = Style.parse("white")
+_BOLD_CYAN = Style.parse("bold cyan")
+_BOLD_GREEN = Style.parse("bold green")
+_BOLD_MAGENTA = Style.parse("bold magenta")
+_BOLD_YELLOW = Style.parse("bold yellow")
+_BOLD_WHITE = Style.parse("bold white")
+_DIM_WHITE = Style.parse("dim white")
+_RESUME_COMMAND = Style.parse("bold white on blue")
+
+# Transcript message borders
+MESSAGE_RULE_WIDTH = 40
+_MESSAGE_FOOTER_RULE = "─" * MESSAGE_RULE_WIDTH
+
+
+@lru_cache(maxsize=64)
+def _rule(width: int) -> str:
+    """Horizontal rule of the given width (label widths repeat, so cache them)."""
+    return "─" * width
+
+
+_ELLIPSIS = "..."
+
+
 def truncate(text: str, max_len: int = 100) -> str:
     """Truncate text with ellipsis."""
     if len(text) <= max_len:
         return text
-    return text[:max_len - 3] + "..."
+    if max_len <= 3:
+        return _ELLIPSIS[:max_len]
+    return text[:max_len - 3] + _ELLIPSIS
+
+
+# List descriptions are re-truncated to the same few widths on every resize
+_truncate_cached = lru_cache(maxsize=4096)(truncate)
+
+
+def append_bordered(
+    text: Text,
+    body: str,
+    bar_style: Style | str,
+    style: Style | str = "",
+    limit: int | None = None,
+) -> None:
+    """Append body with a styled "│ " bar before every line.
+
+    The block is appended as a single run and the bars are added as spans,
+    instead of two Text.append calls per line. Bodies longer than limit are
+    cut and followed by a "... (truncated)" line.
+    """
+    truncated = limit is not None and len(body) > limit
+    if truncated:
+        body = body[:limit]
+    block = "│ " + strip_control_codes(body).replace("\n", "\n│ ") + "\n"
+    offset = len(text)
+    text.append(block, style=style)
+    # Every newline except the final one is followed by a bar
+    spans = [Span(offset, offset + 2, bar_style)]
+    last = len(block) - 1
+    i = block.find("\n")
+    while i < last:
+        spans.append(Span(offset + i + 1, offset + i + 3, bar_style))
+        i = block.find("\n", i + 1)
+    text.spans.extend(spans)
+    if truncated:
+        text.append("│ ", style=bar_style)
+        text.append("... (truncated)\n", style=_DIM)
 
 
 class TranscriptArea(TextArea):
@@ -91,106 +164,247 @@ class TranscriptFindBar(Input):
     ]
 
 
-class ParentSessionItem(ListItem):
-    """List item for parent sessions."""
+class _SessionListItem(ListItem):
+    """List item whose text is rebuilt to fit its width."""
 
-    def __init__(self, session: Session, child_count: int = 0):
+    RESIZE_DEBOUNCE = 0.05  # seconds to coalesce resize events
+
+    def __init__(self, session: Session):
         super().__init__()
         self.session = session
-        self.child_count = child_count
         self._static: Optional[Static] = None
+        self._last_width: int = -1  # width of the last rendered text
+        self._resize_timer = None
+        self._shown: bool = False  # text is built once the item is first on screen
 
     def compose(self) -> ComposeResult:
-        self._static = Static(self._build_text(100))
+        self._static = Static("")
         yield self._static
 
+    def render_lines(self, crop):
+        # Only called for items inside the viewport, so offscreen rows never
+        # build their Rich Text until they are scrolled to
+        if not self._shown:
+            self._shown = True
+            self._render_width(self.size.width or 100)
+        return super().render_lines(crop)
+
     def on_resize(self, event) -> None:
-        """Update text when resized."""
-        if self._static:
-            self._static.update(self._build_text(self.size.width))
+        """Update text when resized, coalescing bursts of resize events."""
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+            self._resize_timer = None
+        if self._last_width < 0:
+            # First layout: render immediately so the item never shows stale width
+            self._render_width(self.size.width)
+        elif self.size.width != self._last_width:
+            self._resize_timer = self.set_timer(self.RESIZE_DEBOUNCE, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_timer = None
+        self._render_width(self.size.width)
+
+    def _render_width(self, width: int) -> None:
+        """Rebuild the text for a width, skipping no-op resizes."""
+        if not self._shown or not self._static or width == self._last_width:
+            return
+        self._last_width = width
+        self._static.update(self._build_text(width))
 
     def _build_text(self, width: int) -> Text:
-        """Build the display text based on available width."""
-        date_str = self.session.modified_time.strftime("%m-%d %H:%M") if self.session.modified_time else "??-?? ??:??"
-        project = self.session.project_name
+        """Build the display text based on available width.
+
+        Plain prompt line by default; subclasses add their prefix and styling.
+        """
+        return Text(_truncate_cached(self.session.prompt_line, max(20, width)))
+
+
+@lru_cache(maxsize=4096)
+def _parent_prefix(date_str: str, icon: str, project: str, child_count: int) -> tuple[Text, int]:
+    """Styled date/harness/project prefix of a parent row and the width it takes.
+
+    Shared between items (callers copy it), so re-populating the list after a
+    filter or search change doesn't re-style rows it has already shown.
+    """
+    parts = [
+        (date_str, _CYAN),
+        (" │ ", _DIM),
+        (f"{icon} ", _BOLD),
+        (project, _GREEN),
+        (" │ ", _DIM),
+    ]
+
+    # Width consumed before the description column
+    prefix_width = 36  # date(11) + sep(3) + icon(2) + project(12) + sep(3) + padding(5)
+    if child_count > 0:
+        count_str = f"({child_count}) "
+        parts.append((count_str, _BOLD_YELLOW))
+        prefix_width += len(count_str)
+
+    return Text.assemble(*parts), prefix_width
 
-        # Get provider icon
-        provider = get_provider(self.session.harness)
-        icon = provider.icon if provider else "?"
 
+class ParentSessionItem(_SessionListItem):
+    """List item for parent sessions."""
+
+    def __init__(self, session: Session, child_count: int = 0):
+        super().__init__(session)
+        self.child_count = child_count
+        provider = get_provider(session.harness)
+        self._icon = provider.icon if provider else "?"
+        # Width-independent parts, built lazily by _build_prefix()
+        self._prefix_text: Optional[Text] = None
+        self._prefix_width: int = 0
+        self._description: str = ""
+        self._desc_style: Style | str = ""
+
+    def _build_description(self) -> None:
+        """Pick the description text; only this changes when a summary arrives."""
         # Prefer AI summary over raw prompt
         summary = self.session.summary
         if summary:
-            description = summary
-            desc_style = "bold white"
+            self._description = summary.replace("\n", " ").strip()
+            self._desc_style = _BOLD_WHITE
         else:
-            description = self.session.first_prompt or self.session.title or "(no prompt)"
-            desc_style = "dim white"
-        description = description.replace("\n", " ").strip()
-
-        text = Text()
-        text.append(f"{date_str}", style="cyan")
-        text.append(" │ ", style="dim")
-        text.append(f"{icon} ", style="bold")
-        text.append(f"{project[:12]:<12}", style="green")
-        text.append(" │ ", style="dim")
-
-        # Calculate remaining width for description
-        prefix_width = 36  # date(11) + sep(3) + icon(2) + project(12) + sep(3) + padding(5)
-        if self.child_count > 0:
-            count_str = f"({self.child_count}) "
-            text.append(count_str, style="yellow bold")
-            prefix_width += len(count_str)
-
-        desc_width = max(20, width - prefix_width)
-        text.append(truncate(description, desc_width), style=desc_style)
+            self._description = self.session.prompt_line
+            self._desc_style = _DIM_WHITE
+
+    def _build_prefix(self) -> None:
+        """Build the width-independent prefix and description once."""
+        self._build_description()
+        self._prefix_text, self._prefix_width = _parent_prefix(
+            self.session.modified_short, self._icon, self.session.project_short, self.child_count
+        )
 
+    def _build_text(self, width: int) -> Text:
+        """Build the display text based on available width."""
+        if self._prefix_text is None:
+            self._build_prefix()
+        text = self._prefix_text.copy()
+        desc_width = max(20, width - self._prefix_width)
+        text.append(_truncate_cached(self._description, desc_width), style=self._desc_style)
         return text
 
     def refresh_text(self):
         """Refresh the display text (call after summary is generated)."""
-        if self._static:
-            self._static.update(self._build_text(self.size.width))
+        self._build_description()
+        self._last_width = -1
+        self._render_width(self.size.width)
 
 
-class SubagentSessionItem(ListItem):
+class SubagentSessionItem(_SessionListItem):
     """List item for sub-agent sessions."""
 
     def __init__(self, session: Session, is_highlighted: bool = False):
-        super().__init__()
-        self.session = session
+        super().__init__(session)
         self.is_highlighted = is_highlighted
-        self._static: Optional[Static] = None
-
-    def compose(self) -> ComposeResult:
-        self._static = Static(self._build_text(100))
-        yield self._static
-
-    def on_resize(self, event) -> None:
-        """Update text when resized."""
-        if self._static:
-            self._static.update(self._build_text(self.size.width))
+        self._description = session.prompt_line if session.first_prompt else "(no prompt)"
 
     def _build_text(self, width: int) -> Text:
         """Build the display text based on available width."""
-        text = Text()
-
-        if self.is_highlighted:
-            text.append("★ ", style="yellow bold")
-        else:
-            text.append("  ", style="dim")
-
-        text.append(f"{self.session.child_type:<18}", style="cyan bold")
-        text.append(" │ ", style="dim")
-
         prefix_width = 27  # star(2) + type(18) + sep(3) + padding(4)
         desc_width = max(20, width - prefix_width)
+        return Text.assemble(
+            ("★ ", _BOLD_YELLOW) if self.is_highlighted else ("  ", _DIM),
+            (f"{self.session.child_type:<18}", _BOLD_CYAN),
+            (" │ ", _DIM),
+            (_truncate_cached(self._description, desc_width), _WHITE),
+        )
 
-        desc = self.session.first_prompt or "(no prompt)"
-        desc = desc.replace("\n", " ").strip()
-        text.append(truncate(desc, desc_width), style="white")
 
-        return text
+class PagedListView(ListView):
+    """ListView that mounts its items a page at a time.
+
+    Only the first page is mounted by set_items(); the next page is mounted
+    when the cursor or scroll position nears the end of what is mounted, so
+    long session lists don't pay to mount rows nobody scrolls to.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending: Iterator[ListItem] = iter(())
+        # Mounted items in order; clear() detaches old rows asynchronously, so
+        # children can briefly hold both and can't be used for positions
+        self._mounted: list[ListItem] = []
+        self._by_session_id: dict[str, int] = {}
+        self._clearing: Optional[AwaitRemove] = None
+        self._awaiting_layout = False  # max_scroll_y is stale until the new page is laid out
+
+    def set_items(self, items: Iterable[ListItem]) -> None:
+        """Replace the list contents; items may be a lazy iterable."""
+        self._clearing = self.clear()
+        self._mounted = []
+        self._by_session_id = {}
+        self._pending = iter(items)
+        self.load_more()
+
+    def load_more(self, count: Optional[int] = None) -> bool:
+        """Mount the next page (or count items). Returns False when none are left."""
+        page = list(islice(self._pending, count or self.PAGE_SIZE))
+        self._mount_page(page)
+        return bool(page)
+
+    def load_all(self) -> None:
+        """Mount every remaining item (e.g. before jumping to the end)."""
+        self._mount_page(list(self._pending))
+
+    def item_for(self, session_id: str) -> Optional[ListItem]:
+        """The mounted item showing a session, if any."""
+        index = self._by_session_id.get(session_id)
+        return self._mounted[index] if index is not None else None
+
+    def index_for(self, session_id: str) -> Optional[int]:
+        """List index of the mounted item showing a session, if any."""
+        return self._by_session_id.get(session_id)
+
+    def select_session(self, session_id: Optional[str]) -> None:
+        """Highlight a session's row, or the first row, once the old rows are gone.
+
+        Setting index straight after set_items() would count the replaced
+        rows that are still waiting to be detached.
+        """
+        self.call_later(self._select_session, session_id)
+
+    async def _select_session(self, session_id: Optional[str]) -> None:
+        if self._clearing is not None:
+            await self._clearing
+        if not self._mounted:
+            return
+        index = self.index_for(session_id) if session_id is not None else None
+        self.index = index or 0
+
+    def _mount_page(self, page: list[ListItem]) -> None:
+        if page:
+            for item in page:
+                session = getattr(item, "session", None)
+                if session is not None:
+                    self._by_session_id[session.id] = len(self._mounted)
+                self._mounted.append(item)
+            self.mount(*page)
+            self._awaiting_layout = True
+            self.call_after_refresh(self._layout_done)
+
+    def _layout_done(self) -> None:
+        self._awaiting_layout = False
+
+    def validate_index(self, index: Optional[int]) -> Optional[int]:
+        """Clamp to the rows set_items() mounted, not ones still being detached."""
+        index = super().validate_index(index)
+        if index is None or not self._mounted:
+            return None
+        return min(index, len(self._mounted) - 1)
+
+    def watch_index(self, old_index: Optional[int], new_index: Optional[int]) -> None:
+        super().watch_index(old_index, new_index)
+        if new_index is not None and new_index >= len(self._mounted) - self.PAGE_SIZE // 4:
+            self.load_more()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if not self._awaiting_layout and new_value >= self.max_scroll_y - self.size.height:
+            self.load_more()
 
 
 class SessionDetailPanel(ScrollableContainer, can_focus=True):
@@ -199,11 +413,19 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
     EDGE_ZONE = 5  # lines from edge to trigger auto-scroll
     SCROLL_INTERVAL = 0.03  # seconds between scroll ticks
     SCROLL_BASE = 4  # minimum lines per tick
+    MESSAGE_BATCH = 32  # transcript messages rendered per Static
+    SECTION_CACHE_SIZE = 128  # sessions whose detail sections are kept
 
     def __init__(self, id: str = None):
         super().__init__(id=id)
         self.session: Optional[Session] = None
         self._transcript_messages: list[Text] = []
+        self._message_batch: Optional[Text] = None
+        self._message_batch_size: int = 0
+        self._message_static: Optional[Static] = None
+        self._section_cache: dict[str, tuple[tuple, tuple[Text, Text, Text]]] = {}
+        self._annotation_cache: dict[str, list[dict]] = {}
+        self._text_cache: dict[str, tuple[tuple, Text]] = {}
         self._dragging: bool = False
         self._scroll_direction: int = 0  # -1 up, 0 none, 1 down
         self._scroll_speed: int = 0
@@ -244,14 +466,13 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
             self._stop_auto_scroll()
 
     def _start_auto_scroll(self, direction: int, speed: int = 4) -> None:
-        if self._scroll_direction == direction and self._scroll_speed == speed:
-            return
-        self._stop_auto_scroll()
+        # Keep one running timer; each tick reads the latest direction/speed
         self._scroll_direction = direction
         self._scroll_speed = speed
-        self._auto_scroll_timer = self.set_interval(
-            self.SCROLL_INTERVAL, self._do_auto_scroll
-        )
+        if self._auto_scroll_timer is None:
+            self._auto_scroll_timer = self.set_interval(
+                self.SCROLL_INTERVAL, self._do_auto_scroll
+            )
 
     def _stop_auto_scroll(self) -> None:
         self._scroll_direction = 0
@@ -278,13 +499,15 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
     def update(self, text: Text) -> None:
         """Update the content (replaces all content)."""
         self._exit_transcript_mode()
-        for child in list(self.children):
-            child.remove()
-        self._transcript_messages = []
-        self.mount(Static(text, markup=False))
+        # One layout pass for the swap instead of one per removed child
+        with self.app.batch_update():
+            self.remove_children()
+            self._transcript_messages = []
+            self.mount(Static(text, markup=False))
 
     def write(self, text: Text) -> None:
         """Append a text block."""
+        self._message_static = None  # later messages go below this block
         self.mount(Static(text, markup=False))
 
     def write_message(self, text: Text) -> None:
@@ -292,18 +515,30 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
         self._transcript_messages.append(text)
         if self._in_transcript_mode:
             self._transcript_buf += text.plain
+            return
+        # Grow one Static per MESSAGE_BATCH messages rather than one per message
+        if self._message_static is None or self._message_batch_size >= self.MESSAGE_BATCH:
+            self._message_batch = text.copy()
+            self._message_batch_size = 1
+            self._message_static = Static(self._message_batch, markup=False)
+            self.mount(self._message_static)
         else:
-            self.mount(Static(text, markup=False))
+            self._message_batch.append_text(text)
+            self._message_batch_size += 1
+            self._message_static.update(self._message_batch)
 
     def clear(self) -> None:
         """Clear all content."""
         self._exit_transcript_mode()
-        for child in list(self.children):
-            child.remove()
+        with self.app.batch_update():
+            self.remove_children()
         self._transcript_messages = []
 
     def _exit_transcript_mode(self) -> None:
         self.close_find()
+        self._message_batch = None
+        self._message_batch_size = 0
+        self._message_static = None
         self._in_transcript_mode = False
         self._transcript_area = None
         self._transcript_buf = ""
@@ -401,39 +636,35 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
         """Get plain text of all transcript messages for clipboard."""
         return "\n".join(t.plain for t in self._transcript_messages)
 
-    def show_session(
-        self,
-        session: Session,
-        child_count: int = 0,
-        match_snippet: str | None = None,
-        match_source: str | None = None,
-    ):
-        """Update display with session info."""
-        self.session = session
-        provider = get_provider(session.harness)
+    def _session_sections(self, session: Session) -> tuple[Text, Text, Text]:
+        """Return the cached parts of show_session that only depend on the session.
 
-        text = Text()
+        Sub-agent count, annotations and search match are added per call.
+        """
+        key = (session.content_hash, session.modified_time, session.title, session.model)
+        cached = self._section_cache.get(session.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        text.append("━━━ Session Details ━━━\n", style="bold cyan")
-        text.append("\n")
+        provider = get_provider(session.harness)
+
+        head = Text()
+        head.append("━━━ Session Details ━━━\n", style=_BOLD_CYAN)
+        head.append("\n")
 
         # Harness badge
-        text.append("Harness: ", style="bold")
+        head.append("Harness: ", style=_BOLD)
         icon = provider.icon if provider else "?"
         display_name = provider.display_name if provider else session.harness
-        text.append(f"{icon} {display_name}\n", style="cyan bold")
+        head.append(f"{icon} {display_name}\n", style=_BOLD_CYAN)
 
+        head.append("Type: ", style=_BOLD)
         if session.is_child:
-            text.append("Type: ", style="bold")
-            text.append("SUB-AGENT\n", style="yellow bold")
-            text.append("Agent: ", style="bold")
-            text.append(f"{session.child_type}\n", style="cyan bold")
+            head.append("SUB-AGENT\n", style=_BOLD_YELLOW)
+            head.append("Agent: ", style=_BOLD)
+            head.append(f"{session.child_type}\n", style=_BOLD_CYAN)
         else:
-            text.append("Type: ", style="bold")
-            text.append("PARENT SESSION\n", style="green bold")
-            if child_count > 0:
-                text.append("Sub-agents: ", style="bold")
-                text.append(f"{child_count}\n", style="yellow")
+            head.append("PARENT SESSION\n", style=_BOLD_GREEN)
 
         # Display title
         display_title = session.title
@@ -442,112 +673,160 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
         elif not session.title or session.title == "New Session":
             display_title = session.project_name
 
-        text.append("Title: ", style="bold")
-        text.append(f"{truncate(display_title, 50)}\n")
-        text.append("Path: ", style="bold")
-        text.append(f"{session.project_path}\n", style="dim")
-        text.append("Date: ", style="bold")
-        if session.modified_time:
-            text.append(f"{session.modified_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        meta = Text.assemble(
+            ("Title: ", _BOLD),
+            f"{truncate(display_title, 50)}\n",
+            ("Path: ", _BOLD),
+            (f"{session.project_path}\n", _DIM),
+            ("Date: ", _BOLD),
+            f"{session.modified_long}\n" if session.modified_time else ("Unknown\n", _DIM),
+            ("Model: ", _BOLD),
+            (f"{session.model}\n", _YELLOW),
+            ("Session ID: ", _BOLD),
+            (f"{session.id}\n", _DIM),
+        )
+
+        body = Text()
+        body.append("\n")
+
+        # Original prompt
+        body.append("┌─ First Prompt ────────────────────────\n", style=_BOLD_GREEN)
+        if session.first_prompt:
+            append_bordered(body, session.first_prompt, _GREEN, limit=2000)
+        else:
+            body.append("│ ", style=_GREEN)
+            body.append("(no prompt found)\n", style=_DIM)
+        body.append("└───────────────────────────────────────\n", style=_GREEN)
+        body.append("\n")
+
+        # Last response
+        max_resp = 1000 if session.is_child else 2000
+        body.append("┌─ Last Response ────────────────────────\n", style=_BOLD_MAGENTA)
+        if session.last_response:
+            append_bordered(body, session.last_response, _MAGENTA, limit=max_resp)
+        else:
+            body.append("│ ", style=_MAGENTA)
+            body.append("(no response found)\n", style=_DIM)
+        body.append("└───────────────────────────────────────\n", style=_MAGENTA)
+        body.append("\n")
+
+        # Resume command
+        body.append("━━━ Resume Command ━━━\n", style=_BOLD_YELLOW)
+        body.append("\n")
+        resume_cmd = provider.get_resume_command(session) if provider else f"# Resume not available for {session.harness}"
+        body.append(f" {resume_cmd} ", style=_RESUME_COMMAND)
+        body.append("\n\n")
+        body.append("Press ", style=_DIM)
+        body.append("Enter", style=_BOLD)
+        body.append(" to copy | ", style=_DIM)
+        body.append("r", style=_BOLD)
+        body.append(" to resume | ", style=_DIM)
+        body.append("Tab", style=_BOLD)
+        body.append(" switch panes", style=_DIM)
+
+        if len(self._section_cache) >= self.SECTION_CACHE_SIZE:
+            self._section_cache.clear()
+        sections = (head, meta, body)
+        self._section_cache[session.id] = (key, sections)
+        return sections
+
+    def _annotations(self, session_id: str) -> list[dict]:
+        """Annotations for a session, queried once and reused on later highlights."""
+        annotations = self._annotation_cache.get(session_id)
+        if annotations is None:
+            from ..index.database import SessionDatabase
+            annotations = SessionDatabase().get_annotations(session_id)
+            if len(self._annotation_cache) >= self.SECTION_CACHE_SIZE:
+                self._annotation_cache.clear()
+            self._annotation_cache[session_id] = annotations
+        return annotations
+
+    def forget_annotations(self, session_id: str | None = None):
+        """Drop cached annotations for one session (or all) after they change."""
+        if session_id is None:
+            self._annotation_cache.clear()
         else:
-            text.append("Unknown\n", style="dim")
-        text.append("Model: ", style="bold")
-        text.append(f"{session.model}\n", style="yellow")
-        text.append("Session ID: ", style="bold")
-        text.append(f"{session.id}\n", style="dim")
+            self._annotation_cache.pop(session_id, None)
+
+    def forget_session(self, session_id: str):
+        """Drop everything rendered for a session so the next show rebuilds it."""
+        self._section_cache.pop(session_id, None)
+        self._text_cache.pop(session_id, None)
+
+    def show_session(
+        self,
+        session: Session,
+        child_count: int = 0,
+        match_snippet: str | None = None,
+        match_source: str | None = None,
+    ):
+        """Update display with session info."""
+        self.session = session
+        sections = self._session_sections(session)
+        annotations = self._annotations(session.id)
+
+        # Re-highlighting a session reuses its last Text when nothing changed;
+        # the cached sections and annotations are compared by identity
+        cached = self._text_cache.get(session.id)
+        if (
+            cached is not None
+            and cached[0][0] is sections
+            and cached[0][1] is annotations
+            and cached[0][2:] == (child_count, match_snippet, match_source)
+        ):
+            self.update(cached[1])
+            return
+
+        head, meta, body = sections
+        text = head.copy()
+        if not session.is_child and child_count > 0:
+            text.append("Sub-agents: ", style=_BOLD)
+            text.append(f"{child_count}\n", style=_YELLOW)
+        text.append_text(meta)
 
         # Annotations
-        from ..index.database import SessionDatabase
-        annotations = SessionDatabase().get_annotations(session.id)
         if annotations:
             text.append("\n")
-            text.append("┌─ Annotations ─────────────────────────\n", style="bold yellow")
+            text.append("┌─ Annotations ─────────────────────────\n", style=_BOLD_YELLOW)
             tags = [a for a in annotations if a["type"] == "tag"]
             notes = [a for a in annotations if a["type"] == "note"]
             if tags:
-                text.append("│ ", style="yellow")
-                text.append("Tags: ", style="bold")
+                text.append("│ ", style=_YELLOW)
+                text.append("Tags: ", style=_BOLD)
                 for i, tag in enumerate(tags):
                     if i > 0:
-                        text.append("  ", style="dim")
-                    text.append(f"[{tag['value']}]", style="bold cyan")
+                        text.append("  ", style=_DIM)
+                    text.append(f"[{tag['value']}]", style=_BOLD_CYAN)
                 text.append("\n")
             for note in notes:
-                text.append("│ ", style="yellow")
+                text.append("│ ", style=_YELLOW)
                 ts_display = note.get("ts", "")[:16].replace("T", " ") if note.get("ts") else ""
                 if ts_display:
-                    text.append(f"{ts_display} ", style="dim")
-                text.append(f"{note['value']}\n", style="white")
-            text.append("└───────────────────────────────────────\n", style="yellow")
+                    text.append(f"{ts_display} ", style=_DIM)
+                text.append(f"{note['value']}\n", style=_WHITE)
+            text.append("└───────────────────────────────────────\n", style=_YELLOW)
 
         if match_snippet:
             source = match_source or "search"
             text.append("\n")
-            text.append("┌─ Search Match ────────────────────────\n", style="bold cyan")
-            text.append("│ ", style="cyan")
-            text.append("Source: ", style="bold")
-            text.append(f"{source}\n", style="yellow")
-            for line in match_snippet.split("\n"):
-                text.append("│ ", style="cyan")
-                text.append(f"{line}\n", style="white")
-            text.append("└───────────────────────────────────────\n", style="cyan")
-
-        text.append("\n")
-
-        # Original prompt
-        text.append("┌─ First Prompt ────────────────────────\n", style="bold green")
-        if session.first_prompt:
-            prompt_text = session.first_prompt[:2000]
-            for pl in prompt_text.split("\n"):
-                text.append("│ ", style="green")
-                text.append(f"{pl}\n")
-            if len(session.first_prompt) > 2000:
-                text.append("│ ", style="green")
-                text.append("... (truncated)\n", style="dim")
-        else:
-            text.append("│ ", style="green")
-            text.append("(no prompt found)\n", style="dim")
-        text.append("└───────────────────────────────────────\n", style="green")
-        text.append("\n")
-
-        # Last response
-        max_resp = 1000 if session.is_child else 2000
-        text.append("┌─ Last Response ────────────────────────\n", style="bold magenta")
-        if session.last_response:
-            resp_text = session.last_response[:max_resp]
-            for rl in resp_text.split("\n"):
-                text.append("│ ", style="magenta")
-                text.append(f"{rl}\n")
-            if len(session.last_response) > max_resp:
-                text.append("│ ", style="magenta")
-                text.append("... (truncated)\n", style="dim")
-        else:
-            text.append("│ ", style="magenta")
-            text.append("(no response found)\n", style="dim")
-        text.append("└───────────────────────────────────────\n", style="magenta")
-        text.append("\n")
-
-        # Resume command
-        text.append("━━━ Resume Command ━━━\n", style="bold yellow")
-        text.append("\n")
-        resume_cmd = provider.get_resume_command(session) if provider else f"# Resume not available for {session.harness}"
-        text.append(f" {resume_cmd} ", style="bold white on blue")
-        text.append("\n\n")
-        text.append("Press ", style="dim")
-        text.append("Enter", style="bold")
-        text.append(" to copy | ", style="dim")
-        text.append("r", style="bold")
-        text.append(" to resume | ", style="dim")
-        text.append("Tab", style="bold")
-        text.append(" switch panes", style="dim")
-
+            text.append("┌─ Search Match ────────────────────────\n", style=_BOLD_CYAN)
+            text.append("│ ", style=_CYAN)
+            text.append("Source: ", style=_BOLD)
+            text.append(f"{source}\n", style=_YELLOW)
+            append_bordered(text, match_snippet, _CYAN, style=_WHITE)
+            text.append("└───────────────────────────────────────\n", style=_CYAN)
+
+        text.append_text(body)
+
+        if len(self._text_cache) >= self.SECTION_CACHE_SIZE:
+            self._text_cache.clear()
+        self._text_cache[session.id] = ((sections, annotations, child_count, match_snippet, match_source), text)
         self.update(text)
 
     def show_full_transcript_start(self, session: Session, total: int):
         """Start streaming a full transcript using a selectable TextArea."""
         self.session = session
-        for child in list(self.children):
-            child.remove()
+        self.remove_children()
         self._transcript_messages = []
         self._in_transcript_mode = True
 
@@ -580,11 +859,11 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
             self._transcript_ready = True
         else:
             text = Text()
-            text.append("━━━ End of Transcript ━━━\n", style="bold cyan")
-            text.append("c", style="bold")
-            text.append(" copy all | ", style="dim")
-            text.append("Escape", style="bold")
-            text.append(" back", style="dim")
+            text.append("━━━ End of Transcript ━━━\n", style=_BOLD_CYAN)
+            text.append("c", style=_BOLD)
+            text.append(" copy all | ", style=_DIM)
+            text.append("Escape", style=_BOLD)
+            text.append(" back", style=_DIM)
             self.write(text)
 
     @staticmethod
@@ -595,24 +874,22 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
 
         if role == "user":
             label = f"┌─ [{i}] User "
-            style = "bold green"
-            border_style = "green"
+            style = _BOLD_GREEN
+            border_style = _GREEN
         else:
             label = f"┌─ [{i}] Assistant "
-            style = "bold magenta"
-            border_style = "magenta"
+            style = _BOLD_MAGENTA
+            border_style = _MAGENTA
 
         text = Text()
         text.append(label, style=style)
-        text.append("─" * max(1, 40 - len(label)), style=border_style)
+        text.append(_rule(max(1, MESSAGE_RULE_WIDTH - len(label))), style=border_style)
         text.append("\n")
 
-        for line in content.split("\n"):
-            text.append("│ ", style=border_style)
-            text.append(f"{line}\n")
+        append_bordered(text, content, border_style)
 
         text.append("└", style=border_style)
-        text.append("─" * 40, style=border_style)
+        text.append(_MESSAGE_FOOTER_RULE, style=border_style)
         text.append("\n\n")
 
         return text
@@ -620,5 +897,5 @@ class SessionDetailPanel(ScrollableContainer, can_focus=True):
     def clear_display(self):
         """Clear the display."""
         self.session = None
-        text = Text("Select a session to view details", style="dim")
+        text = Text("Select a session to view details", style=_DIM)
         self.update(text)
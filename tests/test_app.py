@@ -0,0 +1,152 @@
+"""Tests for AgentSessionsBrowser session bookkeeping."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from agent_sessions.app import AgentSessionsBrowser
+from agent_sessions.models import Session
+from agent_sessions.ui.widgets import PagedListView, ParentSessionItem
+
+
+def _session(sid: str, *, is_child=False, harness="droid", project="/p", modified=None, parent_id=None) -> Session:
+    return Session(
+        id=sid,
+        harness=harness,
+        raw_path=Path(f"/tmp/{sid}.jsonl"),
+        project_path=Path(project),
+        project_name=Path(project).name,
+        is_child=is_child,
+        modified_time=modified,
+        parent_id=parent_id,
+    )
+
+
+class TestRelatedChildren:
+    def test_time_window_matching(self):
+        """Children match by harness/project within the harness time window."""
+        t0 = datetime(2024, 1, 15, 12, 0)
+        app = AgentSessionsBrowser()
+        parent = _session("parent", modified=t0)
+        app.all_sessions = [
+            parent,
+            _session("near", is_child=True, modified=t0 - timedelta(minutes=30)),
+            _session("edge", is_child=True, modified=t0 + timedelta(hours=2)),
+            _session("far", is_child=True, modified=t0 - timedelta(hours=3)),
+            _session("other-project", is_child=True, project="/q", modified=t0),
+            _session("other-harness", is_child=True, harness="codex", modified=t0),
+            _session("untimed", is_child=True),
+        ]
+        app._apply_harness_filter()
+
+        assert [c.id for c in app._get_related_children(parent)] == ["near"]
+        assert app._compute_child_counts([parent]) == {"parent": 1}
+
+    def test_explicit_parent_links_win(self):
+        """Explicit parent_id links are used instead of the time heuristic."""
+        t0 = datetime(2024, 1, 15, 12, 0)
+        app = AgentSessionsBrowser()
+        parent = _session("parent", modified=t0)
+        app.all_sessions = [
+            parent,
+            _session("linked", is_child=True, modified=t0 - timedelta(days=3), parent_id="parent"),
+            _session("near", is_child=True, modified=t0),
+        ]
+        app._apply_harness_filter()
+
+        assert [c.id for c in app._get_related_children(parent)] == ["linked"]
+
+
+class TestHighlightDebounce:
+    def test_rapid_highlights_defer_to_last(self, monkeypatch):
+        """A lone highlight applies at once; a burst only applies the last row."""
+        app = AgentSessionsBrowser()
+        applied, timers = [], []
+        monkeypatch.setattr(app, "_apply_highlight", lambda session: applied.append(session.id))
+
+        def set_timer(delay, callback):
+            timer = SimpleNamespace(callback=callback, stopped=False)
+            timer.stop = lambda: setattr(timer, "stopped", True)
+            timers.append(timer)
+            return timer
+
+        monkeypatch.setattr(app, "set_timer", set_timer)
+
+        for sid in ("a", "b", "c"):
+            app.on_parent_highlighted(SimpleNamespace(item=ParentSessionItem(_session(sid))))
+
+        assert applied == ["a"]
+        assert app.selected_session.id == "c"
+        assert [t.stopped for t in timers] == [True, False]
+        timers[-1].callback()
+        assert applied == ["a", "c"]
+
+    def test_same_parent_keeps_subagent_list(self, monkeypatch):
+        """Re-highlighting the shown parent skips the sub-agent list rebuild."""
+        app = AgentSessionsBrowser()
+        detail = SimpleNamespace(show_session=lambda *args, **kwargs: None)
+        monkeypatch.setattr(app, "query_one", lambda *args: detail)
+        monkeypatch.setattr(app, "_prioritize_visible_summaries", lambda: None)
+        rebuilt = []
+        monkeypatch.setattr(app, "_update_children_list", lambda parent: rebuilt.append(parent.id))
+
+        a, b = _session("a"), _session("b")
+        for session in (a, a, b, a):
+            app._apply_highlight(session)
+        assert rebuilt == ["a", "b", "a"]
+
+        app._apply_harness_filter()
+        app._apply_highlight(a)
+        assert rebuilt == ["a", "b", "a", "a"]
+
+
+class TestParentCursor:
+    @pytest.mark.asyncio
+    async def test_clear_search_returns_to_previous_row(self, monkeypatch):
+        """Clearing a search highlights the row the user left, not a detached one."""
+        monkeypatch.setattr(AgentSessionsBrowser, "_load_sessions_background", lambda self: None)
+        base = datetime(2024, 1, 1)
+        sessions = [_session(f"p{i}", modified=base - timedelta(hours=i)) for i in range(10)]
+
+        app = AgentSessionsBrowser()
+        async with app.run_test() as pilot:
+            app.all_sessions = sessions
+            app._apply_harness_filter()
+            app._populate_parent_list()
+            app._restore_parent_cursor(sessions[2])
+            await pilot.pause()
+            assert app.selected_session.id == "p2"
+
+            app._pre_search_session = app.selected_session
+            app._search_mode = True
+            app._filtered_parents = [sessions[5]]
+            app._sort_and_display_results()
+            await pilot.pause()
+            assert app.selected_session.id == "p5"
+
+            app._clear_search()
+            await pilot.pause()
+            parent_list = app.query_one("#parent-list", PagedListView)
+            assert parent_list.highlighted_child.session.id == "p2"
+            assert app.selected_session.id == "p2"
+
+    @pytest.mark.asyncio
+    async def test_reload_during_search_reruns_search(self, monkeypatch):
+        """Sessions loaded mid-search re-run the query instead of replacing the results."""
+        monkeypatch.setattr(AgentSessionsBrowser, "_load_sessions_background", lambda self: None)
+        monkeypatch.setattr(AgentSessionsBrowser, "_start_summary_generation", lambda self: None)
+        searched, populated = [], []
+        monkeypatch.setattr(AgentSessionsBrowser, "_run_search_in_background", lambda self, q: searched.append(q))
+        monkeypatch.setattr(AgentSessionsBrowser, "_populate_parent_list", lambda self: populated.append(True))
+
+        app = AgentSessionsBrowser()
+        async with app.run_test() as pilot:
+            app._search_mode = True
+            app._search_query = "needle"
+            app._on_sessions_loaded([_session("p0"), _session("c0", is_child=True)])
+            await pilot.pause()
+            assert searched == ["needle"]
+            assert not populated
+            assert [s.id for s in app.parent_sessions] == ["p0"]
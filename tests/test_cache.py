@@ -0,0 +1,53 @@
+"""Tests for session caches."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agent_sessions import cache as cache_module
+from agent_sessions.cache import MetadataCache, SummaryCache, compute_content_hash
+
+
+class TestMetadataCache:
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        """Give each test a fresh singleton backed by a file under tmp_path."""
+        monkeypatch.setattr(cache_module, "METADATA_CACHE_PATH", tmp_path / "metadata.json")
+        monkeypatch.setattr(MetadataCache, "_instance", None)
+
+    def test_hit_requires_matching_mtime_and_size(self):
+        """Entries are only returned for the exact mtime and size they were stored with."""
+        cache = MetadataCache()
+        path = Path("/nonexistent/test-metadata-cache.jsonl")
+        cache.set(path, 1_700_000_000_123_456_789, 2048, {"title": "t"})
+
+        assert cache.get(path, 1_700_000_000_123_456_789, 2048) == {"title": "t"}
+        assert cache.get(path, 1_700_000_000_123_456_789, 4096) is None
+        assert cache.get(path, 1_700_000_000_123_456_790, 2048) is None
+
+
+class TestSummaryCache:
+    def test_saves_coalesced_and_atomic(self, tmp_path, monkeypatch):
+        """A burst of saves writes once, then the deferred flush writes the rest."""
+        monkeypatch.setattr(SummaryCache, "_instance", None)
+        path = tmp_path / "summaries.json"
+        cache = SummaryCache(path)
+
+        cache.set("s1", "h1", "First")
+        cache.save()
+        cache.set("s2", "h2", "Second")
+        cache.save()  # within SAVE_INTERVAL: deferred
+        assert set(json.loads(path.read_text())) == {"s1"}
+
+        cache.save(force=True)
+        assert set(json.loads(path.read_text())) == {"s1", "s2"}
+        assert cache._flush_timer is None
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestComputeContentHash:
+    def test_digest_is_stable(self):
+        """Existing summary cache keys stay valid: the digest format must not change."""
+        assert compute_content_hash("hello", "world") == "2e8b8aaf6057"
+        assert compute_content_hash("a" * 600, "") == compute_content_hash("a" * 500, "")
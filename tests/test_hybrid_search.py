@@ -3,6 +3,8 @@
 from datetime import datetime
 from types import SimpleNamespace
 
+import numpy as np
+
 import agent_sessions.index as index_module
 import agent_sessions.main as main_module
 from agent_sessions.index.database import ChunkRow, MessageRow, SessionDatabase
@@ -252,3 +254,23 @@ def test_generate_embeddings_command_backfills_missing_chunks(
     assert rows[0].embedding_model == "text-embedding-3-small"
     assert "Generated embeddings for 1 chunks" in capsys.readouterr().out
     SessionDatabase.reset_instance()
+
+
+def test_query_embedding_reused_across_searches(tmp_path):
+    db = _db(tmp_path)
+    calls = []
+
+    class _CountingEmbedder(_VectorEmbedder):
+        def embed_query(self, query: str):
+            calls.append(query)
+            return [2.0] + [0.0] * (EMBEDDING_DIMENSIONS - 1)
+
+    search = HybridSearch(db, embedder=_CountingEmbedder())
+    first = search._query_vector("calendar sync")
+    assert search._query_vector("calendar sync") is first
+    assert calls == ["calendar sync"]
+    assert float(np.linalg.norm(first)) == 1.0
+
+    search._query_vector("webhook replay")
+    assert calls == ["calendar sync", "webhook replay"]
+    SessionDatabase.reset_instance()
@@ -1,5 +1,7 @@
 """Tests for session providers."""
 
+import json
+import os
 import tempfile
 import shutil
 from pathlib import Path
@@ -7,10 +9,26 @@ from pathlib import Path
 import pytest
 
 from agent_sessions.models import Session
-from agent_sessions.providers.base import SessionProvider
+from agent_sessions.providers.base import (
+    MessageTracker,
+    SessionProvider,
+    detect_automated_session,
+    find_first_real_prompt,
+    find_last_real_response,
+    parse_timestamp,
+)
 from agent_sessions.providers.droid import DroidProvider
 from agent_sessions.providers.claude_code import ClaudeCodeProvider
 from agent_sessions.providers.codex import CodexProvider
+from agent_sessions.providers.opencode import OpenCodeProvider
+
+
+def _stage(src: Path, dst: Path) -> None:
+    """Place a read-only fixture in a temp dir, hardlinking when possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
 
 
 class TestDroidProvider:
@@ -27,10 +45,10 @@ class TestDroidProvider:
         project_dir = tmp_path / "test-project"
         project_dir.mkdir()
 
-        # Copy test fixture
+        # Stage test fixture
         fixture_path = Path(__file__).parent / "fixtures" / "droid_session.jsonl"
         if fixture_path.exists():
-            shutil.copy(fixture_path, project_dir / "test-session-id.jsonl")
+            _stage(fixture_path, project_dir / "test-session-id.jsonl")
 
             # Create settings file
             settings = project_dir / "test-session-id.settings.json"
@@ -77,6 +95,128 @@ class TestDroidProvider:
         assert "authentication" in session.first_prompt.lower()
         assert session.model == "claude-opus-4-5-20251101"
 
+    def test_task_invocations_collected_during_parse(self, droid_provider, tmp_path):
+        """Task invocations come from the parse pass, not a second file read."""
+        project_dir = tmp_path / "proj"
+        project_dir.mkdir()
+        session_file = project_dir / "parent.jsonl"
+        task = {"type": "tool_use", "name": "Task", "input": {"subagent_type": "debugger", "description": "Find bug"}}
+        lines = [
+            {"type": "session_start", "title": "Parent", "cwd": "/home/user/project"},
+            {"type": "message", "timestamp": "2024-01-15T10:00:00Z",
+             "message": {"role": "user", "content": "Please track down the failing login test"}},
+            {"type": "message", "timestamp": "2024-01-15T10:01:00Z",
+             "message": {"role": "assistant", "content": [{"type": "text", "text": "Delegating"}, task]}},
+        ]
+        session_file.write_text("\n".join(json.dumps(line, separators=(",", ":")) for line in lines))
+
+        session = droid_provider.parse_session(session_file)
+        session_file.unlink()
+
+        invocations = droid_provider.get_task_invocations(session)
+        assert [t["subagent_type"] for t in invocations] == ["debugger"]
+        assert invocations[0]["description"] == "Find bug"
+        assert invocations[0]["timestamp"].minute == 1
+
+    def test_last_messages_read_from_tail(self, droid_provider, tmp_path, monkeypatch):
+        """Last prompt/response come from a backwards scan, skipping meta responses."""
+        import agent_sessions.providers.droid as droid_module
+        monkeypatch.setattr(droid_module, "TAIL_BLOCK_SIZE", 64)  # force several blocks
+
+        def message(role, content):
+            return {"type": "message", "timestamp": "2024-01-15T10:00:00Z",
+                    "message": {"role": role, "content": content}}
+
+        lines = [{"type": "session_start", "title": "T", "cwd": "/home/user/project"}]
+        for i in range(20):
+            lines.append(message("user", f"Please work on step {i} of the refactor"))
+            lines.append(message("assistant", f"Done with step {i}"))
+        lines.append(message("assistant", "[Request interrupted by user]"))
+        session_file = tmp_path / "proj" / "s.jsonl"
+        session_file.parent.mkdir()
+        session_file.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+        session = droid_provider.parse_session(session_file)
+        assert session.first_prompt == "Please work on step 0 of the refactor"
+        assert session.last_prompt == "Please work on step 19 of the refactor"
+        assert session.last_response == "Done with step 19"
+
+    def test_cached_task_invocations_decoded_on_demand(self, droid_provider, tmp_path):
+        """Cache hits keep Task invocations serialized until they are asked for."""
+        path = tmp_path / "parent.jsonl"
+        path.write_text("")
+        cached = {"first_prompt": "", "task_invocations": [
+            {"subagent_type": "debugger", "timestamp": "2024-01-15T10:01:00+00:00", "description": ""},
+        ]}
+        session = droid_provider._session_from_cache(path, cached, 0.0)
+        assert "task_invocations" not in session.extra
+
+        invocations = droid_provider.get_task_invocations(session)
+        assert invocations[0]["timestamp"].minute == 1
+        assert droid_provider.get_task_invocations(session) is invocations
+
+    def test_discover_session_files(self, droid_provider, temp_session_dir, monkeypatch):
+        """Only JSONL files inside project directories are discovered."""
+        (temp_session_dir / "stray.jsonl").write_text("")
+        (temp_session_dir / "test-project" / "notes.txt").write_text("")
+        monkeypatch.setattr(droid_provider, "get_sessions_dir", lambda: temp_session_dir)
+
+        files = droid_provider.discover_session_files()
+        assert [f.name for f in files] == ["test-session-id.jsonl"]
+
+        monkeypatch.setattr(droid_provider, "get_sessions_dir", lambda: temp_session_dir / "missing")
+        assert droid_provider.discover_session_files() == []
+
+    def test_discover_sessions_fast_returns_seconds(self, droid_provider, temp_session_dir, monkeypatch):
+        """Fast discovery reports whole-second mtimes, like indexed_at."""
+        import os
+
+        monkeypatch.setattr(droid_provider, "get_sessions_dir", lambda: temp_session_dir)
+        os.utime(temp_session_dir / "test-project" / "test-session-id.jsonl", (1700000000.5, 1700000000.5))
+        assert droid_provider.discover_sessions_fast() == {"test-session-id": 1700000000}
+
+    def test_find_children_by_type_and_time(self, droid_provider):
+        """Sub-agents match on type within 60s of a Task, else by cwd/time fallback."""
+        from datetime import datetime, timedelta, timezone
+
+        t0 = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+        project = Path("/home/user/project")
+
+        def sub(sid, child_type, created=None, modified=t0, project_path=project):
+            return Session(
+                id=sid, harness="droid", raw_path=Path(f"/tmp/{sid}.jsonl"),
+                project_path=project_path, project_name=project_path.name,
+                is_child=True, child_type=child_type,
+                created_time=created, modified_time=modified,
+            )
+
+        parent = Session(
+            id="parent", harness="droid", raw_path=Path("/tmp/parent.jsonl"),
+            project_path=project, project_name="project", modified_time=t0,
+            extra={"task_invocations": [
+                {"subagent_type": "debugger", "timestamp": t0, "description": ""},
+                {"subagent_type": "worker", "timestamp": None, "description": ""},
+            ]},
+        )
+        sessions = [
+            parent,
+            sub("late", "debugger", created=t0 + timedelta(seconds=90)),
+            sub("close", "debugger", created=t0 + timedelta(seconds=30)),
+            sub("untimed", "debugger"),
+            sub("other-type", "reviewer", created=t0),
+            sub("worker", "worker", created=t0 - timedelta(hours=1)),
+            sub("elsewhere", "worker", created=t0, project_path=Path("/other")),
+        ]
+
+        children = droid_provider.find_children(parent, sessions)
+        assert {s.id for s in children} == {"close", "untimed", "worker"}
+        assert droid_provider.find_children(parent, sessions) == children
+
+        # The index is kept for the same list until caches are cleared
+        sessions[2] = sub("close", "reviewer", created=t0 + timedelta(seconds=30))
+        droid_provider.clear_caches()
+        assert {s.id for s in droid_provider.find_children(parent, sessions)} == {"untimed", "worker"}
+
 
 class TestClaudeCodeProvider:
     """Tests for Claude Code provider."""
@@ -93,7 +233,7 @@ class TestClaudeCodeProvider:
 
         fixture_path = Path(__file__).parent / "fixtures" / "claude_code_session.jsonl"
         if fixture_path.exists():
-            shutil.copy(fixture_path, project_dir / "test-claude-session.jsonl")
+            _stage(fixture_path, project_dir / "test-claude-session.jsonl")
 
         return tmp_path
 
@@ -135,6 +275,18 @@ class TestClaudeCodeProvider:
         assert "React" in session.first_prompt
         assert session.model == "claude-opus-4-5-20251101"
 
+    def test_non_message_records_not_decoded(self, claude_provider, temp_session_dir, monkeypatch):
+        """Snapshot/progress lines are skipped by their raw bytes, before json.loads."""
+        import agent_sessions.providers.claude_code as claude_module
+
+        session_file = temp_session_dir / "-home-user-webapp" / "test-claude-session.jsonl"
+        decoded = []
+        loads = claude_module._json.loads
+        monkeypatch.setattr(claude_module._json, "loads", lambda line: decoded.append(line) or loads(line))
+
+        assert claude_provider.parse_session(session_file) is not None
+        assert decoded and not any(b"file-history-snapshot" in line for line in decoded)
+
 
 class TestCodexProvider:
     """Tests for Codex provider."""
@@ -215,6 +367,128 @@ class TestCodexProvider:
         assert "provider registry" in messages[1]["content"]
 
 
+class TestOpenCodeProvider:
+    """Tests for OpenCode provider."""
+
+    @pytest.fixture
+    def opencode_provider(self):
+        return OpenCodeProvider()
+
+    @staticmethod
+    def _session(session_id: str, parent_id: str | None = None, harness: str = "opencode") -> Session:
+        return Session(
+            id=session_id,
+            harness=harness,
+            raw_path=Path(f"/tmp/{session_id}.opencode"),
+            project_path=Path("/home/user/project"),
+            project_name="project",
+            is_child=parent_id is not None,
+            parent_id=parent_id,
+        )
+
+    @pytest.fixture
+    def opencode_storage(self, tmp_path, monkeypatch):
+        """Create a minimal OpenCode storage tree with one session."""
+        from agent_sessions.providers import opencode
+
+        storage = tmp_path / "storage"
+        monkeypatch.setattr(opencode, "STORAGE_DIR", storage)
+        monkeypatch.setattr(opencode, "MESSAGE_DIR", storage / "message")
+        monkeypatch.setattr(opencode, "PART_DIR", storage / "part")
+        monkeypatch.setattr(opencode, "SESSION_META_DIR", storage / "session")
+
+        conversation = [
+            ("user", "Please refactor the billing module for clarity"),
+            ("assistant", "Refactored the billing module."),
+            ("user", "Now add tests for the invoice totals"),
+            ("assistant", "Added invoice total tests."),
+        ]
+        session_dir = storage / "message" / "ses_test"
+        session_dir.mkdir(parents=True)
+        for i, (role, text) in enumerate(conversation):
+            msg_id = f"msg_{i:03d}"
+            (session_dir / f"{msg_id}.json").write_text(json.dumps({
+                "id": msg_id,
+                "role": role,
+                "time": {"created": 1700000000000 + i * 1000, "completed": 1700000000500 + i * 1000},
+                "path": {"root": "/home/user/billing"},
+                "modelID": "test-model" if role == "assistant" else None,
+            }))
+            part_dir = storage / "part" / msg_id
+            part_dir.mkdir(parents=True)
+            (part_dir / "prt_000.json").write_text(json.dumps({"type": "text", "text": text}))
+        (storage / "session" / "proj").mkdir(parents=True)
+
+        return storage / "sessions" / "ses_test.opencode"
+
+    def test_parse_session_reads_only_needed_parts(self, opencode_provider, opencode_storage, monkeypatch):
+        """Test parsing loads part files for first/last messages only."""
+        loaded = []
+        original = OpenCodeProvider._get_message_content
+
+        def tracking(self, message_id):
+            loaded.append(message_id)
+            return original(self, message_id)
+
+        monkeypatch.setattr(OpenCodeProvider, "_get_message_content", tracking)
+
+        session = opencode_provider.parse_session(opencode_storage)
+
+        assert session is not None
+        assert session.id == "ses_test"
+        assert session.first_prompt == "Please refactor the billing module for clarity"
+        assert session.last_prompt == "Now add tests for the invoice totals"
+        assert session.last_response == "Added invoice total tests."
+        assert session.project_name == "billing"
+        assert session.model == "test-model"
+        assert sorted(loaded) == ["msg_000", "msg_002", "msg_003"]
+
+    def test_session_metadata_tracks_its_own_file(self, opencode_storage):
+        """Metadata appearing or changing later is picked up without clearing caches."""
+        from agent_sessions.providers import opencode
+
+        opencode.clear_metadata_cache()
+        assert opencode._get_session_metadata("ses_test") is None
+
+        meta_file = opencode.SESSION_META_DIR / "proj" / "ses_test.json"
+        meta_file.write_text(json.dumps({"title": "First"}))
+        os.utime(meta_file, ns=(1, 1_000_000_000))
+        assert opencode._get_session_metadata("ses_test")["title"] == "First"
+
+        meta_file.write_text(json.dumps({"title": "Renamed", "parentID": "ses_parent"}))
+        os.utime(meta_file, ns=(1, 2_000_000_000))
+        assert opencode._get_session_metadata("ses_test")["parentID"] == "ses_parent"
+
+    def test_find_children_by_parent_id(self, opencode_provider):
+        """Test children are matched on explicit parentID only."""
+        parent = self._session("ses_parent")
+        sessions = [
+            parent,
+            self._session("ses_child_a", parent_id="ses_parent"),
+            self._session("ses_other", parent_id="ses_elsewhere"),
+            self._session("ses_child_b", parent_id="ses_parent"),
+            self._session("foreign", parent_id="ses_parent", harness="codex"),
+        ]
+
+        children = opencode_provider.find_children(parent, sessions)
+
+        assert [c.id for c in children] == ["ses_child_a", "ses_child_b"]
+
+    def test_find_children_rebuilds_for_new_session_list(self, opencode_provider):
+        """Test the parentID index is not reused across different session lists."""
+        parent = self._session("ses_parent")
+        first = [parent, self._session("ses_child_a", parent_id="ses_parent")]
+        second = first + [self._session("ses_child_b", parent_id="ses_parent")]
+
+        assert len(opencode_provider.find_children(parent, first)) == 1
+        assert len(opencode_provider.find_children(parent, second)) == 2
+
+        # Edits to the same list show up once caches are cleared
+        second[2] = self._session("ses_child_b", parent_id="ses_elsewhere")
+        opencode_provider.clear_caches()
+        assert len(opencode_provider.find_children(parent, second)) == 1
+
+
 class TestProviderRegistry:
     """Tests for provider registry."""
 
@@ -256,3 +530,113 @@ class TestProviderRegistry:
 
         unknown = get_provider("unknown-provider")
         assert unknown is None
+
+    def test_get_provider_returns_shared_instance(self):
+        """Repeated lookups reuse one provider instance."""
+        from agent_sessions.providers import get_provider
+
+        assert get_provider("droid") is get_provider("droid")
+
+
+class TestLoadSessions:
+    """Tests for SessionProvider.load_sessions."""
+
+    class _FakeProvider(SessionProvider):
+        name = "fake"
+
+        def get_sessions_dir(self) -> Path:
+            return Path("/nonexistent")
+
+        def discover_session_files(self) -> list[Path]:
+            return [Path(f"/fake/{i}.jsonl") for i in range(20)]
+
+        def parse_session(self, path: Path) -> Session | None:
+            n = int(path.stem)
+            if n % 5 == 0:
+                raise ValueError("corrupt")
+            if n % 7 == 0:
+                return None
+            return Session(id=path.stem, harness=self.name, raw_path=path,
+                           project_path=Path("/p"), project_name="p")
+
+        def get_resume_command(self, session: Session) -> str:
+            return ""
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_keeps_discovery_order_and_skips_failures(self, parallel):
+        """Parsed sessions keep discovery order; errors and empty results are dropped."""
+        provider = self._FakeProvider()
+        provider.parallel_parse = parallel
+        ids = [s.id for s in provider.load_sessions()]
+        assert ids == [str(i) for i in range(20) if i % 5 and i % 7]
+
+    def test_providers_loaded_together_keep_their_sessions(self):
+        """Concurrent per-provider loading keys each result by provider name."""
+        from agent_sessions.providers import load_sessions_by_provider
+
+        first, second = self._FakeProvider(), self._FakeProvider()
+        second.name = "other"
+        second.discover_session_files = lambda: [Path("/fake/1.jsonl")]
+        loaded = load_sessions_by_provider([first, second])
+
+        assert list(loaded) == ["fake", "other"]
+        assert len(loaded["fake"]) == len(first.load_sessions())
+        assert [s.id for s in loaded["other"]] == ["1"]
+
+
+class TestMessageTracker:
+    """Tests for the streaming first/last message tracker."""
+
+    @pytest.mark.parametrize("messages", [
+        [],
+        [("user", "hi"), ("assistant", "<system-reminder>x")],
+        [
+            ("user", "<command-name>clear"),
+            ("user", "Please refactor the session loader"),
+            ("assistant", "Sure, refactoring now"),
+            ("user", "thanks"),
+            ("assistant", "[Request interrupted by user]"),
+            ("assistant", "   "),
+        ],
+    ])
+    def test_matches_list_helpers(self, messages):
+        """Streaming results equal the list-based helper functions."""
+        tracker = MessageTracker()
+        for role, content in messages:
+            tracker.add(role, content)
+
+        users = [m for m in messages if m[0] == "user"]
+        assistants = [m for m in messages if m[0] == "assistant"]
+        assert tracker.count == len(messages)
+        assert tracker.first_prompt == (find_first_real_prompt(users) if users else "")
+        assert tracker.last_prompt == (users[-1][1] if users else "")
+        assert tracker.last_response == (find_last_real_response(assistants) if assistants else "")
+
+
+class TestParseTimestamp:
+    """Tests for the shared ISO-8601 timestamp parser."""
+
+    def test_trailing_z_is_utc(self):
+        """A trailing Z parses the same as an explicit +00:00 offset."""
+        assert parse_timestamp("2024-01-15T10:01:00.123Z") == parse_timestamp("2024-01-15T10:01:00.123+00:00")
+        assert parse_timestamp("2024-01-15T10:01:00Z").utcoffset().total_seconds() == 0
+
+    def test_invalid_values(self):
+        """Missing or malformed values give None."""
+        assert parse_timestamp(None) is None
+        assert parse_timestamp("") is None
+        assert parse_timestamp("yesterday") is None
+
+
+class TestDetectAutomatedSession:
+    """Tests for automated-session prompt detection."""
+
+    def test_prefix_table_kinds(self):
+        """Each known prefix maps to its automation type; human prompts do not."""
+        assert detect_automated_session("  <command-message>x") == (True, "command-message")
+        assert detect_automated_session("[gas town] go") == (True, "ci-dispatch")
+        assert detect_automated_session("GT Prime now") == (True, "ci-dispatch")
+        assert detect_automated_session("Summarize the Task tool output above") == (True, "subagent-continuation")
+        assert detect_automated_session("<ultrawork-mode> polecat dispatched") == (True, "ultrawork-mode")
+        assert detect_automated_session("[search] fix the bug") == (False, "")
+        assert detect_automated_session("gtx boot") == (False, "")
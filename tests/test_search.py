@@ -10,9 +10,13 @@ from agent_sessions.search import (
     parse_search_query,
     parse_date_value,
     SearchEngine,
+    _matching_lines,
+    search_session_file,
     search_sessions,
 )
 
+FIXTURES = Path(__file__).parent / "fixtures"
+
 
 class TestQueryParsing:
     """Tests for search query parsing."""
@@ -49,6 +53,12 @@ class TestQueryParsing:
         assert "after" in filters
         assert "before" in filters
 
+    def test_unknown_prefixes_stay_in_query(self):
+        """Only known modifier keys are stripped; other colon tokens are search text."""
+        query, filters = parse_search_query("Harness:Droid see http://localhost:8080 todo:")
+        assert query == "see http://localhost:8080 todo:"
+        assert filters == {"harness": "droid"}
+
 
 class TestDateParsing:
     """Tests for date value parsing."""
@@ -82,6 +92,25 @@ class TestDateParsing:
         assert result.month == 1
         assert result.day == 15
 
+    def test_parsing_memoized_but_relative_dates_fresh(self):
+        """Repeated values skip parsing, yet relative dates still track the clock."""
+        from agent_sessions.search import _relative_delta
+
+        _relative_delta.cache_clear()
+        first = parse_date_value("3d")
+        second = parse_date_value("3d")
+        assert _relative_delta.cache_info().hits == 1
+        assert second >= first
+
+    def test_before_and_after_share_one_now(self):
+        """Relative bounds in one query are measured from the same instant."""
+        _, filters = parse_search_query("auth after:7d before:1d")
+        assert filters["before"] - filters["after"] == timedelta(days=6)
+
+        now = datetime(2025, 3, 1, 12, 0)
+        assert parse_date_value("2h", now) == datetime(2025, 3, 1, 10, 0)
+        assert parse_date_value("01-15", now) == datetime(2025, 1, 15)
+
     def test_invalid_date(self):
         """Test parsing invalid date returns None."""
         result = parse_date_value("not-a-date")
@@ -145,6 +174,161 @@ class TestSearchEngine:
         filtered = [s for s in sample_sessions if s.modified_time and s.modified_time > cutoff]
         assert len(filtered) == 2  # Only sessions within last 7 days
 
+    def test_index_filters_match_scans(self, sample_sessions):
+        """The engine's indexed filters agree with plain list scans."""
+        engine = SearchEngine(sample_sessions)
+        cutoff = datetime.now() - timedelta(days=7)
+
+        assert engine.filter_by_harness("droid") == [s for s in sample_sessions if s.harness == "droid"]
+        assert engine.filter_by_harness("cursor") == []
+        assert {s.id for s in engine.filter_by_project("API")} == {"session-1", "session-3"}
+        assert {s.id for s in engine.filter_by_date(after=cutoff)} == {"session-1", "session-2"}
+        assert [s.id for s in engine.filter_by_date(before=cutoff)] == ["session-3"]
+
+        # Filters are generators and chain over each other's output
+        chained = engine.filter_by_date(after=cutoff, sessions=engine.filter_by_project("api"))
+        assert not isinstance(chained, list)
+        assert [s.id for s in chained] == ["session-1"]
+
+    def test_date_filter_mixes_naive_and_aware_times(self, sample_sessions):
+        """UTC-stamped sessions (e.g. Codex) filter alongside local-time ones."""
+        from datetime import timezone
+
+        aware = Session(id="utc", harness="codex", raw_path=Path("/tmp/u.jsonl"),
+                        project_path=Path("/p"), project_name="p",
+                        modified_time=datetime.now(timezone.utc) - timedelta(days=2))
+        undated = Session(id="undated", harness="codex", raw_path=Path("/tmp/n.jsonl"),
+                          project_path=Path("/p"), project_name="p")
+        engine = SearchEngine(sample_sessions + [aware, undated])
+
+        cutoff = datetime.now() - timedelta(days=7)
+        assert [s.id for s in engine.filter_by_date(after=cutoff)] == ["session-1", "session-2", "utc"]
+        assert [s.id for s in engine.filter_by_date(before=cutoff)] == ["session-3"]
+
+    def test_harness_and_project_names_interned(self, sample_sessions):
+        """Equal harness and project names share one string object."""
+        session = Session(id="x", harness="".join(["dro", "id"]), raw_path=Path("/tmp/x.jsonl"),
+                          project_path=Path("/home/user/api"), project_name="".join(["a", "pi"]))
+        assert session.harness is sample_sessions[0].harness
+        assert session.project_name is sample_sessions[0].project_name
+
+    def test_composed_filters_scan_only_the_intersection(self, sample_sessions, monkeypatch):
+        """Stacked modifiers narrow the scan; filters without text do no work."""
+        import agent_sessions.search as search_module
+
+        engine = SearchEngine(sample_sessions)
+        scanned = []
+        monkeypatch.setattr(search_module, "search_session_file", lambda s, q, **kw: scanned.append(s.id) or [])
+        with monkeypatch.context() as m:
+            m.setattr(engine, "filter_by_date", lambda *a: pytest.fail("filtered without a query"))
+            assert engine.search("harness:droid after:7d") == {}
+
+        engine.search("ok harness:droid project:api after:30d before:3d")
+        assert scanned == ["session-3"]
+
+    def test_trigram_prefilter_skips_impossible_files(self, monkeypatch):
+        """The first scan records a file's trigrams; later queries it rules out skip the file."""
+        import agent_sessions.search as search_module
+
+        session = Session(
+            id="fixture",
+            harness="claude-code",
+            raw_path=FIXTURES / "claude_code_session.jsonl",
+            project_path=Path("/home/user/webapp"),
+            project_name="webapp",
+        )
+        engine = SearchEngine([session])
+        scanned = []
+        scan = search_module.search_session_file
+        monkeypatch.setattr(
+            search_module, "search_session_file", lambda s, q, **kw: scanned.append(q) or scan(s, q, **kw)
+        )
+
+        assert engine.search("kubernetes") == {}
+        assert len(engine._trigram_filters) == 1  # built by that scan, not a separate read
+        assert engine.search("kubernetes") == {}
+        assert "fixture" in engine.search("REACT component")
+        assert scanned == ["kubernetes", "REACT component"]
+
+    def test_trigram_filter_independent_of_chunking(self, monkeypatch):
+        """Trigrams spanning read-chunk boundaries are still recorded."""
+        import agent_sessions.search as search_module
+
+        data = (FIXTURES / "claude_code_session.jsonl").read_bytes().lower()
+        whole = search_module._trigram_filter(data)
+        for chunk in (1, 2, 5):
+            monkeypatch.setattr(search_module, "_TRIGRAM_CHUNK", chunk)
+            assert (search_module._trigram_filter(data) == whole).all()
+
+
+class TestSearchSessionFile:
+    """Tests for searching JSONL session files."""
+
+    @pytest.fixture
+    def claude_session(self):
+        return Session(
+            id="test-claude-session",
+            harness="claude-code",
+            raw_path=FIXTURES / "claude_code_session.jsonl",
+            project_path=Path("/home/user/webapp"),
+            project_name="webapp",
+        )
+
+    def test_matches_are_case_insensitive(self, claude_session):
+        """Test matches ignore case in both user and assistant messages."""
+        results = search_session_file(claude_session, "REACT component")
+        assert [r.role for r in results] == ["user", "assistant"]
+        assert "React component" in results[0].match_text
+
+    def test_no_match(self, claude_session):
+        """Test a query absent from the file returns nothing."""
+        assert search_session_file(claude_session, "kubernetes") == []
+
+    def test_metadata_only_match_is_ignored(self, claude_session):
+        """Test raw-byte hits outside message content are not reported."""
+        assert search_session_file(claude_session, "file-history-snapshot") == []
+
+    def test_unprefilterable_query_falls_back(self, claude_session):
+        """Test queries that JSON would escape still search every line."""
+        assert search_session_file(claude_session, 'say "hi"') == []
+        assert search_session_file(claude_session, "projéct") == []
+        assert len(search_session_file(claude_session, "I'll create")) == 1
+
+    def test_query_without_letters(self, tmp_path):
+        """Test digit/punctuation queries match without case folding."""
+        path = tmp_path / "s.jsonl"
+        path.write_text(
+            '{"type":"user","message":{"role":"user","content":"Why does /api return 404?"}}\n'
+            '{"type":"assistant","message":{"role":"assistant","content":"The route is missing."}}\n'
+        )
+        session = Session(id="s", harness="claude-code", raw_path=path,
+                          project_path=tmp_path, project_name="p")
+        results = search_session_file(session, "404")
+        assert [r.match_text for r in results] == ["Why does /api return 404?"]
+        assert search_session_file(session, "500") == []
+
+    @pytest.mark.parametrize("content", [
+        "one\ntwo match\nthree\nfour\nMATCH five\n",
+        "match\nmatch again",
+        "a\nb\nc\nmatch",
+        "İstanbul\nmatch here\nend",  # lowercasing changes the length
+    ])
+    def test_context_lines(self, content):
+        """Match lines and their context agree with a plain line split."""
+        lines = content.split("\n")
+        expected = [
+            (n, line, lines[max(0, n - 2):n], lines[n + 1:n + 3])
+            for n, line in enumerate(lines) if "match" in line.lower()
+        ]
+        assert list(_matching_lines(content, "match")) == expected
+
+    def test_first_character_prefilter(self):
+        """Messages lacking the query's first character are skipped; case and non-ASCII still match."""
+        assert list(_matching_lines("nothing to see", "match")) == []
+        assert [m[1] for m in _matching_lines("a\nMatch", "match")] == ["Match"]
+        # The Kelvin sign lowercases to "k", so non-ASCII text is never prefiltered
+        assert [m[1] for m in _matching_lines("\u212aey", "key")] == ["\u212aey"]
+
 
 class TestSearchResult:
     """Tests for SearchResult model."""
@@ -197,6 +197,7 @@ async def test_child_search_match_propagates_to_parent_result(monkeypatch):
 
         app.parent_sessions = [parent]
         app.child_sessions = [child]
+        app._parent_by_id = {"parent": parent}
         app._child_parent_by_id = {"child": "parent"}
         app._children_by_parent_id = {"parent": [child]}
         app._search_mode = True
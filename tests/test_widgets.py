@@ -0,0 +1,220 @@
+"""Tests for session list item rendering."""
+
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from rich.text import Text
+
+from agent_sessions.models import Session
+from agent_sessions.ui.widgets import (
+    PagedListView,
+    ParentSessionItem,
+    SessionDetailPanel,
+    append_bordered,
+    truncate,
+)
+
+
+def _session(**kwargs) -> Session:
+    defaults = dict(
+        id="s1",
+        harness="claude-code",
+        raw_path=Path("/tmp/s1.jsonl"),
+        project_path=Path("/tmp/proj"),
+        project_name="proj",
+        first_prompt="hello " * 40,
+        modified_time=datetime(2024, 3, 5, 14, 7),
+    )
+    defaults.update(kwargs)
+    return Session(**defaults)
+
+
+class TestTruncate:
+    def test_short_text_unchanged(self):
+        """Text within the limit is returned as-is."""
+        text = "short"
+        assert truncate(text, 10) is text
+
+    def test_long_text_gets_ellipsis(self):
+        """Long text is cut to exactly max_len including the ellipsis."""
+        assert truncate("abcdefghij", 8) == "abcde..."
+
+    def test_tiny_limit(self):
+        """Limits too small for an ellipsis never exceed max_len."""
+        assert truncate("abcdefghij", 2) == ".."
+        assert truncate("abcdefghij", 0) == ""
+
+
+class TestParentSessionItem:
+    def test_prefix_reused_across_widths(self):
+        """The width-independent prefix is built once and reused."""
+        item = ParentSessionItem(_session(), child_count=2)
+        narrow = item._build_text(60)
+        prefix = item._prefix_text
+        wide = item._build_text(200)
+
+        assert item._prefix_text is prefix
+        assert narrow.plain.startswith("03-05 14:07 │ ")
+        assert "(2) hello" in narrow.plain
+        assert len(wide.plain) > len(narrow.plain)
+
+    def test_same_width_does_not_rebuild(self, monkeypatch):
+        """Resizes to the already-rendered width leave the text untouched."""
+        item = ParentSessionItem(_session())
+        item._shown = True
+        calls = []
+        item._static = SimpleNamespace(update=lambda text: None)
+        build = item._build_text
+        monkeypatch.setattr(item, "_build_text", lambda w: calls.append(w) or build(w))
+
+        item._render_width(80)
+        item._render_width(80)
+        item._render_width(120)
+        assert calls == [80, 120]
+
+    def test_refresh_keeps_styled_prefix(self):
+        """A new summary swaps the description without re-styling the prefix."""
+        item = ParentSessionItem(_session(), child_count=1)
+        item._build_text(80)
+        prefix = item._prefix_text
+        assert ParentSessionItem(_session(), child_count=1)._build_text(80).plain == item._build_text(80).plain
+
+        item.session.summary = "Summarized"
+        item.refresh_text()
+        assert item._prefix_text is prefix
+        assert item._build_text(80).plain.endswith("Summarized")
+
+    def test_base_item_renders_prompt_by_default(self):
+        """List items that don't override _build_text still render the prompt."""
+        from agent_sessions.ui.widgets import _SessionListItem
+
+        assert _SessionListItem(_session(first_prompt="Fix\nbug"))._build_text(80).plain == "Fix bug"
+
+    def test_summary_preferred_over_prompt(self):
+        """A generated summary replaces the raw prompt in the description."""
+        item = ParentSessionItem(_session(summary="Fix the login bug"))
+        assert item._build_text(100).plain.endswith("Fix the login bug")
+
+
+class TestAppendBordered:
+    def test_matches_per_line_appends(self):
+        """Bulk append renders the same as appending bar and line separately."""
+        body = "first\n\nthird line\r\n│ quoted\nlast\n"
+        expected = Text("head\n")
+        for line in body.split("\n"):
+            expected.append("│ ", style="green")
+            expected.append(f"{line}\n")
+
+        text = Text("head\n")
+        append_bordered(text, body, "green")
+
+        assert text.plain == expected.plain
+        assert text.spans == expected.spans
+
+    def test_limit_adds_truncated_marker(self):
+        """Bodies over the limit are cut and marked as truncated."""
+        text = Text()
+        append_bordered(text, "abcdef", "green", limit=3)
+        assert text.plain == "│ abc\n│ ... (truncated)\n"
+
+        text = Text()
+        append_bordered(text, "abc", "green", limit=3)
+        assert text.plain == "│ abc\n"
+
+    def test_content_style_under_bars(self):
+        """Bars keep their style when the content has its own style."""
+        text = Text()
+        append_bordered(text, "a\nb", "cyan", style="white")
+        assert text.spans[0].style == "white"
+        assert [(s.start, s.end, s.style) for s in text.spans[1:]] == [
+            (0, 2, "cyan"),
+            (4, 6, "cyan"),
+        ]
+
+
+class TestSessionSections:
+    def test_sections_cached_per_session(self):
+        """Static detail sections are reused until the session content changes."""
+        panel = SessionDetailPanel()
+        session = _session(content_hash="aaa")
+
+        first = panel._session_sections(session)
+        assert panel._session_sections(session) is first
+        assert "First Prompt" in first[2].plain
+
+        session.content_hash = "bbb"
+        assert panel._session_sections(session) is not first
+
+    def test_annotations_cached_until_forgotten(self, monkeypatch):
+        """Annotations are queried once per session until explicitly invalidated."""
+        from agent_sessions.index.database import SessionDatabase
+
+        calls = []
+        monkeypatch.setattr(SessionDatabase, "get_annotations", lambda self, sid: calls.append(sid) or [])
+        panel = SessionDetailPanel()
+
+        panel._annotations("s1")
+        panel._annotations("s1")
+        assert calls == ["s1"]
+
+        panel.forget_annotations("s1")
+        panel._annotations("s1")
+        assert calls == ["s1", "s1"]
+
+    def test_rendered_text_reused_until_inputs_change(self, monkeypatch):
+        """Showing the same session twice reuses the rendered Text."""
+        panel = SessionDetailPanel()
+        shown = []
+        monkeypatch.setattr(panel, "update", shown.append)
+        annotations = []
+        monkeypatch.setattr(panel, "_annotations", lambda sid: annotations)
+        session = _session(content_hash="aaa")
+
+        panel.show_session(session, 1)
+        panel.show_session(session, 1)
+        assert shown[0] is shown[1]
+
+        panel.show_session(session, 2)
+        assert shown[2] is not shown[1]
+        assert "Sub-agents: 2" in shown[2].plain
+
+        panel.forget_session(session.id)
+        panel.show_session(session, 2)
+        assert shown[3] is not shown[2]
+
+
+class TestPagedListView:
+    @pytest.mark.asyncio
+    async def test_mounts_pages_on_demand(self):
+        """Only the first page is mounted; moving the cursor near the end mounts more."""
+        from textual.app import App
+        from textual.widgets import Label, ListItem
+
+        class ListApp(App):
+            def compose(self):
+                yield PagedListView(id="list")
+
+        app = ListApp()
+        async with app.run_test() as pilot:
+            lv = app.query_one(PagedListView)
+            lv.set_items(ListItem(Label(str(i))) for i in range(250))
+            await pilot.pause()
+            assert len(lv.children) == PagedListView.PAGE_SIZE
+
+            lv.index = PagedListView.PAGE_SIZE - 1
+            await pilot.pause()
+            assert len(lv.children) == 2 * PagedListView.PAGE_SIZE
+
+            lv.scroll_end(animate=False)
+            await pilot.pause()
+            assert len(lv.children) == 250
+            assert not lv.load_more()
+
+            # The replaced rows aren't detached yet but no longer count
+            lv.set_items(ListItem(Label(str(i))) for i in range(150))
+            assert lv.validate_index(200) == PagedListView.PAGE_SIZE - 1
+            lv.load_all()
+            await pilot.pause()
+            assert len(lv.children) == 150